@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+Parallel batch renderer for the scene x language x format matrix
+"""
+
+import argparse
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import multiprocessing
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from itertools import product
+
+from multi_output import encode_outputs, master_config, master_spec, output_spec
+from render_cache import DEFAULT_CACHE_DIR, RenderCache, render_key, scene_sources
+from render_checkpoint import Checkpoint
+
+os.environ['DISABLE_MANIM_PLUGINS'] = '1'
+
+
+SCENES = {
+    "ProducerConsumer": "producer_consumer_animation",
+    "NeuralProducerConsumer": "neural_producer_consumer",
+    "CPUClock": "cpu_clock_animation",
+    "ProducerConsumerRing": "producer_consumer_animation",
+    "ProducerConsumerLarge": "producer_consumer_animation",
+    "ProducerConsumerSimulated": "producer_consumer_animation",
+    "NeuralProducerConsumerLarge": "neural_producer_consumer",
+    "NeuralCapacityPlanning": "neural_producer_consumer",
+}
+
+# Scenes rendered when no --scenes are given, same as run_animation.sh
+DEFAULT_SCENES = ["ProducerConsumer", "NeuralProducerConsumer", "CPUClock"]
+
+LANGUAGES = ["en", "tr"]
+
+# Default frame rate per output format, same as run_animation.sh
+FORMATS = {
+    "mp4": 60,
+    "gif": 30,
+}
+
+QUALITIES = {
+    "low": "low_quality",
+    "medium": "medium_quality",
+    "high": "high_quality",
+    "production": "production_quality",
+    "4k": "fourk_quality",
+}
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """One cell of the render matrix"""
+    scene: str
+    language: str
+    format: str = "mp4"
+    quality: str = "high"
+    fps: int = None
+    seed: int = None
+    # Output specs such as "mp4:1080p60"; when set, one master movie is rendered and encoded to each
+    outputs: tuple = ()
+    # "shapes", "text" or "captioned" to render one layer instead of the full scene, or "captions"
+    # to only record subtitle tracks
+    layer: str = None
+
+    @property
+    def output_name(self):
+        if self.layer == "shapes":
+            return f"{self.scene}_shapes"
+        if self.layer:
+            return f"{self.scene}_{self.language}_{self.layer}"
+        return f"{self.scene}_{self.language}"
+
+    @property
+    def job_id(self):
+        fmt = "multi" if self.outputs else self.format
+        if self.layer:
+            fmt = "layer"
+        return f"{self.output_name}_{fmt}_{self.quality}"
+
+    @property
+    def frame_rate(self):
+        if self.outputs:
+            return master_spec(self.outputs).fps
+        return self.fps or FORMATS[self.format]
+
+
+@dataclass
+class RenderResult:
+    """Outcome of a single render job"""
+    job: RenderJob
+    output: str = None
+    seconds: float = 0.0
+    error: str = None
+    cache_key: str = None
+    cached: bool = False
+    encoded: list = None
+    # Shapes digest of a layer render, see layer_compositing.LayerCamera
+    layout: str = None
+    # Finished by an earlier, interrupted run of the batch, see render_checkpoint.Checkpoint
+    resumed: bool = False
+
+
+def build_jobs(scenes=None, languages=None, formats=None, quality="high", fps=None, seed=None, outputs=None):
+    """Expand the scene x language x format matrix into render jobs.
+
+    With outputs, formats is ignored: each scene x language is rendered once and encoded to every
+    output spec.
+    """
+    if outputs:
+        return [
+            RenderJob(scene, language, "mp4", quality, None, seed, tuple(outputs))
+            for scene, language in product(scenes or DEFAULT_SCENES, languages or LANGUAGES)
+        ]
+    return [
+        RenderJob(scene, language, fmt, quality, fps, seed)
+        for scene, language, fmt in product(
+            scenes or DEFAULT_SCENES,
+            languages or LANGUAGES,
+            formats or ["mp4"],
+        )
+    ]
+
+
+def load_scene_class(name):
+    """Import the module that defines a scene and return the scene class"""
+    return getattr(importlib.import_module(SCENES[name]), name)
+
+
+@functools.lru_cache(maxsize=None)
+def scene_source_key(name):
+    """Hash of a scene's sources and the manim version, read once per batch"""
+    import manim
+
+    payload = {"sources": scene_sources(load_scene_class(name)), "manim": manim.__version__}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def job_key(job):
+    """Checkpoint key of a job: its fields and its scene's sources.
+
+    This is the part of render_key known before the scene is constructed, which the main process
+    does not do; the translations are in the sources and the output config follows from the fields.
+    """
+    payload = {"job": asdict(job), "scene": scene_source_key(job.scene)}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def accepts_seed(scene_class):
+    """Whether scene_class takes a seed, itself or through **kwargs it passes on to a base class"""
+    for klass in inspect.getmro(scene_class):
+        if "__init__" not in vars(klass):
+            continue
+        parameters = inspect.signature(klass.__init__).parameters
+        if "seed" in parameters:
+            return True
+        if not any(parameter.kind is parameter.VAR_KEYWORD for parameter in parameters.values()):
+            return False
+    return False
+
+
+def create_scene(scene_class, job):
+    """Instantiate a scene for a job, passing the seed to scenes that take one"""
+    kwargs = {"language": job.language}
+    if job.seed is not None and accepts_seed(scene_class):
+        kwargs["seed"] = job.seed
+    return scene_class(**kwargs)
+
+
+def scene_output_path(scene):
+    """Return the file a rendered scene was written to"""
+    file_writer = scene.renderer.file_writer
+    if getattr(file_writer, "gif_file_path", None):
+        return str(file_writer.gif_file_path)
+    return str(file_writer.movie_file_path)
+
+
+def job_config(job, media_root):
+    """Manim config overrides for a job, with its own media directory"""
+    overrides = {
+        "quality": QUALITIES[job.quality],
+        "frame_rate": job.frame_rate,
+        "format": job.format,
+        "media_dir": os.path.join(media_root, job.job_id),
+        "output_file": job.output_name,
+        "preview": False,
+        "write_to_movie": True,
+    }
+    if job.outputs:
+        # Applied after "quality", so the master resolution wins over the preset's
+        overrides.update(master_config(job.outputs))
+    if job.layer == "captions":
+        # Only the timeline is needed; applied after "write_to_movie" so no movie is written
+        overrides["dry_run"] = True
+    elif job.layer:
+        from layer_compositing import layer_config
+        overrides.update(layer_config(job.layer))
+    return overrides
+
+
+def layout_path(output):
+    """Sidecar file holding the shapes digest of a layer render, so cached layers can be checked too"""
+    return f"{output}.layout"
+
+
+def layer_sidecars(job, output):
+    """Files a layer render writes next to its output; a cached output without them is re-rendered"""
+    from subtitles import track_paths
+
+    if job.layer in ("shapes", "text"):
+        return [layout_path(output)]
+    if job.layer in ("captioned", "captions"):
+        return list(track_paths(os.path.splitext(output)[0]))
+    return []
+
+
+def prepare_layer(scene, job):
+    from layer_compositing import LAYERS, use_layer
+    from subtitles import CAPTIONS, record_captions
+
+    if job.layer in LAYERS:
+        use_layer(scene, job.layer)
+    if job.layer in ("captioned", CAPTIONS):
+        record_captions(scene, skip_frames=job.layer == CAPTIONS)
+
+
+def finish_layer(scene, job, media_root):
+    """Write a layer render's sidecars and return its output path"""
+    from subtitles import write_tracks
+
+    if job.layer == "captions":
+        return write_tracks(scene.caption_cues, os.path.join(media_root, job.job_id, job.output_name))[0]
+    output = scene_output_path(scene)
+    if job.layer == "captioned":
+        write_tracks(scene.caption_cues, os.path.splitext(output)[0])
+    else:
+        with open(layout_path(output), "w") as f:
+            f.write(scene.renderer.camera.layout_digest())
+    return output
+
+
+def render_job(job, media_root, cache_dir=None):
+    """Render one job, or return the cached output; runs inside a worker process"""
+    from manim import config, tempconfig
+
+    start = time.perf_counter()
+    try:
+        scene_class = load_scene_class(job.scene)
+        with tempconfig(job_config(job, media_root)):
+            scene = create_scene(scene_class, job)
+            if job.layer:
+                prepare_layer(scene, job)
+            key = render_key(scene, config) if cache_dir else None
+            cached_output = RenderCache(cache_dir).lookup(key) if key else None
+            if cached_output and not all(os.path.exists(path) for path in layer_sidecars(job, cached_output)):
+                cached_output = None
+            if cached_output:
+                output = cached_output
+            else:
+                scene.render()
+                output = finish_layer(scene, job, media_root) if job.layer else scene_output_path(scene)
+        encoded = None
+        if job.outputs and not job.layer:
+            encoded = encode_outputs(output, job.outputs, os.path.join(media_root, job.job_id), job.output_name)
+        layout = None
+        if job.layer in ("shapes", "text"):
+            with open(layout_path(output)) as f:
+                layout = f.read().strip()
+        return RenderResult(job, output, time.perf_counter() - start, cache_key=key,
+                            cached=bool(cached_output), encoded=encoded, layout=layout)
+    except Exception as e:
+        return RenderResult(job, seconds=time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+
+
+def resumed_result(job, checkpoint):
+    """The result an earlier run of the batch recorded for job, if its outputs are intact"""
+    entry = checkpoint.completed(job) if checkpoint else None
+    if entry is None:
+        return None
+    return RenderResult(job, entry["output"], encoded=entry["encoded"] or None, layout=entry["layout"],
+                        resumed=True)
+
+
+def render_all(jobs, workers=None, media_root="media/batch", cache_dir=DEFAULT_CACHE_DIR, checkpoint=None):
+    """Render jobs across a process pool and return results in job order.
+
+    With a checkpoint, jobs it marks finished are skipped and every job is marked as it finishes.
+    """
+    results = {}
+    for job in jobs:
+        result = resumed_result(job, checkpoint)
+        if result:
+            results[job] = result
+            print(f"[{len(results)}/{len(jobs)}] {job.job_id} resumed")
+    pending = [job for job in jobs if job not in results]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pending)))
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(render_job, job, media_root, cache_dir): job for job in pending}
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.job] = result
+            if checkpoint:
+                checkpoint.mark(result)
+            status = "FAILED" if result.error else ("cached" if result.cached else "done")
+            print(f"[{len(results)}/{len(jobs)}] {result.job.job_id} {status} in {result.seconds:.1f}s")
+
+    results = [results[job] for job in jobs]
+    if cache_dir:
+        # Workers only read the index; all writes happen here to avoid races
+        cache = RenderCache(cache_dir)
+        for result in results:
+            if result.cache_key and not result.error and not result.cached and not result.resumed:
+                cache.store(result.cache_key, result.output, result.job.job_id)
+        cache.touch([r.cache_key for r in results if r.cached])
+    return results
+
+
+def layer_job(job, layer):
+    """The job rendering one layer of job, always as an mp4 master"""
+    return RenderJob(job.scene, job.language, "mp4", job.quality, job.frame_rate, job.seed, job.outputs, layer)
+
+
+def layer_setting(job):
+    """Jobs with the same setting differ only in language and can share a language-neutral layer"""
+    return job.scene, job.quality, job.frame_rate, job.seed, job.outputs
+
+
+def render_composited(jobs, workers=None, media_root="media/batch", cache_dir=DEFAULT_CACHE_DIR, checkpoint=None):
+    """Render jobs as one shapes layer per scene plus one text layer per language, then composite.
+
+    Every layer renders in the same process pool. A language whose text pass saw the shapes in other
+    places than the shapes pass (a label moved a shape) is rendered in full instead.
+
+    The composite always draws text above shapes, whatever order the scene added them in, so only
+    scenes that never draw a shape over their text should be rendered this way.
+    """
+    from layer_compositing import SHAPES, TEXT, composite
+    from manim.constants import QUALITIES as MANIM_QUALITIES
+
+    results = {}
+    for job in jobs:
+        result = resumed_result(job, checkpoint)
+        if result:
+            results[job] = result
+    pending = [job for job in jobs if job not in results]
+
+    # One shapes layer per scene setting, rendered with the first language asked for
+    shapes_jobs = {}
+    for job in pending:
+        shapes_jobs.setdefault(layer_setting(job), layer_job(job, SHAPES))
+    text_jobs = {job: layer_job(job, TEXT) for job in pending}
+    layer_jobs = list(dict.fromkeys([*shapes_jobs.values(), *text_jobs.values()]))
+    layers = {result.job: result for result in render_all(layer_jobs, workers, media_root, cache_dir, checkpoint)}
+
+    fallback = []
+    for job in pending:
+        shapes = layers[shapes_jobs[layer_setting(job)]]
+        text = layers[text_jobs[job]]
+        failed = shapes.error or text.error
+        if failed or shapes.layout != text.layout:
+            print(f"{job.job_id}: {'layer render failed' if failed else 'labels move shapes'}, rendering in full")
+            fallback.append(job)
+            continue
+
+        start = time.perf_counter()
+        output_dir = os.path.join(media_root, job.job_id)
+        os.makedirs(output_dir, exist_ok=True)
+        try:
+            output = composite(shapes.output, text.output, os.path.join(output_dir, f"{job.output_name}.mp4"))
+            encoded = None
+            if job.outputs:
+                encoded = encode_outputs(output, job.outputs, output_dir, job.output_name)
+            elif job.format == "gif":
+                height = MANIM_QUALITIES[QUALITIES[job.quality]]["pixel_height"]
+                output = encode_outputs(output, [f"gif:{height}p{job.frame_rate}"], output_dir, job.output_name)[0]
+            results[job] = RenderResult(job, output, time.perf_counter() - start, encoded=encoded,
+                                        cached=shapes.cached and text.cached)
+        except Exception as e:
+            results[job] = RenderResult(job, seconds=time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+        if checkpoint:
+            checkpoint.mark(results[job])
+
+    if fallback:
+        results.update(
+            (result.job, result) for result in render_all(fallback, workers, media_root, cache_dir, checkpoint)
+        )
+    return [results[job] for job in jobs]
+
+
+def subtitled_job(group):
+    """The job of the one video that carries a subtitle stream per language of group"""
+    first = group[0]
+    return RenderJob(first.scene, "-".join(member.language for member in group), "mp4", first.quality,
+                     first.frame_rate, first.seed, first.outputs)
+
+
+def render_subtitled(jobs, workers=None, media_root="media/batch", cache_dir=DEFAULT_CACHE_DIR, checkpoint=None):
+    """Render each scene once without its translated text and mux one subtitle stream per language.
+
+    The first language's run renders the video and records its captions; every other language only
+    replays the timeline with frame drawing skipped to record its own. Returns one result per scene,
+    whose job language lists the subtitle languages.
+    """
+    from layer_compositing import CAPTIONED
+    from subtitles import CAPTIONS, mux_subtitles, track_paths
+
+    groups = {}
+    for job in jobs:
+        groups.setdefault(layer_setting(job), []).append(job)
+    results = {setting: resumed_result(subtitled_job(group), checkpoint) for setting, group in groups.items()}
+    pending = {setting: group for setting, group in groups.items() if not results[setting]}
+    video_jobs = {setting: layer_job(group[0], CAPTIONED) for setting, group in pending.items()}
+    caption_jobs = {job: layer_job(job, CAPTIONS) for group in pending.values() for job in group[1:]}
+    layers = {
+        result.job: result
+        for result in render_all([*video_jobs.values(), *caption_jobs.values()], workers, media_root, cache_dir,
+                                 checkpoint)
+    }
+
+    for setting, group in pending.items():
+        first = group[0]
+        job = subtitled_job(group)
+        video = layers[video_jobs[setting]]
+        track_results = [video] + [layers[caption_jobs[job]] for job in group[1:]]
+        errors = [result.error for result in track_results if result.error]
+        if errors:
+            results[setting] = RenderResult(job, error=errors[0])
+            continue
+
+        start = time.perf_counter()
+        output_dir = os.path.join(media_root, job.job_id)
+        os.makedirs(output_dir, exist_ok=True)
+        try:
+            tracks = [
+                (member.language, track_paths(os.path.splitext(result.output)[0]))
+                for member, result in zip(group, track_results)
+            ]
+            output = mux_subtitles(video.output, [(language, srt) for language, (_, srt) in tracks],
+                                   os.path.join(output_dir, f"{job.output_name}.mp4"))
+            # Positioned WebVTT next to the movie, for players that load sidecar tracks
+            encoded = []
+            for language, (vtt, _) in tracks:
+                encoded.append(shutil.copyfile(vtt, os.path.join(output_dir, f"{first.scene}.{language}.vtt")))
+            if job.outputs:
+                encoded += encode_outputs(output, job.outputs, output_dir, job.output_name)
+            results[setting] = RenderResult(job, output, time.perf_counter() - start, encoded=encoded,
+                                            cached=all(result.cached for result in track_results))
+        except Exception as e:
+            results[setting] = RenderResult(job, seconds=time.perf_counter() - start,
+                                            error=f"{type(e).__name__}: {e}")
+        if checkpoint:
+            checkpoint.mark(results[setting])
+    return list(results.values())
+
+
+def print_summary(results, wall_time):
+    """Print wall time per job and the overall batch time"""
+    width = max(len(r.job.job_id) for r in results)
+    print("\nRender summary:")
+    for result in results:
+        outcome = result.error or result.output
+        cached = " (cached)" if result.cached else (" (resumed)" if result.resumed else "")
+        print(f"  {result.job.job_id:<{width}}  {result.seconds:8.1f}s  {outcome}{cached}")
+        for path in result.encoded or []:
+            print(f"  {'':<{width}}  {'':>9}  -> {path}")
+
+    busy = sum(r.seconds for r in results)
+    failed = sum(1 for r in results if r.error)
+    cached = sum(1 for r in results if r.cached)
+    resumed = sum(1 for r in results if r.resumed)
+    print(f"\nJobs: {len(results)} ({cached} cached, {resumed} resumed, {failed} failed)")
+    print(f"Total job time: {busy:.1f}s, wall time: {wall_time:.1f}s")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--scenes", nargs="+", choices=list(SCENES), default=DEFAULT_SCENES)
+    parser.add_argument("--languages", nargs="+", choices=LANGUAGES, default=LANGUAGES)
+    parser.add_argument("--formats", nargs="+", choices=list(FORMATS), default=["mp4"])
+    parser.add_argument("--quality", choices=list(QUALITIES), default="high")
+    parser.add_argument("--outputs", nargs="+", default=None, metavar="SPEC",
+                        type=output_spec,
+                        help="Render each scene once and encode it to every spec, e.g. mp4:1080p60 gif:720p30 "
+                             "(replaces --formats/--fps)")
+    # Each of these replaces the whole render pipeline, so at most one applies
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--composite", action="store_true",
+                      help="Render the shapes of each scene once and overlay a text layer per language")
+    mode.add_argument("--subtitles", action="store_true",
+                      help="Render each scene once without translated text and mux every language "
+                           "in as a subtitle stream (mp4 only)")
+    mode.add_argument("--segments", type=int, default=None,
+                      help="Split each scene at its sections into this many segments rendered in parallel")
+    mode.add_argument("--incremental", action="store_true",
+                      help="Cache every scene section and re-render only those whose code or starting state "
+                           "changed")
+    parser.add_argument("--fps", type=int, default=None,
+                        help="Override the per-format frame rate (mp4: 60, gif: 30)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="RNG seed for scenes with random data, so reruns hit manim's partial movie cache")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Number of render processes (default: CPU count)")
+    parser.add_argument("--media-dir", default="media/batch",
+                        help="Root directory for per-job media directories")
+    parser.add_argument("--restart", action="store_true",
+                        help="Ignore the manifest of an interrupted batch and render every job again")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="Render cache index directory")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always re-render, ignoring the render cache")
+    parser.add_argument("--cache-max-gb", type=float, default=None,
+                        help="Evict least recently used outputs above this total size")
+    parser.add_argument("--cache-max-age-days", type=float, default=None,
+                        help="Evict outputs not used for this many days")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    jobs = build_jobs(args.scenes, args.languages, args.formats, args.quality, args.fps, args.seed, args.outputs)
+
+    print(f"Rendering {len(jobs)} jobs with {min(args.workers, len(jobs))} workers...")
+    start = time.perf_counter()
+    cache_dir = None if args.no_cache else args.cache_dir
+    checkpoint = Checkpoint(args.media_dir, key=job_key)
+    if args.restart and os.path.exists(checkpoint.path):
+        os.remove(checkpoint.path)
+    checkpoint.begin(jobs)
+    if args.incremental:
+        from segment_render import render_incremental
+        results = render_incremental(jobs, args.workers, args.media_dir, cache_dir, checkpoint)
+    elif args.segments:
+        from segment_render import render_segmented
+        results = render_segmented(jobs, args.segments, args.workers, args.media_dir, checkpoint)
+    elif args.subtitles:
+        results = render_subtitled(jobs, args.workers, args.media_dir, cache_dir, checkpoint)
+    elif args.composite:
+        results = render_composited(jobs, args.workers, args.media_dir, cache_dir, checkpoint)
+    else:
+        results = render_all(jobs, args.workers, args.media_dir, cache_dir, checkpoint)
+    checkpoint.finish(results)
+    print_summary(results, time.perf_counter() - start)
+
+    if cache_dir and (args.cache_max_gb is not None or args.cache_max_age_days is not None):
+        max_bytes = None if args.cache_max_gb is None else int(args.cache_max_gb * 1024 ** 3)
+        evicted = RenderCache(cache_dir).evict(max_bytes, args.cache_max_age_days)
+        print(f"Evicted {len(evicted)} cached renders")
+
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
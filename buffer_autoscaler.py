@@ -0,0 +1,68 @@
+"""
+Threshold autoscaling policy for the neural producer-consumer buffer layer
+"""
+
+from collections import deque, namedtuple
+
+
+CycleLoad = namedtuple("CycleLoad", "buffers arrived dropped occupancy slots")
+
+
+class BufferAutoscaler:
+    """Grow the buffer layer while packets are being dropped and shrink it while it sits idle.
+
+    Each decision looks at the last window cycles. The layer grows by step when the drop rate reaches
+    scale_up_drop_rate. It shrinks by step when nothing was dropped and mean occupancy is at or below
+    scale_down_occupancy. After any change the policy waits cooldown cycles before acting again, so
+    one burst does not resize the layer several times.
+    """
+
+    def __init__(self, min_buffers=1, max_buffers=8, scale_up_drop_rate=0.25, scale_down_occupancy=0.2,
+                 window=2, cooldown=2, step=1):
+        self.min_buffers = min_buffers
+        self.max_buffers = max_buffers
+        self.scale_up_drop_rate = scale_up_drop_rate
+        self.scale_down_occupancy = scale_down_occupancy
+        self.step = step
+        self.cooldown = cooldown
+        self.recent = deque(maxlen=window)
+        self.history = []
+        self.quiet_cycles = cooldown
+
+    def fresh(self):
+        """A new autoscaler with the same settings and no observed cycles"""
+        return type(self)(self.min_buffers, self.max_buffers, self.scale_up_drop_rate, self.scale_down_occupancy,
+                          self.recent.maxlen, self.cooldown, self.step)
+
+    def observe(self, buffers, arrived, dropped, occupancy, slots):
+        """Record one cycle: packets that arrived and were dropped, and occupied/total slots at its end"""
+        load = CycleLoad(buffers, arrived, dropped, occupancy, slots)
+        self.recent.append(load)
+        self.history.append(load)
+        self.quiet_cycles += 1
+
+    def drop_rate(self):
+        arrived = sum(load.arrived for load in self.recent)
+        return sum(load.dropped for load in self.recent) / arrived if arrived else 0.0
+
+    def occupancy(self):
+        if not self.recent:
+            return 0.0
+        return sum(load.occupancy / load.slots for load in self.recent if load.slots) / len(self.recent)
+
+    def target(self, buffers):
+        """Buffer count the layer should have next"""
+        if self.quiet_cycles < self.cooldown or len(self.recent) < self.recent.maxlen:
+            return buffers
+
+        if self.drop_rate() >= self.scale_up_drop_rate:
+            target = min(buffers + self.step, self.max_buffers)
+        elif self.drop_rate() == 0 and self.occupancy() <= self.scale_down_occupancy:
+            target = max(buffers - self.step, self.min_buffers)
+        else:
+            target = buffers
+
+        if target != buffers:
+            self.quiet_cycles = 0
+            self.recent.clear()
+        return target
@@ -0,0 +1,145 @@
+"""
+Indexed buffer occupancy for the neural producer-consumer scheduler
+"""
+
+from collections import deque
+
+
+class IndexedSet:
+    """Set with O(1) add, discard and uniform random choice"""
+
+    def __init__(self, items=()):
+        self.items = []
+        self.positions = {}
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.positions
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def add(self, item):
+        if item not in self.positions:
+            self.positions[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item):
+        position = self.positions.pop(item, None)
+        if position is None:
+            return
+        last = self.items.pop()
+        if position < len(self.items):
+            self.items[position] = last
+            self.positions[last] = position
+
+    def choice(self, rng):
+        return self.items[rng.randrange(len(self.items))]
+
+
+class BufferPool:
+    """Per-buffer FIFO deques of packets plus indexes of buffers with free slots and with packets.
+
+    take() removes a packet straight away but keeps its slot reserved until release(), so a cycle can
+    pick its consumers before its producers without the producers reusing those slots.
+    """
+
+    def __init__(self, num_buffers, capacity):
+        self.capacity = capacity
+        self.queues = []
+        self.reserved = []
+        self.free = IndexedSet()
+        self.occupied = IndexedSet()
+        self.total = 0
+        for _ in range(num_buffers):
+            self.add_buffer()
+
+    def __len__(self):
+        return len(self.queues)
+
+    def add_buffer(self):
+        """Append an empty buffer and return its index"""
+        index = len(self.queues)
+        self.queues.append(deque())
+        self.reserved.append(0)
+        self.free.add(index)
+        return index
+
+    def remove_buffer(self):
+        """Remove the last buffer that holds no packets and return its old index, or None.
+
+        Buffers after it shift down by one, so the free and occupied indexes are rebuilt; resizing
+        is rare next to put/take.
+        """
+        for index in range(len(self.queues) - 1, -1, -1):
+            if self.count(index) == 0:
+                break
+        else:
+            return None
+
+        del self.queues[index]
+        del self.reserved[index]
+        self.free = IndexedSet()
+        self.occupied = IndexedSet()
+        for remaining in range(len(self.queues)):
+            self._reindex(remaining)
+        return index
+
+    def count(self, index):
+        """Slots in use, counting packets taken but not yet released"""
+        return len(self.queues[index]) + self.reserved[index]
+
+    def _reindex(self, index):
+        if self.count(index) < self.capacity:
+            self.free.add(index)
+        else:
+            self.free.discard(index)
+        if self.queues[index]:
+            self.occupied.add(index)
+        else:
+            self.occupied.discard(index)
+
+    def put(self, rng, packet):
+        """Store packet in a random buffer with a free slot; None when every buffer is full"""
+        if not self.free:
+            return None
+        index = self.free.choice(rng)
+        self.queues[index].append(packet)
+        self.total += 1
+        self._reindex(index)
+        return index
+
+    def take(self, rng):
+        """Remove the oldest packet of a random non-empty buffer; returns (index, packet) or None"""
+        if not self.occupied:
+            return None
+        index = self.occupied.choice(rng)
+        packet = self.queues[index].popleft()
+        self.reserved[index] += 1
+        self.total -= 1
+        self._reindex(index)
+        return index, packet
+
+    def replace_oldest(self, rng, packet):
+        """Evict the oldest packet of a random non-empty buffer in favour of packet.
+
+        Returns (index, evicted packet), or None when no buffer holds a packet to evict.
+        """
+        if not self.occupied:
+            return None
+        index = self.occupied.choice(rng)
+        evicted = self.queues[index].popleft()
+        self.queues[index].append(packet)
+        return index, evicted
+
+    def release(self, index):
+        """Free the slot of a packet returned by take()"""
+        self.reserved[index] -= 1
+        self._reindex(index)
+
+    def packets(self):
+        return [packet for queue in self.queues for packet in queue]
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo capacity-planning sweep for the neural producer-consumer buffer layer
+"""
+
+import argparse
+import itertools
+import time
+from collections import namedtuple
+
+import numpy as np
+
+
+SweepResult = namedtuple(
+    "SweepResult",
+    "produce_rates consume_rates buffer_counts capacities drop_rate utilization throughput"
+)
+
+
+def sweep(produce_rates=(0.5, 0.75, 1.0), consume_rates=(1.0,), buffer_counts=range(1, 9),
+          capacities=(1, 2, 4), producers=4, consumers=3, cycles=2000, seeds=64, seed=0):
+    """Simulate every configuration of the grid for cycles steps and seeds replicas at once.
+
+    Each cycle follows the scene: every producer emits Poisson(produce_rate) packets and every
+    consumer can take Poisson(consume_rate) packets. Consumers pick from the packets present at the
+    start of the cycle, and the slots they empty only free up after the cycle's arrivals are placed.
+    The buffer layer pools buffers * capacity slots, since packets go to any buffer with room. Packets
+    that find no free slot are dropped.
+
+    All (configuration, replica) pairs advance together as one array, so the cost is cycles
+    vectorized steps. Returns a SweepResult whose metric arrays are shaped
+    (produce_rates, consume_rates, buffer_counts, capacities) and averaged over replicas.
+    """
+    axes = [np.asarray(list(values), dtype=float)
+            for values in (produce_rates, consume_rates, buffer_counts, capacities)]
+    grid = np.array(list(itertools.product(*axes)))
+    arrival_mean = (grid[:, 0] * producers)[:, None]
+    service_mean = (grid[:, 1] * consumers)[:, None]
+    slots = (grid[:, 2] * grid[:, 3])[:, None]
+
+    rng = np.random.default_rng(seed)
+    shape = (len(grid), seeds)
+    occupancy = np.zeros(shape)
+    arrived = np.zeros(shape)
+    dropped = np.zeros(shape)
+    served = np.zeros(shape)
+    occupancy_sum = np.zeros(shape)
+
+    for _ in range(cycles):
+        arrivals = rng.poisson(arrival_mean, shape)
+        served_now = np.minimum(occupancy, rng.poisson(service_mean, shape))
+        accepted = np.minimum(arrivals, slots - occupancy)
+        occupancy += accepted - served_now
+
+        arrived += arrivals
+        dropped += arrivals - accepted
+        served += served_now
+        occupancy_sum += occupancy
+
+    grid_shape = tuple(len(values) for values in axes)
+    drop_rate = np.divide(dropped, arrived, out=np.zeros(shape), where=arrived > 0)
+    return SweepResult(
+        *axes,
+        drop_rate=drop_rate.mean(axis=1).reshape(grid_shape),
+        utilization=(occupancy_sum / (cycles * slots)).mean(axis=1).reshape(grid_shape),
+        throughput=(served / cycles).mean(axis=1).reshape(grid_shape),
+    )
+
+
+def smallest_layer(result, max_drop_rate):
+    """Fewest buffer slots meeting max_drop_rate, per (produce_rate, consume_rate); None if unmet"""
+    slots = result.buffer_counts[:, None] * result.capacities[None, :]
+    plans = {}
+    for i, j in np.ndindex(len(result.produce_rates), len(result.consume_rates)):
+        ok = result.drop_rate[i, j] <= max_drop_rate
+        plans[(result.produce_rates[i], result.consume_rates[j])] = (
+            None if not ok.any() else
+            tuple(int(v) for v in np.argwhere(ok & (slots == slots[ok].min()))[0])
+        )
+    return plans
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--produce-rates", type=float, nargs="+", default=[0.5, 0.75, 1.0],
+                        help="Packets per cycle per producer")
+    parser.add_argument("--consume-rates", type=float, nargs="+", default=[1.0],
+                        help="Packets per cycle per consumer")
+    parser.add_argument("--buffers", type=int, nargs="+", default=list(range(1, 9)))
+    parser.add_argument("--capacities", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--consumers", type=int, default=3)
+    parser.add_argument("--cycles", type=int, default=2000)
+    parser.add_argument("--seeds", type=int, default=64, help="Replicas per configuration")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-drop-rate", type=float, default=0.01)
+    parser.add_argument("--output", help="Save the result arrays to this .npz file")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    result = sweep(args.produce_rates, args.consume_rates, args.buffers, args.capacities,
+                   args.producers, args.consumers, args.cycles, args.seeds, args.seed)
+    elapsed = time.perf_counter() - started
+    configurations = result.drop_rate.size
+    print(f"Swept {configurations} configurations x {args.seeds} seeds x {args.cycles} cycles "
+          f"in {elapsed:.2f}s")
+
+    for i, produce_rate in enumerate(result.produce_rates):
+        for j, consume_rate in enumerate(result.consume_rates):
+            print(f"\nproduce {produce_rate:g}/cycle x {args.producers}, "
+                  f"consume {consume_rate:g}/cycle x {args.consumers}")
+            print("buffers " + "".join(f"  cap {int(c):<3} drop/util" for c in result.capacities))
+            for b, buffers in enumerate(result.buffer_counts):
+                row = "".join(
+                    f"  {result.drop_rate[i, j, b, c]:8.2%}/{result.utilization[i, j, b, c]:5.0%}"
+                    for c in range(len(result.capacities))
+                )
+                print(f"{int(buffers):>7}{row}")
+
+    print(f"\nSmallest layer with drop rate <= {args.max_drop_rate:.2%}:")
+    for (produce_rate, consume_rate), plan in smallest_layer(result, args.max_drop_rate).items():
+        if plan is None:
+            print(f"  produce {produce_rate:g}, consume {consume_rate:g}: not reached in the grid")
+        else:
+            b, c = plan
+            print(f"  produce {produce_rate:g}, consume {consume_rate:g}: "
+                  f"{int(result.buffer_counts[b])} buffers x capacity {int(result.capacities[c])}")
+
+    if args.output:
+        np.savez(args.output, **result._asdict())
+        print(f"\nSaved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
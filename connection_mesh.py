@@ -0,0 +1,152 @@
+"""
+Vectorized connection meshes for layered (neural-network style) topologies
+"""
+
+import numpy as np
+from manim import GRAY, VGroup, VMobject
+
+
+# Cubic Bezier parameters of a straight segment: anchor, two handles, anchor
+_LINE_T = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+
+
+def layer_positions(count, x, spacing=1.0, max_height=4.0, y=0.0):
+    """Centres of count nodes stacked vertically around y at horizontal position x"""
+    if count > 1:
+        spacing = min(spacing, max_height / (count - 1))
+    offsets = ((count - 1) / 2 - np.arange(count)) * spacing
+    positions = np.zeros((count, 3))
+    positions[:, 0] = x
+    positions[:, 1] = y + offsets
+    return positions
+
+
+def bipartite_edges(sources, targets):
+    """Start and end points of every source -> target edge, source-major"""
+    sources = np.asarray(sources, dtype=float)
+    targets = np.asarray(targets, dtype=float)
+    starts = np.repeat(sources, len(targets), axis=0)
+    ends = np.tile(targets, (len(sources), 1))
+    return starts, ends
+
+
+class ConnectionMesh(VGroup):
+    """Every edge of a topology as one set of NumPy arrays.
+
+    Edge geometry is computed in a single vectorized step. Per-edge stroke opacity and width live in
+    arrays; edges with the same quantized style are packed into one VMobject of disjoint subpaths,
+    so a mesh of any size is drawn as at most a few dozen mobjects. Geometry lives in the arrays, so
+    move the mesh with set_edges rather than shift/move_to.
+
+    A per-edge traffic counter can be accumulated with record_traffic and turned into stroke width
+    and opacity for every edge at once with show_traffic.
+    """
+
+    def __init__(self, starts, ends, color=GRAY, stroke_width=1, stroke_opacity=0.3,
+                 opacity_levels=21, width_step=0.25, **kwargs):
+        super().__init__(**kwargs)
+        self.edge_color = color
+        self.opacity_levels = opacity_levels
+        self.width_step = width_step
+        self.layer_sizes = None
+        self.set_edges(starts, ends, stroke_width, stroke_opacity)
+
+    @classmethod
+    def layered(cls, layers, **kwargs):
+        """Fully connect each layer of node centres to the next one"""
+        starts, ends = zip(*[bipartite_edges(a, b) for a, b in zip(layers, layers[1:])])
+        mesh = cls(np.concatenate(starts), np.concatenate(ends), **kwargs)
+        mesh.layer_sizes = [len(layer) for layer in layers]
+        return mesh
+
+    @property
+    def num_edges(self):
+        return len(self.starts)
+
+    def set_edges(self, starts, ends, stroke_width=None, stroke_opacity=None):
+        """Replace the edge geometry, keeping per-edge style when the edge count is unchanged"""
+        starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+        count = len(starts)
+        if stroke_width is not None or len(getattr(self, "widths", ())) != count:
+            width = stroke_width if stroke_width is not None else self.widths.mean()
+            self.widths = np.full(count, float(width))
+        if stroke_opacity is not None or len(getattr(self, "opacities", ())) != count:
+            opacity = stroke_opacity if stroke_opacity is not None else self.opacities.mean()
+            self.opacities = np.full(count, float(opacity))
+        if len(getattr(self, "traffic", ())) != count:
+            self.traffic = np.zeros(count)
+        self.starts = starts
+        self.ends = ends
+        self.edge_points = (starts[:, None, :] + _LINE_T * (ends - starts)[:, None, :])
+        return self.rebuild()
+
+    def set_edge_opacities(self, opacities):
+        self.opacities = np.clip(np.broadcast_to(opacities, (self.num_edges,)).astype(float), 0, 1)
+        return self.rebuild()
+
+    def set_edge_widths(self, widths):
+        self.widths = np.maximum(np.broadcast_to(widths, (self.num_edges,)).astype(float), 0)
+        return self.rebuild()
+
+    def edge_indices(self, pair, sources, targets):
+        """Indices of the source -> target edges from layer pair to layer pair + 1 of a layered mesh"""
+        sizes = self.layer_sizes
+        offset = sum(sizes[i] * sizes[i + 1] for i in range(pair))
+        return offset + np.asarray(sources, dtype=np.int64) * sizes[pair + 1] + np.asarray(targets, dtype=np.int64)
+
+    def record_traffic(self, indices, amount=1):
+        """Add amount to the traffic counter of every edge in indices; repeated indices accumulate"""
+        np.add.at(self.traffic, np.asarray(indices, dtype=np.int64), amount)
+        return self
+
+    def layer_traffic(self):
+        """Traffic counters of a layered mesh as one (sources, targets) matrix per layer pair"""
+        sizes = self.layer_sizes
+        bounds = np.cumsum([a * b for a, b in zip(sizes, sizes[1:])])[:-1]
+        return [
+            block.reshape(a, b)
+            for block, a, b in zip(np.split(self.traffic, bounds), sizes, sizes[1:])
+        ]
+
+    def set_layer_traffic(self, matrices):
+        self.traffic = np.concatenate([np.ravel(matrix) for matrix in matrices]).astype(float)
+        return self
+
+    def show_traffic(self, width_range=(1, 6), opacity_range=(0.3, 1.0)):
+        """Map traffic, relative to the busiest edge, onto stroke width and opacity in one pass"""
+        peak = self.traffic.max() if self.num_edges else 0
+        heat = self.traffic / peak if peak > 0 else np.zeros(self.num_edges)
+        self.widths = width_range[0] + heat * (width_range[1] - width_range[0])
+        self.opacities = opacity_range[0] + heat * (opacity_range[1] - opacity_range[0])
+        return self.rebuild()
+
+    def rebuild(self):
+        """Regroup edges into one VMobject per distinct (opacity, width) style"""
+        levels = self.opacity_levels - 1
+        opacity_keys = np.round(self.opacities * levels).astype(np.int64)
+        width_keys = np.round(self.widths / self.width_step).astype(np.int64)
+        keys = width_keys * (levels + 1) + opacity_keys
+
+        unique_keys, groups = np.unique(keys, return_inverse=True)
+        order = np.argsort(groups, kind="stable")
+        bounds = np.cumsum(np.bincount(groups, minlength=len(unique_keys)))[:-1]
+
+        submobjects = []
+        for key, edge_indices in zip(unique_keys, np.split(order, bounds)):
+            width_key, opacity_key = divmod(int(key), levels + 1)
+            opacity = opacity_key / levels
+            width = width_key * self.width_step
+            if opacity == 0 or width == 0 or len(edge_indices) == 0:
+                continue
+            group = VMobject(
+                stroke_color=self.edge_color,
+                stroke_width=width,
+                stroke_opacity=opacity,
+                fill_opacity=0,
+            )
+            group.set_points(self.edge_points[edge_indices].reshape(-1, 3))
+            submobjects.append(group)
+
+        self.submobjects = submobjects
+        return self
@@ -1,6 +1,11 @@
 from manim import *
 import numpy as np
 
+from layer_compositing import text_layer
+from numeric_readout import NumericReadout
+from scene_sections import section
+from static_background import cache_background
+
 
 class CPUClockBase:
     """Base class for CPU Clock animations with translation support"""
@@ -78,6 +83,23 @@ class CPUClockBase:
         return self.translations[self.lang][key]
 
 
+class AxesInverse:
+    """Cached affine inverse of an Axes' coords-to-point transform"""
+    
+    def __init__(self, axes):
+        self.origin = np.array(axes.c2p(0, 0))
+        self.x_unit = axes.c2p(1, 0)[0] - self.origin[0]
+        self.y_unit = axes.c2p(0, 1)[1] - self.origin[1]
+        
+    def x(self, point_x):
+        """Axis x value for a scene x coordinate"""
+        return (point_x - self.origin[0]) / self.x_unit
+        
+    def y(self, point_y):
+        """Axis y value for a scene y coordinate"""
+        return (point_y - self.origin[1]) / self.y_unit
+
+
 class CPUClock(CPUClockBase, MovingCameraScene):
     """CPU Clock animation with cinematic camera movements"""
     
@@ -86,11 +108,17 @@ class CPUClock(CPUClockBase, MovingCameraScene):
         MovingCameraScene.__init__(self)
         self.lang = language
         
+    def setup(self):
+        super().setup()
+        # The faded grid, axes and voltage lines stay put for most plays; draw them once per span
+        cache_background(self)
+        
     def construct(self):
         self.intro_sequence()
         
         self.main_clock_demo()
         
+    @section
     def intro_sequence(self):
         """Introduction with minimal camera movements"""
         grid = NumberPlane(
@@ -120,6 +148,7 @@ class CPUClock(CPUClockBase, MovingCameraScene):
             run_time=1.5
         )
         
+    @section
     def main_clock_demo(self):
         """Main clock signal demonstration"""
         
@@ -161,16 +190,17 @@ class CPUClock(CPUClockBase, MovingCameraScene):
         )
         voltage_icon.scale(1.2)
         
-        x_label = VGroup(
+        # The icons sit beside translated words, so they travel with the text layer
+        x_label = text_layer(VGroup(
             time_icon,
             Text(f"{self.t('time_axis')} ({self.t('time_unit')})", font_size=28)
-        ).arrange(RIGHT, buff=0.3)
+        ).arrange(RIGHT, buff=0.3))
         x_label.next_to(axes.x_axis, DOWN, buff=0.5)
         
-        y_label = VGroup(
+        y_label = text_layer(VGroup(
             voltage_icon,
             Text(self.t("voltage_axis"), font_size=28)
-        ).arrange(RIGHT, buff=0.3)
+        ).arrange(RIGHT, buff=0.3))
         y_label.rotate(PI/2)
         y_label.next_to(axes.y_axis, LEFT, buff=0.5)
         
@@ -201,6 +231,7 @@ class CPUClock(CPUClockBase, MovingCameraScene):
         
         self.demonstrate_edges(axes, clock_period, voltage_high, voltage_low)
         
+        self.next_section("outro")
         self.wait(2)
         self.play(
             FadeOut(self.info_bg),
@@ -250,6 +281,7 @@ class CPUClock(CPUClockBase, MovingCameraScene):
         
         return clock_signal
         
+    @section
     def add_voltage_indicators(self, axes, v_high, v_low):
         """Add animated voltage level indicators"""
         high_line = DashedLine(
@@ -294,6 +326,7 @@ class CPUClock(CPUClockBase, MovingCameraScene):
             run_time=1
         )
         
+    @section
     def create_tracker_system(self, axes, period, v_high, v_low, cycles):
         """Create an advanced tracking system with visual effects"""
         self.tracker_dot = Dot(radius=0.15, color=BLUE)
@@ -318,25 +351,31 @@ class CPUClock(CPUClockBase, MovingCameraScene):
             stroke_width=2
         ).to_corner(UR, buff=0.3)
         
-        self.time_display = always_redraw(lambda: VGroup(
+        inverse = AxesInverse(axes)
+        
+        time_readout = NumericReadout(
+            inverse.x(tracker_dot.get_x()),
+            suffix=f" {self.t('time_unit')}",
+            font_size=24,
+            font="monospace",
+            color=WHITE
+        )
+        self.time_display = VGroup(
             Text(self.t('current_time') + ":", font_size=20, color=BLUE_B),
-            Text(
-                f"{(tracker_dot.get_x() - axes.c2p(0, 0)[0]) / (axes.c2p(1, 0)[0] - axes.c2p(0, 0)[0]):.2f} {self.t('time_unit')}",
-                font_size=24,
-                font="monospace",
-                color=WHITE
-            )
-        ).arrange(RIGHT, buff=0.3).move_to(self.info_bg.get_center() + UP * 0.3))
-        
-        self.voltage_display = always_redraw(lambda: VGroup(
+            time_readout
+        ).arrange(RIGHT, buff=0.3).move_to(self.info_bg.get_center() + UP * 0.3)
+        
+        voltage_readout = NumericReadout(
+            inverse.y(tracker_dot.get_y()),
+            suffix="V",
+            font_size=24,
+            font="monospace",
+            color=WHITE
+        )
+        self.voltage_display = VGroup(
             Text(self.t('current_voltage') + ":", font_size=20, color=YELLOW),
-            Text(
-                f"{(tracker_dot.get_y() - axes.c2p(0, 0)[1]) * 3.3 / (axes.c2p(0, 3.3)[1] - axes.c2p(0, 0)[1]):.2f}V",
-                font_size=24,
-                font="monospace",
-                color=WHITE
-            )
-        ).arrange(RIGHT, buff=0.3).move_to(self.info_bg.get_center() + DOWN * 0.3))
+            voltage_readout
+        ).arrange(RIGHT, buff=0.3).move_to(self.info_bg.get_center() + DOWN * 0.3)
         
         self.play(
             FadeIn(self.info_bg),
@@ -346,6 +385,9 @@ class CPUClock(CPUClockBase, MovingCameraScene):
         )
         self.add(trail)
         
+        time_readout.add_updater(lambda m: m.set_value(inverse.x(tracker_dot.get_x())))
+        voltage_readout.add_updater(lambda m: m.set_value(inverse.y(tracker_dot.get_y())))
+        
         self.clock_time = 0
         
         def update_tracker(mob, dt):
@@ -373,9 +415,13 @@ class CPUClock(CPUClockBase, MovingCameraScene):
         
         self.wait(6)
         tracker_dot.remove_updater(update_tracker)
+        # The dot has stopped, so the readouts are static from here on and later waits can freeze
+        time_readout.clear_updaters()
+        voltage_readout.clear_updaters()
         
         self.play(FadeOut(trail))
         
+    @section
     def show_period_frequency(self, axes, period):
         """Show period and frequency with visual emphasis"""
         
@@ -434,6 +480,7 @@ class CPUClock(CPUClockBase, MovingCameraScene):
             run_time=0.5
         )
         
+    @section
     def demonstrate_edges(self, axes, period, v_high, v_low):
         """Demonstrate rising and falling edges"""
         focus_rect = Rectangle(
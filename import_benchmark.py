@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the scene modules, each measured in a fresh interpreter
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from batch_render import SCENES
+
+
+# Runs in the child interpreter: time manim on its own, then the scene module on top of it, and
+# report any manim config value the scene module changed while importing.
+PROBE = """
+import importlib, json, sys, time
+started = time.perf_counter()
+from manim import config
+manim_done = time.perf_counter()
+before = {key: repr(config[key]) for key in config}
+importlib.import_module(sys.argv[1])
+module_done = time.perf_counter()
+changed = sorted(key for key in config if repr(config[key]) != before.get(key))
+print(json.dumps({
+    "manim": manim_done - started,
+    "module": module_done - manim_done,
+    "config_changes": changed,
+    "manim_ml_loaded": "manim_ml" in sys.modules,
+}))
+"""
+
+
+def measure(module, python=sys.executable):
+    """One cold import of module in a fresh interpreter"""
+    env = dict(os.environ, DISABLE_MANIM_PLUGINS="1")
+    result = subprocess.run(
+        [python, "-c", PROBE, module],
+        capture_output=True, text=True, env=env, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(module, count=10, python=sys.executable):
+    """Top self-time entries from -X importtime for importing module, as (microseconds, name)"""
+    env = dict(os.environ, DISABLE_MANIM_PLUGINS="1")
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        entries.append((int(self_us), name.strip()))
+    return sorted(entries, reverse=True)[:count]
+
+
+def main(argv=None):
+    modules = sorted(set(SCENES.values()))
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--modules", nargs="+", default=modules)
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument("--top", type=int, default=0,
+                        help="Also list the N slowest imports (self time) for each module")
+    args = parser.parse_args(argv)
+
+    print(f"{'module':<32}{'manim':>10}{'module':>10}  notes")
+    failed = False
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        manim_time = statistics.median(run["manim"] for run in runs)
+        module_time = statistics.median(run["module"] for run in runs)
+        notes = []
+        if runs[0]["config_changes"]:
+            notes.append("changes config: " + ", ".join(runs[0]["config_changes"]))
+            failed = True
+        if runs[0]["manim_ml_loaded"]:
+            notes.append("imports manim_ml")
+        print(f"{module:<32}{manim_time * 1000:>8.0f}ms{module_time * 1000:>8.0f}ms  {'; '.join(notes)}")
+
+        if args.top:
+            for self_us, name in slowest_imports(module, args.top):
+                print(f"    {self_us / 1000:>8.1f}ms  {name}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Render the language-neutral shapes of a scene once and composite a per-language text layer over them
+"""
+
+import hashlib
+import subprocess
+
+import numpy as np
+from manim import DecimalNumber, MarkupText, Paragraph, SingleStringMathTex, Text
+
+from numeric_readout import NumericReadout
+
+
+SHAPES = "shapes"
+TEXT = "text"
+# Everything except translated text, for videos that carry their words as subtitle tracks
+CAPTIONED = "captioned"
+LAYERS = (SHAPES, TEXT, CAPTIONED)
+
+# Mobjects drawn in the text layer together with their whole family
+TEXT_TYPES = (Text, MarkupText, Paragraph, SingleStringMathTex, DecimalNumber, NumericReadout)
+
+# Mobjects whose string can move to a subtitle track
+CAPTION_TYPES = (Text, MarkupText)
+
+# Layout digests compare shapes to 1/100 of a scene unit, a little over a pixel at 1080p
+DIGEST_SCALE = 100
+
+
+def text_layer(mobject):
+    """Draw mobject in the text layer, for shapes whose size or position follows a translated label"""
+    mobject.text_layer = True
+    return mobject
+
+
+def caption_text(mobject):
+    """The translated string a mobject shows, or None for shapes and language-neutral numbers"""
+    if not isinstance(mobject, CAPTION_TYPES):
+        return None
+    # Set when a Transform turned this Text into another one, see subtitles.CaptionRecorder
+    text = getattr(mobject, "caption", None) or getattr(mobject, "original_text", None) or mobject.text
+    return text if any(char.isalpha() for char in text) else None
+
+
+def is_text(mobject):
+    return isinstance(mobject, TEXT_TYPES) or getattr(mobject, "text_layer", False)
+
+
+def is_caption(mobject):
+    return caption_text(mobject) is not None or getattr(mobject, "text_layer", False)
+
+
+def family_ids(mobjects, predicate):
+    """ids of every mobject matching predicate and of all its submobjects"""
+    ids = set()
+    for mobject in mobjects:
+        for member in mobject.get_family():
+            if id(member) not in ids and predicate(member):
+                ids.update(id(sub) for sub in member.get_family())
+    return ids
+
+
+class LayerCamera:
+    """Camera mixin that draws only one layer and digests the position of every shape it sees.
+
+    Both layers run the same timeline, so the shapes digest of a text pass must equal the one of the
+    shapes pass; if it does not, a translated label moved a shape and the layers cannot be stacked.
+
+    The renderer captures a play's static mobjects once, at its start, and only the moving ones on
+    every frame, so a frame hashes the points of the shapes that move in it and not the whole scene.
+
+    The digest covers positions, not drawing order: the composite always puts text above shapes, so a
+    scene that draws a shape over its text must be rendered without compositing.
+    """
+
+    layer = SHAPES
+
+    def reset_layout_digest(self):
+        self.layout_hash = hashlib.sha256()
+
+    def layout_digest(self):
+        return self.layout_hash.hexdigest()
+
+    def get_mobjects_to_display(self, mobjects, *args, **kwargs):
+        members = super().get_mobjects_to_display(mobjects, *args, **kwargs)
+        if self.layer == CAPTIONED:
+            captions = family_ids(mobjects, is_caption)
+            return [member for member in members if id(member) not in captions]
+
+        texts = family_ids(mobjects, is_text)
+        shapes = [member for member in members if id(member) not in texts]
+        for shape in shapes:
+            self.layout_hash.update(np.rint(shape.points * DIGEST_SCALE).astype(np.int32).tobytes())
+        if self.layer == TEXT:
+            return [member for member in members if id(member) in texts]
+        return shapes
+
+
+_layer_cameras = {}
+
+
+def use_layer(scene, layer):
+    """Switch a constructed scene's camera to draw only layer.
+
+    The camera's class is swapped in place rather than passed to the scene constructor, because the
+    scenes build their cameras differently (MovingCameraScene, plain Scene) and take no camera kwargs.
+    """
+    if layer not in LAYERS:
+        raise ValueError(f"Unknown layer {layer!r}; choose from {', '.join(LAYERS)}")
+    camera = scene.renderer.camera
+    base = type(camera)
+    key = (base, layer)
+    if key not in _layer_cameras:
+        _layer_cameras[key] = type(f"{base.__name__}{layer.title()}Layer", (LayerCamera, base), {"layer": layer})
+    camera.__class__ = _layer_cameras[key]
+    camera.reset_layout_digest()
+    if layer == TEXT:
+        # Transparent everywhere except the glyphs, whatever background the scene sets later
+        camera.background_opacity = 0.0
+        camera.init_background()
+    return camera
+
+
+def layer_config(layer):
+    """Manim config overrides for rendering one layer"""
+    if layer == TEXT:
+        # Manim writes transparent movies as .mov with an alpha channel
+        return {"transparent": True}
+    return {}
+
+
+def composite_command(shapes_path, text_path, output_path, ffmpeg="ffmpeg"):
+    """One ffmpeg run that stacks the transparent text layer over the shapes layer"""
+    return [
+        ffmpeg, "-y", "-loglevel", "error", "-i", shapes_path, "-i", text_path,
+        "-filter_complex", "[0:v][1:v]overlay=format=auto:shortest=1[v]",
+        "-map", "[v]", "-map", "0:a?", "-c:a", "copy",
+        "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "18", "-movflags", "+faststart",
+        output_path,
+    ]
+
+
+def composite(shapes_path, text_path, output_path, ffmpeg="ffmpeg"):
+    subprocess.run(composite_command(shapes_path, text_path, output_path, ffmpeg), check=True)
+    return output_path
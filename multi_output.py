@@ -0,0 +1,144 @@
+"""
+Fan one rendered master movie out to several encoded outputs in a single ffmpeg pass
+"""
+
+import os
+import re
+import shutil
+import subprocess
+from dataclasses import dataclass
+
+
+# Master movies are rendered at this aspect ratio, same as manim's quality presets
+ASPECT_RATIO = 16 / 9
+
+DEFAULT_OUTPUTS = ("mp4:1080p60", "gif:720p30")
+
+_SPEC = re.compile(r"^(?P<format>mp4|gif|webm):(?P<height>\d+)p(?P<fps>\d+)$")
+
+
+@dataclass(frozen=True)
+class OutputSpec:
+    """One encoded output: container format, frame height and frame rate"""
+    format: str
+    height: int
+    fps: int
+
+    @classmethod
+    def parse(cls, text):
+        """Parse "format:<height>p<fps>", e.g. "mp4:1080p60" or "gif:480p15" """
+        match = _SPEC.match(text.strip().lower())
+        if not match:
+            raise ValueError(f"Bad output spec {text!r}; expected e.g. mp4:1080p60 or gif:720p30")
+        return cls(match["format"], int(match["height"]), int(match["fps"]))
+
+    @property
+    def width(self):
+        # Even widths keep yuv420p encoders happy
+        return int(round(self.height * ASPECT_RATIO / 2)) * 2
+
+    @property
+    def suffix(self):
+        return f"{self.height}p{self.fps}.{self.format}"
+
+    def __str__(self):
+        return f"{self.format}:{self.height}p{self.fps}"
+
+
+def output_spec(text):
+    """Canonical spec string; doubles as an argparse type"""
+    return str(OutputSpec.parse(text))
+
+
+def parse_outputs(specs):
+    return [spec if isinstance(spec, OutputSpec) else OutputSpec.parse(spec) for spec in specs]
+
+
+def master_spec(outputs):
+    """The single movie to rasterize: the largest height and fastest frame rate any output needs.
+
+    Lower frame rates are taken by dropping frames, so they should divide the master rate evenly.
+    """
+    outputs = parse_outputs(outputs)
+    master = OutputSpec("mp4", max(o.height for o in outputs), max(o.fps for o in outputs))
+    uneven = [str(o) for o in outputs if master.fps % o.fps]
+    if uneven:
+        print(f"Warning: {', '.join(uneven)} do not divide {master.fps}fps evenly; frames will be uneven")
+    return master
+
+
+def master_config(outputs):
+    """Manim config overrides that render the master movie for outputs"""
+    master = master_spec(outputs)
+    return {
+        "pixel_height": master.height,
+        "pixel_width": master.width,
+        "frame_rate": master.fps,
+        "format": "mp4",
+    }
+
+
+def output_paths(master_path, outputs, output_dir=None, name=None):
+    """Output file per spec, next to the master unless output_dir is given"""
+    output_dir = output_dir or os.path.dirname(master_path)
+    name = name or os.path.splitext(os.path.basename(master_path))[0]
+    return [os.path.join(output_dir, f"{name}_{spec.suffix}") for spec in parse_outputs(outputs)]
+
+
+def fanout_command(master_path, outputs, paths, ffmpeg="ffmpeg"):
+    """One ffmpeg invocation that decodes the master once and splits it into every output.
+
+    Each branch decimates to its frame rate and scales with Lanczos. GIF branches build a palette
+    from their own frames (palettegen/paletteuse) instead of using a fixed 256-colour palette.
+    """
+    outputs = parse_outputs(outputs)
+    branches = [f"[0:v]split={len(outputs)}" + "".join(f"[s{i}]" for i in range(len(outputs)))]
+    for i, spec in enumerate(outputs):
+        resample = f"fps={spec.fps},scale={spec.width}:{spec.height}:flags=lanczos,setsar=1"
+        if spec.format == "gif":
+            branches.append(
+                f"[s{i}]{resample},split[g{i}a][g{i}b];"
+                f"[g{i}a]palettegen=stats_mode=diff[p{i}];"
+                f"[g{i}b][p{i}]paletteuse=dither=bayer:bayer_scale=5:diff_mode=rectangle[v{i}]"
+            )
+        else:
+            branches.append(f"[s{i}]{resample}[v{i}]")
+
+    command = [ffmpeg, "-y", "-loglevel", "error", "-i", master_path,
+               "-filter_complex", ";".join(branches)]
+    for i, (spec, path) in enumerate(zip(outputs, paths)):
+        command += ["-map", f"[v{i}]"]
+        if spec.format == "mp4":
+            # Subtitle streams muxed into the master (see subtitles.py) carry over unchanged
+            command += ["-map", "0:a?", "-map", "0:s?", "-c:a", "copy", "-c:s", "copy",
+                        "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "18", "-movflags", "+faststart"]
+        elif spec.format == "webm":
+            command += ["-map", "0:a?", "-c:v", "libvpx-vp9", "-b:v", "0", "-crf", "32"]
+        else:
+            command += ["-loop", "0"]
+        command.append(path)
+    return command
+
+
+def encode_outputs(master_path, outputs, output_dir=None, name=None, ffmpeg="ffmpeg"):
+    """Write every output from the master movie and return their paths in spec order.
+
+    An mp4 output identical to the master is copied rather than re-encoded; everything else comes
+    out of a single ffmpeg run.
+    """
+    outputs = parse_outputs(outputs)
+    paths = output_paths(master_path, outputs, output_dir, name)
+    master = master_spec(outputs)
+
+    encode = []
+    for spec, path in zip(outputs, paths):
+        if spec == master:
+            if os.path.abspath(path) != os.path.abspath(master_path):
+                shutil.copyfile(master_path, path)
+        else:
+            encode.append((spec, path))
+
+    if encode:
+        specs, encode_paths = zip(*encode)
+        subprocess.run(fanout_command(master_path, specs, encode_paths, ffmpeg), check=True)
+    return paths
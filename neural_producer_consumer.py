@@ -1,24 +1,61 @@
 from manim import *
-try:
-    from manim_ml.neural_network.layers import FeedForwardLayer
-    from manim_ml.neural_network.neural_network import NeuralNetwork
-    MANIM_ML_AVAILABLE = True
-except ImportError:
-    MANIM_ML_AVAILABLE = False
-    print("manim-ml not available. Using fallback implementation.")
 
+import functools
 import random
 import numpy as np
 
-config.background_color = "#0f0f0f"
+from buffer_autoscaler import BufferAutoscaler
+from buffer_pool import BufferPool
+from capacity_sweep import sweep
+from connection_mesh import ConnectionMesh, layer_positions
+from layer_compositing import text_layer
+from overflow_policies import DROP_NEWEST, SPILL, LatencyTracker, compare_policies, make_policy
+from packet_particles import PacketParticles
+from scene_sections import section
+from text_cache import cached_text, prewarm
+
+
+@functools.lru_cache(maxsize=None)
+def load_manim_ml():
+    """(FeedForwardLayer, NeuralNetwork) from manim-ml, or None when it is not installed.
+
+    Imported on first use rather than at module import, since manim-ml pulls in a large dependency
+    tree that most renders of this module never touch.
+    """
+    try:
+        from manim_ml.neural_network.layers import FeedForwardLayer
+        from manim_ml.neural_network.neural_network import NeuralNetwork
+    except ImportError:
+        print("manim-ml not available. Using fallback implementation.")
+        return None
+    return FeedForwardLayer, NeuralNetwork
 
 
 class NeuralProducerConsumerBase(Scene):
     """Neural network style Producer-Consumer animation with multiple agents"""
     
-    def __init__(self, language="en", **kwargs):
+    def __init__(self, language="en", seed=None, producers=4, buffers=4, consumers=3,
+                 packet_labels=True, autoscaler=None, overflow_policy=DROP_NEWEST, use_manim_ml=True,
+                 background_color="#0f0f0f", **kwargs):
         super().__init__(**kwargs)
         self.language = language
+        self.seed = seed
+        self.num_producers = producers
+        self.num_buffers = buffers
+        self.num_consumers = consumers
+        self.buffer_capacity = 1
+        self.packet_labels = packet_labels
+        self.use_manim_ml = use_manim_ml
+        self.background_color = background_color
+        if isinstance(overflow_policy, str):
+            overflow_policy = make_policy(overflow_policy)
+        self.overflow_policy = overflow_policy
+        self.latency = LatencyTracker()
+        self.autoscaler = autoscaler or BufferAutoscaler(
+            min_buffers=max(1, buffers // 2),
+            max_buffers=buffers * 2
+        )
+        self.rng = random.Random(seed)
         self.setup_translations()
     
     def setup_translations(self):
@@ -36,9 +73,32 @@ class NeuralProducerConsumerBase(Scene):
                 "dropped": "Düşürüldü: {}",
                 "cycle": "Döngü {}/10",
                 "buffer_added": "Yeni Buffer Eklendi!",
+                "buffer_removed": "Buffer Kaldırıldı",
                 "system_upgraded": "Sistem Güncellendi",
+                "system_downscaled": "Sistem Küçültüldü",
+                "drops_before": "İlk {} döngü: {} paket düşürüldü",
+                "drops_after": "Son {} döngü: {} paket düşürüldü",
+                "improvement": "Buffer eklenerek veri kaybı azaltıldı!",
+                "overflow_tier": "Taşma Katmanı",
+                "policy_title": "Taşma Politikaları ({} döngü)\n{} tampon, {}-{} arası ölçeklenir, kapasite {}",
+                "policy_header": "{:<18}{:>8}{:>6}{:>6}{:>6}".format("Politika", "Kayıp", "p50", "p95", "p99"),
+                "latency_unit": "Gecikme döngü cinsinden",
+                "scene_run": "Bu sahne",
+                "policy_names": {
+                    "drop_newest": "En yeniyi düşür",
+                    "drop_oldest": "En eskiyi düşür",
+                    "block_producer": "Üreticiyi beklet",
+                    "spill": "Taşma katmanı",
+                },
                 "neural_title": "Sinir Ağı Tarzında Üretici-Tüketici Modeli",
-                "end_text": "Ağ Simülasyonu Tamamlandı!"
+                "end_text": "Ağ Simülasyonu Tamamlandı!",
+                "sweep_title": "Tampon Kapasitesi Planlama Taraması",
+                "buffers_axis": "Tampon Sayısı",
+                "drop_rate_axis": "Düşürme Oranı",
+                "utilization_axis": "Doluluk",
+                "capacity_legend": "Kapasite {}",
+                "load_label": "Üretim: üretici başına {:g} paket/döngü",
+                "sweep_footer": "{} yapılandırma × {} tohum × {} döngü"
             }
         else:
             self.texts = {
@@ -53,44 +113,57 @@ class NeuralProducerConsumerBase(Scene):
                 "dropped": "Dropped: {}",
                 "cycle": "Cycle {}/10",
                 "buffer_added": "New Buffer Added!",
+                "buffer_removed": "Buffer Removed",
                 "system_upgraded": "System Upgraded",
+                "system_downscaled": "System Scaled Down",
+                "drops_before": "First {} cycles: {} packets dropped",
+                "drops_after": "Last {} cycles: {} packets dropped",
+                "improvement": "Buffer addition reduced data loss!",
+                "overflow_tier": "Overflow Tier",
+                "policy_title": "Overflow Policies ({} cycles)\n{} buffers, autoscaled {}-{}, capacity {}",
+                "policy_header": "{:<18}{:>8}{:>6}{:>6}{:>6}".format("Policy", "Loss", "p50", "p95", "p99"),
+                "latency_unit": "Latency in cycles",
+                "scene_run": "This scene",
+                "policy_names": {
+                    "drop_newest": "Drop newest",
+                    "drop_oldest": "Drop oldest",
+                    "block_producer": "Block producer",
+                    "spill": "Spill to overflow",
+                },
                 "neural_title": "Neural Network Style Producer-Consumer Model",
-                "end_text": "Network Simulation Complete!"
+                "end_text": "Network Simulation Complete!",
+                "sweep_title": "Buffer Capacity Planning Sweep",
+                "buffers_axis": "Buffers",
+                "drop_rate_axis": "Drop Rate",
+                "utilization_axis": "Utilization",
+                "capacity_legend": "Capacity {}",
+                "load_label": "Production: {:g} packets/cycle per producer",
+                "sweep_footer": "{} configurations × {} seeds × {} cycles"
             }
     
     def create_neural_network_fallback(self):
         """Create a fallback neural network visualization when manim-ml is not available"""
-        producer_nodes = []
-        for i in range(4):
-            node = Circle(radius=0.3, color=BLUE, fill_opacity=0.8)
-            node.move_to(LEFT * 5 + UP * (1.5 - i * 1))
-            producer_nodes.append(node)
-        
-        buffer_nodes = []
-        for i in range(4):
-            node = Circle(radius=0.25, color=GREEN, fill_opacity=0.6)
-            node.move_to(UP * (1.5 - i * 1))
-            buffer_nodes.append(node)
-        
-        consumer_nodes = []
-        for i in range(3):
-            node = Circle(radius=0.3, color=RED, fill_opacity=0.8)
-            node.move_to(RIGHT * 5 + UP * (1 - i * 1))
-            consumer_nodes.append(node)
+        producer_positions = layer_positions(self.num_producers, -5)
+        buffer_positions = layer_positions(self.num_buffers, 0)
+        consumer_positions = layer_positions(self.num_consumers, 5)
         
-        connections = []
+        producer_nodes = [
+            Circle(radius=self.node_radius(self.num_producers, 0.3), color=BLUE, fill_opacity=0.8).move_to(position)
+            for position in producer_positions
+        ]
+        buffer_nodes = [
+            Circle(radius=self.node_radius(self.num_buffers, 0.25), color=GREEN, fill_opacity=0.6).move_to(position)
+            for position in buffer_positions
+        ]
+        consumer_nodes = [
+            Circle(radius=self.node_radius(self.num_consumers, 0.3), color=RED, fill_opacity=0.8).move_to(position)
+            for position in consumer_positions
+        ]
         
-        for p_node in producer_nodes:
-            for b_node in buffer_nodes:
-                line = Line(p_node.get_center(), b_node.get_center(), 
-                           color=GRAY, stroke_width=1, stroke_opacity=0.3)
-                connections.append(line)
-        
-        for b_node in buffer_nodes:
-            for c_node in consumer_nodes:
-                line = Line(b_node.get_center(), c_node.get_center(),
-                           color=GRAY, stroke_width=1, stroke_opacity=0.3)
-                connections.append(line)
+        connections = ConnectionMesh.layered(
+            [producer_positions, buffer_positions, consumer_positions],
+            color=GRAY, stroke_width=1, stroke_opacity=0.3
+        )
         
         garbage_collector = RoundedRectangle(
             width=2.5, height=1.5, corner_radius=0.2,
@@ -98,23 +171,179 @@ class NeuralProducerConsumerBase(Scene):
         )
         garbage_collector.move_to(DOWN * 3)
         
-        trash_icon = Text("GC", font_size=30, color=WHITE, weight=BOLD)
+        trash_icon = cached_text("GC", font_size=30, color=WHITE, weight=BOLD)
         trash_icon.move_to(garbage_collector.get_center())
         garbage_group = VGroup(garbage_collector, trash_icon)
         
         return producer_nodes, buffer_nodes, consumer_nodes, connections, garbage_group
     
-    def create_data_packet(self, value, color=PURPLE):
-        """Create a data packet visualization"""
-        packet = Circle(radius=0.25, color=color, fill_opacity=0.9, stroke_width=2)
-        text = Text(str(value), font_size=18, color=WHITE, weight=BOLD)
-        text.move_to(packet.get_center())
-        return VGroup(packet, text)
+    def node_radius(self, count, radius):
+        """Shrink node circles so large layers still fit in the frame"""
+        if count <= 1:
+            return radius
+        return min(radius, 0.4 * 4.0 / (count - 1))
+    
+    def relayout_buffer_layer(self, target, buffer_nodes, producer_nodes, consumer_nodes, connections,
+                              buffer_pool, packets):
+        """Resize the buffer layer to target nodes and move everything attached to it in one play.
+
+        Node positions and the full connection mesh are recomputed as arrays for the new size, and
+        buffered packets follow their buffer. Returns the new connection mesh.
+        """
+        removed_nodes = []
+        removed_indices = []
+        while len(buffer_nodes) > target:
+            index = buffer_pool.remove_buffer()
+            if index is None:
+                break
+            removed_nodes.append(buffer_nodes.pop(index))
+            removed_indices.append(index)
+        
+        radius = self.node_radius(target, 0.25)
+        added_nodes = []
+        while len(buffer_nodes) < target:
+            buffer_pool.add_buffer()
+            node = Circle(radius=radius, color=GREEN, fill_opacity=0.6)
+            buffer_nodes.append(node)
+            added_nodes.append(node)
+        
+        positions = layer_positions(len(buffer_nodes), 0)
+        kept = len(buffer_nodes) - len(added_nodes)
+        animations = [FadeOut(node) for node in removed_nodes]
+        for node, position in zip(buffer_nodes[:kept], positions[:kept]):
+            animations.append(node.animate.move_to(position).scale_to_fit_width(2 * radius))
+        for node, position in zip(added_nodes, positions[kept:]):
+            node.move_to(position)
+            animations.append(GrowFromCenter(node))
+        
+        buffered = buffer_pool.packets()
+        if buffered:
+            counts = [len(queue) for queue in buffer_pool.queues]
+            packets.send(buffered, np.repeat(positions, counts, axis=0))
+            animations.append(packets.flow())
+        
+        new_connections = ConnectionMesh.layered(
+            [[node.get_center() for node in producer_nodes], positions,
+             [node.get_center() for node in consumer_nodes]],
+            color=GRAY, stroke_width=1, stroke_opacity=0.3
+        )
+        if isinstance(connections, ConnectionMesh):
+            # Carry edge traffic over to the new mesh: drop removed buffers, start added ones at zero
+            into_buffers, out_of_buffers = connections.layer_traffic()
+            for index in removed_indices:
+                into_buffers = np.delete(into_buffers, index, axis=1)
+                out_of_buffers = np.delete(out_of_buffers, index, axis=0)
+            into_buffers = np.pad(into_buffers, ((0, 0), (0, len(added_nodes))))
+            out_of_buffers = np.pad(out_of_buffers, ((0, len(added_nodes)), (0, 0)))
+            new_connections.set_layer_traffic([into_buffers, out_of_buffers]).show_traffic()
+        animations.append(ReplacementTransform(connections, new_connections))
+        
+        self.play(*animations, run_time=1.5)
+        return new_connections
+    
+    def create_overflow_tier(self):
+        """Box that holds spilled packets under the spill-to-overflow policy"""
+        tier = RoundedRectangle(
+            width=2.2, height=1.2, corner_radius=0.2,
+            color=ORANGE, fill_color=ORANGE, fill_opacity=0.2
+        )
+        tier.move_to(DOWN * 3 + LEFT * 3.5)
+        label = cached_text(self.texts["overflow_tier"], font_size=18, color=ORANGE, weight=BOLD)
+        label.next_to(tier, DOWN, buff=0.15)
+        return VGroup(tier, label)
+    
+    @section
+    def show_policy_comparison(self, cycles=2000):
+        """Table of loss and queueing-latency percentiles for every overflow policy on this layer.
+
+        The last row is what this scene's own cycles measured under its policy, below the simulation.
+        """
+        results = compare_policies(
+            producers=self.num_producers,
+            consumers=self.num_consumers,
+            buffers=self.num_buffers,
+            capacity=self.buffer_capacity,
+            cycles=cycles,
+            seed=self.seed if self.seed is not None else 0,
+            autoscaler=self.autoscaler
+        )
+        
+        title = cached_text(
+            self.texts["policy_title"].format(
+                cycles, self.num_buffers, self.autoscaler.min_buffers, self.autoscaler.max_buffers,
+                self.buffer_capacity
+            ),
+            font_size=28, color=GOLD, weight=BOLD
+        )
+        header = cached_text(self.texts["policy_header"], font_size=20, font="monospace", color=GRAY)
+        def row(name, stats, color):
+            return Text(
+                "{:<18}{:>8.1%}{:>6}{:>6}{:>6}".format(
+                    name, stats.loss, stats.latency_p50, stats.latency_p95, stats.latency_p99
+                ),
+                font_size=20,
+                font="monospace",
+                color=color
+            )
+        
+        rows = VGroup(*[
+            row(
+                self.texts["policy_names"][stats.policy], stats,
+                YELLOW if stats.policy == self.overflow_policy.name else WHITE
+            )
+            for stats in results
+        ])
+        scene_stats = self.latency.stats(self.overflow_policy.name)
+        rows.add(row(self.texts["scene_run"], scene_stats, GOLD))
+        unit = cached_text(self.texts["latency_unit"], font_size=16, color=GRAY)
+        table = VGroup(title, header, *rows, unit).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
+        table.move_to(ORIGIN)
+        
+        self.play(FadeIn(table), run_time=1)
+        self.wait(3)
+        self.play(FadeOut(table))
+    
+    def create_packet_particles(self):
+        """Particle system that draws every data packet of the scene"""
+        return PacketParticles(
+            radius=0.25,
+            fill_opacity=0.9,
+            stroke_width=2,
+            labels=self.packet_labels,
+            label_style=dict(font_size=18, color=WHITE, weight=BOLD)
+        )
+    
+    def prewarm_texts(self):
+        """Lay out every translated label and packet number once, before the first play() call"""
+        label_style = dict(font_size=24, weight=BOLD)
+        prewarm(
+            [
+                (self.texts["neural_title"], dict(font_size=40, weight=BOLD, color=WHITE)),
+                ("GC", dict(font_size=30, color=WHITE, weight=BOLD)),
+                (self.texts["producers"], dict(color=BLUE, **label_style)),
+                (self.texts["buffer_layer"], dict(color=GREEN, **label_style)),
+                (self.texts["consumers"], dict(color=RED, **label_style)),
+                (self.texts["garbage_collector"], dict(font_size=20, color=DARK_GRAY, weight=BOLD)),
+                (self.texts["system_upgraded"], dict(font_size=32, color=YELLOW, weight=BOLD)),
+                (self.texts["buffer_added"], dict(color=GREEN, **label_style)),
+                (self.texts["end_text"], dict(font_size=36, color=GOLD, weight=BOLD)),
+            ]
+            + [
+                (self.texts["cycle"].format(cycle + 1), dict(color=GOLD, **label_style))
+                for cycle in range(10)
+            ]
+            + [
+                (str(value), dict(font_size=18, color=WHITE, weight=BOLD))
+                for value in range(10, 100) if self.packet_labels
+            ]
+        )
     
     def construct(self):
-        self.camera.background_color = "#0f0f0f"
+        self.camera.background_color = self.background_color
+        self.prewarm_texts()
+        self.next_section("intro")
         
-        title = Text(self.texts["neural_title"], font_size=40, weight=BOLD, color=WHITE)
+        title = cached_text(self.texts["neural_title"], font_size=40, weight=BOLD, color=WHITE)
         title.to_edge(UP, buff=0.3)
         
         lang_text = "TR | Türkçe" if self.language == "tr" else "EN | English"
@@ -128,25 +357,28 @@ class NeuralProducerConsumerBase(Scene):
             fill_opacity=0.2,
             stroke_width=2
         )
-        lang_group = VGroup(lang_box, lang_indicator).arrange(ORIGIN)
+        lang_group = text_layer(VGroup(lang_box, lang_indicator).arrange(ORIGIN))
         lang_group.to_corner(UR, buff=0.2)
         
         self.play(Write(title), FadeIn(lang_group))
         self.wait(1)
         
-        if MANIM_ML_AVAILABLE:
+        garbage_group = None
+        manim_ml = load_manim_ml() if self.use_manim_ml else None
+        if manim_ml is not None:
+            FeedForwardLayer, NeuralNetwork = manim_ml
             try:
-                input_layer = FeedForwardLayer(4, rectangle_color=BLUE, rectangle_fill_color=BLUE)
-                hidden_layer = FeedForwardLayer(4, rectangle_color=GREEN, rectangle_fill_color=GREEN)
-                output_layer = FeedForwardLayer(3, rectangle_color=RED, rectangle_fill_color=RED)
+                input_layer = FeedForwardLayer(self.num_producers, rectangle_color=BLUE, rectangle_fill_color=BLUE)
+                hidden_layer = FeedForwardLayer(self.num_buffers, rectangle_color=GREEN, rectangle_fill_color=GREEN)
+                output_layer = FeedForwardLayer(self.num_consumers, rectangle_color=RED, rectangle_fill_color=RED)
                 
                 nn = NeuralNetwork([input_layer, hidden_layer, output_layer], 
                                  layer_spacing=3)
                 nn.move_to(ORIGIN)
                 
-                producer_nodes = input_layer.neurons
-                buffer_nodes = hidden_layer.neurons  
-                consumer_nodes = output_layer.neurons
+                producer_nodes = list(input_layer.neurons)
+                buffer_nodes = list(hidden_layer.neurons)
+                consumer_nodes = list(output_layer.neurons)
                 connections = nn.connections
                 
                 network_group = VGroup(nn)
@@ -154,31 +386,31 @@ class NeuralProducerConsumerBase(Scene):
             except Exception as e:
                 print(f"manim-ml error: {e}. Using fallback.")
                 producer_nodes, buffer_nodes, consumer_nodes, connections, garbage_group = self.create_neural_network_fallback()
-                network_group = VGroup(*producer_nodes, *buffer_nodes, *consumer_nodes, *connections)
+                network_group = VGroup(*producer_nodes, *buffer_nodes, *consumer_nodes, connections)
         else:
             producer_nodes, buffer_nodes, consumer_nodes, connections, garbage_group = self.create_neural_network_fallback()
-            network_group = VGroup(*producer_nodes, *buffer_nodes, *consumer_nodes, *connections)
+            network_group = VGroup(*producer_nodes, *buffer_nodes, *consumer_nodes, connections)
         
-        if MANIM_ML_AVAILABLE and 'garbage_group' not in locals():
+        if garbage_group is None:
             garbage_collector = RoundedRectangle(
                 width=2.5, height=1.5, corner_radius=0.2,
                 color=DARK_GRAY, fill_color=DARK_GRAY, fill_opacity=0.7
             )
             garbage_collector.move_to(DOWN * 3)
-            trash_icon = Text("GC", font_size=30, color=WHITE, weight=BOLD)
+            trash_icon = cached_text("GC", font_size=30, color=WHITE, weight=BOLD)
             trash_icon.move_to(garbage_collector.get_center())
             garbage_group = VGroup(garbage_collector, trash_icon)
         
-        producer_label = Text(self.texts["producers"], font_size=24, color=BLUE, weight=BOLD)
+        producer_label = cached_text(self.texts["producers"], font_size=24, color=BLUE, weight=BOLD)
         producer_label.next_to(producer_nodes[0], LEFT, buff=0.5)
         
-        buffer_label = Text(self.texts["buffer_layer"], font_size=24, color=GREEN, weight=BOLD)
-        buffer_label.next_to(buffer_nodes[1], UP, buff=0.5)
+        buffer_label = cached_text(self.texts["buffer_layer"], font_size=24, color=GREEN, weight=BOLD)
+        buffer_label.next_to(buffer_nodes[min(1, len(buffer_nodes) - 1)], UP, buff=0.5)
         
-        consumer_label = Text(self.texts["consumers"], font_size=24, color=RED, weight=BOLD)
+        consumer_label = cached_text(self.texts["consumers"], font_size=24, color=RED, weight=BOLD)
         consumer_label.next_to(consumer_nodes[0], RIGHT, buff=0.5)
         
-        garbage_label = Text(self.texts["garbage_collector"], font_size=20, color=DARK_GRAY, weight=BOLD)
+        garbage_label = cached_text(self.texts["garbage_collector"], font_size=20, color=DARK_GRAY, weight=BOLD)
         garbage_label.next_to(garbage_group, DOWN, buff=0.3)
         
         self.play(
@@ -192,20 +424,26 @@ class NeuralProducerConsumerBase(Scene):
         )
         self.wait(1)
         
-        buffer_states = [0] * len(buffer_nodes)
-        buffer_capacity = 1
-        buffer_counts = [0] * len(buffer_nodes)
+        buffer_capacity = self.buffer_capacity
+        buffer_pool = BufferPool(len(buffer_nodes), buffer_capacity)
         
-        active_packets = []
-        buffer_visual_packets = {}
         dropped_count = 0
         dropped_before_upgrade = 0
+        first_scale_cycle = None
         garbage_collector = garbage_group[0]
+        packets = self.create_packet_particles()
+        self.add(packets)
         
-        new_buffer_added = False
+        policy = self.overflow_policy
+        blocked_producers = {}
+        overflow_tier = None
+        if policy.name == SPILL:
+            overflow_tier = self.create_overflow_tier()
+            self.play(FadeIn(overflow_tier), run_time=0.5)
         
         for cycle in range(10):
-            cycle_text = Text(
+            self.next_section(f"cycle_{cycle + 1}")
+            cycle_text = cached_text(
                 self.texts["cycle"].format(cycle + 1),
                 font_size=24,
                 weight=BOLD,
@@ -216,97 +454,109 @@ class NeuralProducerConsumerBase(Scene):
             
             animations = []
             
-            active_producers = random.sample(range(len(producer_nodes)), k=random.randint(2, 4))
+            # Producers holding a packet under backpressure retry it instead of producing
+            ready_producers = [p for p in range(len(producer_nodes)) if p not in blocked_producers]
+            active_producers = self.rng.sample(
+                ready_producers,
+                k=self.rng.randint(
+                    min(len(ready_producers), max(1, len(producer_nodes) // 2)), len(ready_producers)
+                )
+            )
             active_consumers = []
             
-            if active_packets and random.random() > 0.3:
-                active_consumers = random.sample(range(len(consumer_nodes)), 
-                                               k=min(len(active_packets), random.randint(1, 3)))
+            waiting_packets = buffer_pool.total + len(policy.waiting())
+            if waiting_packets and self.rng.random() > 0.3:
+                active_consumers = self.rng.sample(range(len(consumer_nodes)), 
+                                               k=min(waiting_packets, self.rng.randint(1, len(consumer_nodes))))
             
-            producer_packets = []
+            data_values = [self.rng.randint(10, 99) for _ in active_producers]
+            packet_ids = packets.spawn(
+                [producer_nodes[p_idx].get_center() for p_idx in active_producers],
+                data_values
+            )
+            for packet in packet_ids:
+                self.latency.enqueue(packet, cycle)
+            producer_packets = [(packet, p_idx) for p_idx, packet in blocked_producers.items()]
+            producer_packets += list(zip(packet_ids, active_producers))
+            blocked_producers.clear()
+            if len(packet_ids):
+                animations.append(packets.flow())
             for p_idx in active_producers:
-                data_value = random.randint(10, 99)
-                packet = self.create_data_packet(data_value)
-                packet.move_to(producer_nodes[p_idx].get_center())
-                producer_packets.append((packet, p_idx, data_value))
-                
-                animations.append(Create(packet))
                 animations.append(producer_nodes[p_idx].animate.set_fill(BLUE, opacity=1))
             
+            # Taken packets keep their buffer slot reserved until the move below, so this cycle's
+            # producers cannot land in a slot that is still being emptied
             packets_to_consume = []
             for c_idx in active_consumers:
-                if not active_packets:
+                taken = policy.take(buffer_pool, self.rng)
+                if taken is None:
                     break
-                    
-                available_packets = [(i, packet, b_idx, value) for i, (packet, b_idx, value) in enumerate(active_packets)
-                                   if buffer_counts[b_idx] > 0]
+                b_idx, packet = taken
+                packets_to_consume.append((c_idx, packet, b_idx))
                 
-                if available_packets:
-                    packet_idx, packet, b_idx, value = random.choice(available_packets)
-                    packets_to_consume.append((c_idx, packet_idx, packet, b_idx, value))
-                    
-                    animations.append(consumer_nodes[c_idx].animate.set_fill(RED, opacity=1))
+                animations.append(consumer_nodes[c_idx].animate.set_fill(RED, opacity=1))
             
             if animations:
                 self.play(*animations, run_time=0.3)
             
-            movement_animations = []
+            moved = False
+            changed_buffers = set()
+            producer_edges = []
+            consumer_edges = []
+            dropped_this_cycle = 0
+            overflowed_this_cycle = 0
             
-            for packet, p_idx, value in producer_packets:
-                available_buffers = [i for i, count in enumerate(buffer_counts) 
-                                   if count < buffer_capacity]
+            for packet, p_idx in producer_packets:
+                admission = policy.admit(buffer_pool, self.rng, packet)
                 
-                if available_buffers:
-                    b_idx = random.choice(available_buffers)
-                    
-                    if b_idx not in buffer_visual_packets:
-                        buffer_visual_packets[b_idx] = []
+                if admission.buffer is not None:
+                    target_pos = buffer_nodes[admission.buffer].get_center()
                     
-                    target_pos = buffer_nodes[b_idx].get_center()
-                    
-                    movement_animations.append(packet.animate.scale(0.7).move_to(target_pos))
-                    
-                    buffer_counts[b_idx] += 1
-                    active_packets.append((packet, b_idx, value))
-                    buffer_visual_packets[b_idx].append(packet)
-                else:
-                    movement_animations.append(packet.animate.move_to(garbage_collector.get_center()))
-                    dropped_count += 1
-            
-            packets_to_remove = []
-            for c_idx, packet_idx, packet, b_idx, value in packets_to_consume:
-                movement_animations.append(
-                    packet.animate.scale(1/0.7).move_to(consumer_nodes[c_idx].get_center())
-                )
-                
-                buffer_counts[b_idx] -= 1
-                packets_to_remove.append(packet_idx)
+                    packets.send([packet], target_pos, scale=0.7)
+                    changed_buffers.add(admission.buffer)
+                    producer_edges.append((p_idx, admission.buffer))
+                elif admission.spilled:
+                    packets.send([packet], overflow_tier[0].get_center(), scale=0.7)
+                elif admission.blocked:
+                    blocked_producers[p_idx] = packet
                 
-                if packet in buffer_visual_packets[b_idx]:
-                    buffer_visual_packets[b_idx].remove(packet)
-            
-            if movement_animations:
-                self.play(*movement_animations, run_time=0.7)
+                if admission.dropped is not None:
+                    packets.send([admission.dropped], garbage_collector.get_center())
+                    self.latency.drop(admission.dropped)
+                    dropped_this_cycle += 1
+                if admission.buffer is None or admission.dropped is not None:
+                    overflowed_this_cycle += 1
+                moved = True
             
-            fade_animations = []
+            for c_idx, packet, b_idx in packets_to_consume:
+                packets.send([packet], consumer_nodes[c_idx].get_center(), scale=1/0.7)
+                self.latency.dequeue(packet, cycle)
+                moved = True
+                
+                if b_idx is not None:
+                    buffer_pool.release(b_idx)
+                    changed_buffers.add(b_idx)
+                    consumer_edges.append((b_idx, c_idx))
             
-            for c_idx, packet_idx, packet, b_idx, value in packets_to_consume:
-                fade_animations.append(FadeOut(packet))
+            dropped_count += dropped_this_cycle
             
-            for packet, p_idx, value in producer_packets:
-                available_buffers = [i for i, count in enumerate(buffer_counts) 
-                                   if count < buffer_capacity + 1]
-                if not available_buffers:
-                    fade_animations.append(FadeOut(packet))
+            if moved:
+                self.play(packets.flow(), run_time=0.7)
             
-            for idx in sorted(packets_to_remove, reverse=True):
-                if idx < len(active_packets):
-                    active_packets.pop(idx)
+            fade_animations = []
+            if packets_to_consume:
+                packets.fade_out([packet for c_idx, packet, b_idx in packets_to_consume])
+            promoted = policy.promote(buffer_pool, self.rng)
+            for packet, b_idx in promoted:
+                packets.send([packet], buffer_nodes[b_idx].get_center())
+                changed_buffers.add(b_idx)
+            if packets_to_consume or promoted:
+                fade_animations.append(packets.flow())
             
             buffer_updates = []
-            for i, node in enumerate(buffer_nodes):
-                new_opacity = 0.6 + 0.4 * buffer_counts[i]/buffer_capacity
-                buffer_updates.append(node.animate.set_fill(GREEN, opacity=new_opacity))
+            for i in sorted(changed_buffers):
+                new_opacity = 0.6 + 0.4 * buffer_pool.count(i)/buffer_capacity
+                buffer_updates.append(buffer_nodes[i].animate.set_fill(GREEN, opacity=new_opacity))
             
             reset_animations = []
             for p_idx in active_producers:
@@ -314,6 +564,13 @@ class NeuralProducerConsumerBase(Scene):
             for c_idx in active_consumers:
                 reset_animations.append(consumer_nodes[c_idx].animate.set_fill(RED, opacity=0.8))
             
+            if isinstance(connections, ConnectionMesh):
+                for pair, edges in enumerate([producer_edges, consumer_edges]):
+                    if edges:
+                        sources, targets = zip(*edges)
+                        connections.record_traffic(connections.edge_indices(pair, sources, targets))
+                connections.show_traffic()
+            
             all_cleanup = fade_animations + buffer_updates + reset_animations
             if all_cleanup:
                 self.play(*all_cleanup, run_time=0.3)
@@ -321,65 +578,47 @@ class NeuralProducerConsumerBase(Scene):
             
             self.play(FadeOut(cycle_text), run_time=0.3)
             
-            if cycle == 4 and not new_buffer_added:
+            # The autoscaler sees every packet that found the layer full, whatever the policy did with it
+            self.autoscaler.observe(
+                len(buffer_nodes), len(producer_packets), overflowed_this_cycle,
+                buffer_pool.total, len(buffer_nodes) * buffer_capacity
+            )
+            target = self.autoscaler.target(len(buffer_nodes))
+            
+            if target != len(buffer_nodes):
                 self.wait(0.5)
+                growing = target > len(buffer_nodes)
                 
-                upgrade_text = Text(
-                    self.texts["system_upgraded"],
+                upgrade_text = cached_text(
+                    self.texts["system_upgraded" if growing else "system_downscaled"],
                     font_size=32,
                     color=YELLOW,
                     weight=BOLD
                 )
                 upgrade_text.move_to(UP * 3.5)
+                self.play(Write(upgrade_text), run_time=0.5)
                 
-                new_buffer = Circle(radius=0.25, color=GREEN, fill_opacity=0.6)
-                new_buffer_pos = DOWN * 2.5
-                new_buffer.move_to(new_buffer_pos)
-                
-                new_producer_connections = []
-                for p_node in producer_nodes:
-                    line = Line(p_node.get_center(), new_buffer.get_center(), 
-                               color=GRAY, stroke_width=1, stroke_opacity=0.3)
-                    new_producer_connections.append(line)
-                
-                new_consumer_connections = []
-                for c_node in consumer_nodes:
-                    line = Line(new_buffer.get_center(), c_node.get_center(),
-                               color=GRAY, stroke_width=1, stroke_opacity=0.3)
-                    new_consumer_connections.append(line)
-                
-                self.play(
-                    Write(upgrade_text),
-                    Create(new_buffer),
-                    *[Create(conn) for conn in new_producer_connections],
-                    *[Create(conn) for conn in new_consumer_connections],
-                    run_time=2
+                connections = self.relayout_buffer_layer(
+                    target, buffer_nodes, producer_nodes, consumer_nodes, connections, buffer_pool, packets
                 )
                 
-                buffer_added_text = Text(
-                    self.texts["buffer_added"],
+                buffer_added_text = cached_text(
+                    self.texts["buffer_added" if growing else "buffer_removed"],
                     font_size=24,
                     color=GREEN,
                     weight=BOLD
                 )
-                buffer_added_text.next_to(new_buffer, DOWN, buff=0.3)
-                self.play(Write(buffer_added_text), run_time=0.5)
-                
-                buffer_nodes.append(new_buffer)
-                connections.extend(new_producer_connections)
-                connections.extend(new_consumer_connections)
-                
-                buffer_counts.append(0)
-                buffer_visual_packets[len(buffer_nodes) - 1] = []
-                
-                new_buffer_added = True
-                dropped_before_upgrade = dropped_count
-                
+                buffer_added_text.next_to(buffer_nodes[-1], DOWN, buff=0.3)
                 self.play(
-                    buffer_label.animate.next_to(buffer_nodes[2], UP, buff=0.5),
+                    Write(buffer_added_text),
+                    buffer_label.animate.next_to(buffer_nodes[min(1, len(buffer_nodes) - 1)], UP, buff=0.5),
                     run_time=0.5
                 )
                 
+                if first_scale_cycle is None and growing:
+                    first_scale_cycle = cycle + 1
+                    dropped_before_upgrade = dropped_count
+                
                 self.wait(1)
                 self.play(
                     FadeOut(upgrade_text),
@@ -389,37 +628,42 @@ class NeuralProducerConsumerBase(Scene):
             
             self.wait(0.5)
         
-        remaining_packets = []
-        for b_idx, packets in buffer_visual_packets.items():
-            remaining_packets.extend(packets)
+        self.next_section("summary")
+        remaining_packets = buffer_pool.packets() + policy.waiting() + list(blocked_producers.values())
         
         if remaining_packets:
-            self.play(*[FadeOut(packet) for packet in remaining_packets], run_time=0.5)
+            packets.fade_out(remaining_packets)
+            self.play(packets.flow(), run_time=0.5)
         
         if dropped_count > 0:
-            if new_buffer_added:
+            if first_scale_cycle is not None:
                 stats_before = Text(
-                    f"İlk 5 döngü: {dropped_before_upgrade} paket düşürüldü" if self.language == "tr" 
-                    else f"First 5 cycles: {dropped_before_upgrade} packets dropped",
+                    self.texts["drops_before"].format(first_scale_cycle, dropped_before_upgrade),
                     font_size=22,
                     color=ORANGE,
                     weight=BOLD
                 )
                 stats_after = Text(
-                    f"Son 5 döngü: {dropped_count - dropped_before_upgrade} paket düşürüldü" if self.language == "tr"
-                    else f"Last 5 cycles: {dropped_count - dropped_before_upgrade} packets dropped",
+                    self.texts["drops_after"].format(10 - first_scale_cycle, dropped_count - dropped_before_upgrade),
                     font_size=22,
                     color=GREEN,
                     weight=BOLD
                 )
-                improvement = Text(
-                    f"Buffer eklenerek veri kaybı azaltıldı!" if self.language == "tr"
-                    else f"Buffer addition reduced data loss!",
+                improvement = cached_text(
+                    self.texts["improvement"],
                     font_size=26,
                     color=YELLOW,
                     weight=BOLD
                 )
                 
+                history = self.autoscaler.history[-10:]
+                loss_before = (sum(load.dropped for load in history[:first_scale_cycle])
+                               / max(1, sum(load.arrived for load in history[:first_scale_cycle])))
+                loss_after = (sum(load.dropped for load in history[first_scale_cycle:])
+                              / max(1, sum(load.arrived for load in history[first_scale_cycle:])))
+                if loss_after >= loss_before:
+                    improvement = VGroup()
+                
                 stats_group = VGroup(stats_before, stats_after, improvement).arrange(DOWN, buff=0.3)
                 stats_group.move_to(ORIGIN)
                 
@@ -438,7 +682,9 @@ class NeuralProducerConsumerBase(Scene):
                 self.wait(1)
                 self.play(FadeOut(stats_text))
         
-        end_text = Text(
+        self.show_policy_comparison()
+        
+        end_text = cached_text(
             self.texts["end_text"],
             font_size=36,
             color=GOLD,
@@ -446,10 +692,13 @@ class NeuralProducerConsumerBase(Scene):
         )
         end_text.to_edge(DOWN, buff=0.5)
         
+        self.next_section("node_pulse")
         for node_group in [producer_nodes, buffer_nodes, consumer_nodes]:
-            for node in node_group:
-                self.play(node.animate.scale(1.2).set_stroke(GOLD, width=3), run_time=0.1)
-                self.play(node.animate.scale(1/1.2).set_stroke(node.color, width=1), run_time=0.1)
+            # Pulse node by node on small layers; large layers pulse together in one play per step
+            pulse_groups = [[node] for node in node_group] if len(node_group) <= 8 else [node_group]
+            for nodes in pulse_groups:
+                self.play(*[node.animate.scale(1.2).set_stroke(GOLD, width=3) for node in nodes], run_time=0.1)
+                self.play(*[node.animate.scale(1/1.2).set_stroke(node.color, width=1) for node in nodes], run_time=0.1)
         
         self.play(Write(end_text))
         self.wait(2)
@@ -459,4 +708,129 @@ class NeuralProducerConsumer(NeuralProducerConsumerBase):
     """Neural Producer-Consumer animation for video rendering"""
     
     def __init__(self, language="tr", **kwargs):
-        super().__init__(language=language, **kwargs)
\ No newline at end of file
+        super().__init__(language=language, **kwargs)
+
+
+class NeuralProducerConsumerLarge(NeuralProducerConsumerBase):
+    """Neural Producer-Consumer with 50 nodes per layer, drawn through a vectorized connection mesh"""
+    
+    def __init__(self, language="tr", **kwargs):
+        kwargs.setdefault("producers", 50)
+        kwargs.setdefault("buffers", 50)
+        kwargs.setdefault("consumers", 50)
+        kwargs.setdefault("packet_labels", False)
+        super().__init__(language=language, **kwargs)
+
+
+class NeuralCapacityPlanning(NeuralProducerConsumerBase):
+    """Drop-rate and utilization curves of the buffer layer from a Monte Carlo capacity sweep"""
+    
+    def __init__(self, language="tr", produce_rates=(0.5, 0.75, 1.0), consume_rate=1.0,
+                 buffer_counts=range(1, 9), capacities=(1, 2, 4), cycles=2000, sweep_seeds=64, **kwargs):
+        super().__init__(language=language, **kwargs)
+        self.sweep_kwargs = dict(
+            produce_rates=produce_rates,
+            consume_rates=(consume_rate,),
+            buffer_counts=buffer_counts,
+            capacities=capacities,
+            producers=self.num_producers,
+            consumers=self.num_consumers,
+            cycles=cycles,
+            seeds=sweep_seeds,
+            seed=self.seed if self.seed is not None else 0,
+        )
+    
+    def sweep_curves(self, axes, metric, rate_index, colors):
+        """One line graph per capacity for a metric array of the sweep result"""
+        return VGroup(*[
+            axes.plot_line_graph(
+                self.result.buffer_counts,
+                metric[rate_index, 0, :, c],
+                line_color=color,
+                add_vertex_dots=True,
+                vertex_dot_radius=0.05,
+                vertex_dot_style=dict(fill_color=color),
+                stroke_width=3
+            )
+            for c, color in enumerate(colors)
+        ])
+    
+    def construct(self):
+        self.camera.background_color = self.background_color
+        self.result = sweep(**self.sweep_kwargs)
+        self.next_section("intro")
+        
+        title = cached_text(self.texts["sweep_title"], font_size=36, weight=BOLD, color=WHITE)
+        title.to_edge(UP, buff=0.3)
+        self.play(Write(title))
+        
+        max_buffers = int(self.result.buffer_counts.max())
+        axes = Axes(
+            x_range=[0, max_buffers + 1, 1],
+            y_range=[0, 1, 0.25],
+            x_length=9,
+            y_length=4.5,
+            axis_config={"color": BLUE_B, "include_numbers": True, "font_size": 24},
+            y_axis_config={"decimal_number_config": {"num_decimal_places": 2}},
+        )
+        axes.shift(DOWN * 0.3 + LEFT * 0.8)
+        
+        x_label = cached_text(self.texts["buffers_axis"], font_size=24, color=WHITE)
+        x_label.next_to(axes.x_axis, DOWN, buff=0.4)
+        y_label = cached_text(self.texts["drop_rate_axis"], font_size=24, color=WHITE)
+        y_label.rotate(PI / 2).next_to(axes.y_axis, LEFT, buff=0.4)
+        
+        colors = [BLUE, GREEN, YELLOW, ORANGE, RED, PURPLE]
+        colors = [colors[c % len(colors)] for c in range(len(self.result.capacities))]
+        legend = text_layer(VGroup(*[
+            VGroup(
+                Line(ORIGIN, RIGHT * 0.4, color=color, stroke_width=4),
+                cached_text(self.texts["capacity_legend"].format(int(capacity)), font_size=20, color=color)
+            ).arrange(RIGHT, buff=0.15)
+            for capacity, color in zip(self.result.capacities, colors)
+        ]).arrange(DOWN, aligned_edge=LEFT, buff=0.2))
+        legend.next_to(axes, RIGHT, buff=0.3)
+        
+        footer = cached_text(
+            self.texts["sweep_footer"].format(
+                self.result.drop_rate.size, self.sweep_kwargs["seeds"], self.sweep_kwargs["cycles"]
+            ),
+            font_size=18,
+            color=GRAY
+        )
+        footer.to_edge(DOWN, buff=0.2)
+        
+        self.play(Create(axes), Write(x_label), Write(y_label), FadeIn(legend), FadeIn(footer), run_time=1.5)
+        
+        load_text = cached_text(
+            self.texts["load_label"].format(self.result.produce_rates[0]), font_size=22, color=GOLD
+        )
+        load_text.next_to(title, DOWN, buff=0.2)
+        curves = self.sweep_curves(axes, self.result.drop_rate, 0, colors)
+        self.play(Write(load_text), LaggedStart(*[Create(curve) for curve in curves], lag_ratio=0.3), run_time=2)
+        self.wait(1)
+        
+        for rate_index in range(1, len(self.result.produce_rates)):
+            self.next_section(f"load_{rate_index + 1}")
+            new_load_text = cached_text(
+                self.texts["load_label"].format(self.result.produce_rates[rate_index]), font_size=22, color=GOLD
+            )
+            new_load_text.move_to(load_text)
+            self.play(
+                Transform(curves, self.sweep_curves(axes, self.result.drop_rate, rate_index, colors)),
+                Transform(load_text, new_load_text),
+                run_time=1.5
+            )
+            self.wait(1)
+        
+        self.next_section("utilization")
+        utilization_label = cached_text(self.texts["utilization_axis"], font_size=24, color=WHITE)
+        utilization_label.rotate(PI / 2).move_to(y_label)
+        self.play(
+            Transform(curves, self.sweep_curves(axes, self.result.utilization, -1, colors)),
+            Transform(y_label, utilization_label),
+            run_time=1.5
+        )
+        self.wait(2)
+        
+        self.play(*[FadeOut(mob) for mob in self.mobjects])
@@ -0,0 +1,56 @@
+"""
+Fixed-width numeric readout that swaps pre-rendered glyphs instead of re-laying out text
+"""
+
+import numpy as np
+from manim import WHITE, VectorizedPoint, VGroup
+
+from text_cache import cached_text
+
+
+GLYPHS = "0123456789.-"
+
+
+class NumericReadout(VGroup):
+    """Right-aligned number display whose per-frame update only touches the characters that changed"""
+
+    def __init__(self, value=0, num_decimal_places=2, width=5, suffix="",
+                 font_size=24, font="monospace", color=WHITE, **kwargs):
+        super().__init__(**kwargs)
+        self.format_string = f"{{:>{width}.{num_decimal_places}f}}"
+        self.num_chars = width
+
+        # Every row is laid out as "8" + glyph * width + suffix in a monospace font, so all rows
+        # share one bounding box and glyph i of every row sits exactly in character slot i.
+        self.glyph_points = {}
+        for char in GLYPHS:
+            row = cached_text("8" + char * width + suffix, font_size=font_size, font=font, color=color)
+            self.glyph_points[char] = [glyph.points.copy() for glyph in row[1:width + 1]]
+        self.glyph_points[" "] = [np.zeros((0, 3))] * width
+
+        self.slots = VGroup(*[glyph.copy() for glyph in row[1:width + 1]])
+        for slot in self.slots:
+            slot.set_points(np.zeros((0, 3)))
+        self.suffix = VGroup(*[glyph.copy() for glyph in row[width + 1:]])
+
+        self.anchor_origin = row[1].get_center()
+        self.anchor = VectorizedPoint(self.anchor_origin)
+        self.add(self.anchor, self.slots, self.suffix)
+
+        self.current_text = " " * width
+        self.set_value(value)
+
+    def set_value(self, value):
+        """Show value, rewriting only the slots whose character changed"""
+        text = self.format_string.format(value)
+        if len(text) > self.num_chars:
+            raise ValueError(f"{text!r} does not fit in {self.num_chars} characters")
+        if text == self.current_text:
+            return self
+
+        offset = self.anchor.get_center() - self.anchor_origin
+        for i, (old, new) in enumerate(zip(self.current_text, text)):
+            if old != new:
+                self.slots[i].set_points(self.glyph_points[new][i] + offset)
+        self.current_text = text
+        return self
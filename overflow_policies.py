@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Overflow policies for the neural buffer layer, with per-packet loss and latency accounting
+"""
+
+import argparse
+import random
+from collections import deque, namedtuple
+
+from buffer_pool import BufferPool
+from queue_simulation import percentile
+
+
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+BLOCK_PRODUCER = "block_producer"
+SPILL = "spill"
+
+# Outcome of offering one packet to the buffer layer. buffer is where it was stored (None if it was
+# not); dropped is the packet that went to the garbage collector, which is the offered packet for
+# drop-newest and an older buffered one for drop-oldest.
+Admission = namedtuple("Admission", "buffer dropped blocked spilled")
+
+PolicyStats = namedtuple("PolicyStats", "policy produced delivered dropped loss latency_p50 latency_p95 latency_p99")
+
+
+class OverflowPolicy:
+    """Drop-newest: a packet that finds every buffer full goes straight to the garbage collector"""
+
+    name = DROP_NEWEST
+
+    def admit(self, pool, rng, packet):
+        index = pool.put(rng, packet)
+        if index is not None:
+            return Admission(index, None, False, False)
+        return self.overflow(pool, rng, packet)
+
+    def overflow(self, pool, rng, packet):
+        return Admission(None, packet, False, False)
+
+    def take(self, pool, rng):
+        """(buffer index or None for the overflow tier, packet), or None when nothing is waiting"""
+        return pool.take(rng)
+
+    def promote(self, pool, rng):
+        """Move waiting overflow packets into free buffer slots; returns (packet, buffer index) pairs"""
+        return []
+
+    def waiting(self):
+        return []
+
+
+class DropOldest(OverflowPolicy):
+    """Evict the oldest packet of a random full buffer to make room for the new one"""
+
+    name = DROP_OLDEST
+
+    def overflow(self, pool, rng, packet):
+        replaced = pool.replace_oldest(rng, packet)
+        if replaced is None:
+            return Admission(None, packet, False, False)
+        index, oldest = replaced
+        return Admission(index, oldest, False, False)
+
+
+class BlockProducer(OverflowPolicy):
+    """Backpressure: the producer holds its packet and retries next cycle instead of producing"""
+
+    name = BLOCK_PRODUCER
+
+    def overflow(self, pool, rng, packet):
+        return Admission(None, None, True, False)
+
+
+class SpillToOverflow(OverflowPolicy):
+    """Park packets in a slower FIFO overflow tier and promote them as buffer slots free up"""
+
+    name = SPILL
+
+    def __init__(self, spill_capacity=16):
+        self.spill_capacity = spill_capacity
+        self.spilled = deque()
+
+    def overflow(self, pool, rng, packet):
+        if len(self.spilled) >= self.spill_capacity:
+            return Admission(None, packet, False, False)
+        self.spilled.append(packet)
+        return Admission(None, None, False, True)
+
+    def take(self, pool, rng):
+        taken = pool.take(rng)
+        if taken is None and self.spilled:
+            return None, self.spilled.popleft()
+        return taken
+
+    def promote(self, pool, rng):
+        promoted = []
+        while self.spilled and pool.free:
+            packet = self.spilled.popleft()
+            promoted.append((packet, pool.put(rng, packet)))
+        return promoted
+
+    def waiting(self):
+        return list(self.spilled)
+
+
+POLICIES = {
+    DROP_NEWEST: OverflowPolicy,
+    DROP_OLDEST: DropOldest,
+    BLOCK_PRODUCER: BlockProducer,
+    SPILL: SpillToOverflow,
+}
+
+
+def make_policy(name, **kwargs):
+    try:
+        return POLICIES[name](**kwargs)
+    except KeyError:
+        raise ValueError(f"Unknown overflow policy {name!r}; choose from {', '.join(POLICIES)}") from None
+
+
+class LatencyTracker:
+    """Enqueue and dequeue timestamps of every packet, for loss and queueing-latency percentiles"""
+
+    def __init__(self):
+        self.enqueued_at = {}
+        self.latencies = []
+        self.produced = 0
+        self.dropped = 0
+
+    def enqueue(self, packet, now):
+        self.enqueued_at[packet] = now
+        self.produced += 1
+
+    def dequeue(self, packet, now):
+        self.latencies.append(now - self.enqueued_at.pop(packet))
+
+    def drop(self, packet):
+        self.enqueued_at.pop(packet, None)
+        self.dropped += 1
+
+    def stats(self, policy):
+        latencies = sorted(self.latencies)
+        return PolicyStats(
+            policy=policy,
+            produced=self.produced,
+            delivered=len(latencies),
+            dropped=self.dropped,
+            loss=self.dropped / self.produced if self.produced else 0.0,
+            latency_p50=percentile(latencies, 0.50),
+            latency_p95=percentile(latencies, 0.95),
+            latency_p99=percentile(latencies, 0.99),
+        )
+
+
+def simulate_policy(policy, producers=4, consumers=3, buffers=4, capacity=1, cycles=2000, seed=0,
+                    autoscaler=None):
+    """Run the neural scene's cycle model headless under one overflow policy.
+
+    Each cycle between half and all producers that are not blocked emit a packet, and with
+    probability 0.7 a random number of consumers each take one. Latency is measured in cycles from
+    production to consumption, so backpressure and spilling show up as latency instead of loss.
+
+    With an autoscaler (see buffer_autoscaler), a fresh copy of it resizes the layer after every
+    cycle as in the scene, starting from buffers.
+    """
+    if isinstance(policy, str):
+        policy = make_policy(policy)
+    if autoscaler is not None:
+        autoscaler = autoscaler.fresh()
+    rng = random.Random(seed)
+    pool = BufferPool(buffers, capacity)
+    tracker = LatencyTracker()
+    blocked = {}
+    next_packet = 0
+
+    for now in range(cycles):
+        ready = [p for p in range(producers) if p not in blocked]
+        active = rng.sample(ready, k=rng.randint(min(len(ready), max(1, producers // 2)), len(ready)))
+
+        taken = []
+        waiting = pool.total + len(policy.waiting())
+        if waiting and rng.random() > 0.3:
+            for _ in range(min(waiting, rng.randint(1, consumers))):
+                item = policy.take(pool, rng)
+                if item is None:
+                    break
+                taken.append(item)
+
+        offers = list(blocked.items())
+        blocked.clear()
+        for producer in active:
+            tracker.enqueue(next_packet, now)
+            offers.append((producer, next_packet))
+            next_packet += 1
+
+        overflowed = 0
+        for producer, packet in offers:
+            admission = policy.admit(pool, rng, packet)
+            if admission.dropped is not None:
+                tracker.drop(admission.dropped)
+            if admission.blocked:
+                blocked[producer] = packet
+            if admission.buffer is None or admission.dropped is not None:
+                overflowed += 1
+
+        for index, packet in taken:
+            if index is not None:
+                pool.release(index)
+            tracker.dequeue(packet, now)
+        policy.promote(pool, rng)
+
+        if autoscaler is not None:
+            autoscaler.observe(len(pool), len(active), overflowed, pool.total, len(pool) * capacity)
+            target = autoscaler.target(len(pool))
+            while len(pool) > target and pool.remove_buffer() is not None:
+                pass
+            while len(pool) < target:
+                pool.add_buffer()
+
+    return tracker.stats(policy.name)
+
+
+def compare_policies(policies=tuple(POLICIES), **kwargs):
+    """simulate_policy for each policy with the same seed and layer"""
+    return [simulate_policy(name, **kwargs) for name in policies]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--policies", nargs="+", choices=list(POLICIES), default=list(POLICIES))
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--consumers", type=int, default=3)
+    parser.add_argument("--buffers", type=int, default=4)
+    parser.add_argument("--capacity", type=int, default=1)
+    parser.add_argument("--cycles", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'policy':<16}{'produced':>10}{'dropped':>10}{'loss':>9}{'p50':>7}{'p95':>7}{'p99':>7}  (cycles)")
+    for stats in compare_policies(args.policies, producers=args.producers, consumers=args.consumers,
+                                  buffers=args.buffers, capacity=args.capacity, cycles=args.cycles,
+                                  seed=args.seed):
+        print(f"{stats.policy:<16}{stats.produced:>10}{stats.dropped:>10}{stats.loss:>9.2%}"
+              f"{stats.latency_p50:>7}{stats.latency_p95:>7}{stats.latency_p99:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Array-backed particle system that draws many data packets as a handful of mobjects
+"""
+
+import numpy as np
+from manim import BOLD, PURPLE, WHITE, Animation, Circle, VGroup, VMobject
+
+from text_cache import cached_text
+
+
+class PacketParticles(VGroup):
+    """Every in-flight packet as rows of position, size, colour and opacity arrays.
+
+    Packets that share a colour and quantized opacity are drawn as disjoint circles of one VMobject,
+    so a frame costs one array expression plus one set_points per style, however many packets are in
+    flight. Value labels are optional Text mobjects that follow their packet; turn them off for
+    scenes with hundreds of packets.
+    """
+
+    def __init__(self, radius=0.25, fill_opacity=0.9, stroke_width=2, labels=True,
+                 label_style=None, opacity_levels=21, capacity=64, **kwargs):
+        super().__init__(**kwargs)
+        self.radius = radius
+        self.fill_opacity = fill_opacity
+        self.packet_stroke_width = stroke_width
+        self.show_labels = labels
+        self.label_style = label_style or dict(font_size=18, color=WHITE, weight=BOLD)
+        self.opacity_levels = opacity_levels
+        self.template = Circle(radius=1).points.copy()
+
+        self.palette = []
+        self.labels = {}
+        self.style_groups = {}
+        self.alive = np.zeros(0, dtype=bool)
+        self.free = []
+        self.grow(capacity)
+
+    def grow(self, capacity):
+        """Resize every per-packet array to hold capacity packets"""
+        old = len(self.alive)
+        arrays = {
+            "positions": (3,), "sizes": (), "opacities": (), "colors": (),
+            "start_positions": (3,), "start_sizes": (), "start_opacities": (),
+            "target_positions": (3,), "target_sizes": (), "target_opacities": (),
+        }
+        for name, shape in arrays.items():
+            grown = np.zeros((capacity,) + shape, dtype=np.int64 if name == "colors" else float)
+            if old:
+                grown[:old] = getattr(self, name)
+            setattr(self, name, grown)
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:old] = self.alive
+        self.alive = alive
+        self.free.extend(range(capacity - 1, old - 1, -1))
+
+    def color_index(self, color):
+        if color not in self.palette:
+            self.palette.append(color)
+        return self.palette.index(color)
+
+    def alive_ids(self):
+        return np.flatnonzero(self.alive)
+
+    def spawn(self, positions, values=None, color=PURPLE):
+        """Add packets at positions, invisible until the next flow fades them in; returns their ids"""
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        if len(self.free) < len(positions):
+            self.grow(max(2 * len(self.alive), len(self.alive) + len(positions)))
+        ids = np.array([self.free.pop() for _ in positions], dtype=np.int64)
+
+        self.alive[ids] = True
+        self.positions[ids] = self.target_positions[ids] = positions
+        self.sizes[ids] = self.target_sizes[ids] = self.radius
+        self.opacities[ids] = 0
+        self.target_opacities[ids] = 1
+        self.colors[ids] = self.color_index(color)
+
+        if self.show_labels and values is not None:
+            for packet_id, value, position in zip(ids, values, positions):
+                label = cached_text(str(value), **self.label_style)
+                label.move_to(position).set_opacity(0)
+                label.base_height = label.height
+                self.labels[packet_id] = label
+        self.render()
+        return ids
+
+    def send(self, ids, positions, scale=None):
+        """Move packets to positions on the next flow, optionally scaling them"""
+        ids = np.asarray(ids, dtype=np.int64)
+        self.target_positions[ids] = np.asarray(positions, dtype=float).reshape(-1, 3)
+        if scale is not None:
+            self.target_sizes[ids] = self.sizes[ids] * scale
+        return self
+
+    def fade_out(self, ids):
+        """Fade packets out on the next flow and free their slots once it finishes"""
+        self.target_opacities[np.asarray(ids, dtype=np.int64)] = 0
+        return self
+
+    def flow(self, **kwargs):
+        return PacketFlow(self, **kwargs)
+
+    def begin_flow(self):
+        self.start_positions[:] = self.positions
+        self.start_sizes[:] = self.sizes
+        self.start_opacities[:] = self.opacities
+
+    def set_progress(self, alpha):
+        """Place every packet alpha of the way from its start to its target state"""
+        self.positions[:] = self.start_positions + alpha * (self.target_positions - self.start_positions)
+        self.sizes[:] = self.start_sizes + alpha * (self.target_sizes - self.start_sizes)
+        self.opacities[:] = self.start_opacities + alpha * (self.target_opacities - self.start_opacities)
+        return self.render()
+
+    def finish_flow(self):
+        """Release packets that faded out"""
+        finished = np.flatnonzero(self.alive & (self.target_opacities == 0))
+        self.alive[finished] = False
+        self.free.extend(finished.tolist())
+        for packet_id in finished:
+            self.labels.pop(packet_id, None)
+        return self.render()
+
+    def render(self):
+        """Rebuild the per-style circle meshes from the arrays"""
+        levels = self.opacity_levels - 1
+        ids = np.flatnonzero(self.alive)
+        opacity_keys = np.round(self.opacities[ids] * levels).astype(np.int64)
+        visible = opacity_keys > 0
+        ids, opacity_keys = ids[visible], opacity_keys[visible]
+        keys = self.colors[ids] * (levels + 1) + opacity_keys
+
+        unique_keys, groups = np.unique(keys, return_inverse=True)
+        order = np.argsort(groups, kind="stable")
+        bounds = np.cumsum(np.bincount(groups, minlength=len(unique_keys)))[:-1]
+
+        filled = set()
+        for key, members in zip(unique_keys, np.split(ids[order], bounds)):
+            key = int(key)
+            group = self.style_groups.get(key)
+            if group is None:
+                color_key, opacity_key = divmod(key, levels + 1)
+                opacity = opacity_key / levels
+                group = VMobject(
+                    stroke_color=self.palette[color_key],
+                    stroke_width=self.packet_stroke_width,
+                    stroke_opacity=opacity,
+                    fill_color=self.palette[color_key],
+                    fill_opacity=self.fill_opacity * opacity,
+                )
+                self.style_groups[key] = group
+            points = self.template[None] * self.sizes[members, None, None] + self.positions[members, None]
+            group.set_points(points.reshape(-1, 3))
+            filled.add(key)
+
+        # Every style group stays attached, emptied ones without points, so the submobject list
+        # only grows when a new style first appears
+        submobjects = []
+        for key, group in self.style_groups.items():
+            if key not in filled:
+                group.clear_points()
+            submobjects.append(group)
+
+        for packet_id, label in self.labels.items():
+            height = label.base_height * self.sizes[packet_id] / self.radius
+            if height > 0:
+                label.scale_to_fit_height(height)
+            label.move_to(self.positions[packet_id])
+            label.set_opacity(self.opacities[packet_id])
+            submobjects.append(label)
+
+        self.submobjects = submobjects
+        return self
+
+
+class PacketFlow(Animation):
+    """Move, scale and fade every staged packet of a PacketParticles in one vectorized step per frame"""
+
+    def __init__(self, particles, **kwargs):
+        super().__init__(particles, **kwargs)
+
+    def create_starting_mobject(self):
+        # The start state lives in the particle arrays, so skip copying the whole mobject
+        return self.mobject
+
+    def begin(self):
+        self.mobject.begin_flow()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_progress(self.rate_func(alpha))
+
+    def finish(self):
+        super().finish()
+        self.mobject.finish_flow()
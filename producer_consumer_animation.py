@@ -1,13 +1,41 @@
 from manim import *
+from collections import deque, namedtuple
+import math
 import random
 
+from layer_compositing import text_layer
+from queue_simulation import bucket_events, simulate
+from trace_ingest import load_trace_buckets
+from text_cache import cached_text, prewarm
+
+
+# Height reserved above each box for its label, so the boxes sit in the same place in every language
+LABEL_HEIGHT = 0.35
+
+# One rendered cycle: items to produce, items to consume, whether the producer was blocked,
+# and (when replaying a trace) the queue depth the cycle must end on
+CycleStep = namedtuple("CycleStep", "produce consume blocked depth")
+
 
 class ProducerConsumerBase(Scene):
     """Base class for Producer-Consumer animation"""
     
-    def __init__(self, language="en", **kwargs):
+    def __init__(self, language="en", seed=None, ring_buffer=False, capacity=5,
+                 lod_threshold=24, produce_rate=1, consume_rate=1,
+                 trace=None, trace_path=None, trace_steps=8, trace_window=None, **kwargs):
         super().__init__(**kwargs)
         self.language = language
+        self.seed = seed
+        self.ring_buffer = ring_buffer
+        self.capacity = capacity
+        self.lod_threshold = lod_threshold
+        self.produce_rate = produce_rate
+        self.consume_rate = consume_rate
+        self.trace = trace
+        self.trace_path = trace_path
+        self.trace_steps = trace_steps
+        self.trace_window = trace_window
+        self.rng = random.Random(seed)
         self.setup_translations()
     
     def setup_translations(self):
@@ -23,7 +51,9 @@ class ProducerConsumerBase(Scene):
                 "producing": "Üretiliyor...",
                 "consuming": "Tüketiliyor...",
                 "waiting": "Bekliyor...",
-                "cycle": "Döngü {}/8",
+                "cycle": "Döngü {}/{}",
+                "head": "Baş",
+                "tail": "Son",
                 "end_text": "Döngü Tamamlandı!"
             }
         else:
@@ -37,15 +67,296 @@ class ProducerConsumerBase(Scene):
                 "producing": "Producing...",
                 "consuming": "Consuming...",
                 "waiting": "Waiting...",
-                "cycle": "Cycle {}/8",
+                "cycle": "Cycle {}/{}",
+                "head": "Head",
+                "tail": "Tail",
                 "end_text": "Cycle Complete!"
             }
     
+    def prewarm_texts(self, num_cycles):
+        """Lay out every translated label once, before the first play() call"""
+        status_style = dict(font_size=28, weight=BOLD)
+        prewarm(
+            [
+                (self.texts["title"], dict(font_size=48, weight=BOLD, color=WHITE)),
+                (self.texts["producer"], dict(color=BLUE, font_size=32, weight=BOLD)),
+                (self.texts["buffer"], dict(color=GREEN, font_size=32, weight=BOLD)),
+                (self.texts["consumer"], dict(color=RED, font_size=32, weight=BOLD)),
+                (self.texts["buffer_size"].format(self.capacity), dict(font_size=20, color=GRAY_B)),
+                (self.texts["producing"], dict(color=BLUE, **status_style)),
+                (self.texts["consuming"], dict(color=RED, **status_style)),
+                (self.texts["waiting"], dict(color=ORANGE, **status_style)),
+                (self.texts["end_text"], dict(font_size=40, color=GOLD, weight=BOLD)),
+                (self.texts["head"], dict(font_size=14, color=RED, weight=BOLD)),
+                (self.texts["tail"], dict(font_size=14, color=BLUE, weight=BOLD)),
+            ]
+            + [
+                (self.texts["current_size"].format(size), dict(font_size=24, color=YELLOW, weight=BOLD))
+                for size in range(min(self.capacity, self.lod_threshold) + 1)
+            ]
+            + [
+                (self.texts["cycle"].format(cycle + 1, num_cycles), dict(font_size=28, weight=BOLD, color=GOLD))
+                for cycle in range(num_cycles)
+            ]
+        )
+    
+    def label_box(self, label, box, center, buff=0.2):
+        """Box with its label on top, centred on center as if the label were LABEL_HEIGHT tall.
+
+        The box is placed first and the label follows it, so a taller translation (diacritics,
+        descenders) cannot shift the box and everything laid out from it.
+        """
+        box.move_to(center + DOWN * (LABEL_HEIGHT + buff) / 2)
+        label.next_to(box, UP, buff=buff)
+        return VGroup(label, box)
+    
+    def buffer_layout(self):
+        """Rows, columns and spacing of the buffer slots for the configured capacity"""
+        if self.ring_buffer and self.capacity <= 5:
+            return 1, self.capacity, 0.62
+        cols = math.ceil(math.sqrt(self.capacity))
+        rows = math.ceil(self.capacity / cols)
+        return rows, cols, min(0.7, 2.9 / max(rows, cols))
+    
+    def slot_position(self, buffer_box, index):
+        """Centre of buffer slot index inside the buffer box"""
+        rows, cols, spacing = self.buffer_layout()
+        row, col = divmod(index, cols)
+        x_offset = (col - (cols - 1) / 2) * spacing
+        y_offset = ((rows - 1) / 2 - row) * spacing
+        return buffer_box.get_center() + RIGHT * x_offset + UP * y_offset
+    
+    def create_data_item(self, value, scale=1):
+        """Create a numbered data item; scale shrinks it for dense buffer grids"""
+        data_item = Circle(radius=0.25 * scale, color=BLUE_C, fill_opacity=0.8, stroke_width=2)
+        data_text = cached_text(str(value), font_size=20 * scale, color=WHITE, weight=BOLD)
+        if data_text.width > 1.6 * data_item.radius:
+            data_text.scale_to_fit_width(1.6 * data_item.radius)
+        data_text.move_to(data_item.get_center())
+        return VGroup(data_item, data_text)
+    
+    def create_occupancy_bar(self, buffer_box):
+        """Aggregated buffer view for large capacities: a fill bar driven by a level tracker"""
+        level = ValueTracker(0)
+        outline = Rectangle(width=2.8, height=0.5, color=GRAY_B, stroke_width=2)
+        outline.move_to(buffer_box.get_center())
+        fill = Rectangle(width=2.8, height=0.5, stroke_width=0, fill_color=GREEN, fill_opacity=0.8)
+        fill.move_to(outline.get_center())
+        
+        def update_fill(mob):
+            fraction = level.get_value()
+            mob.stretch_to_fit_width(max(fraction, 0.001) * outline.width)
+            mob.align_to(outline, LEFT)
+            mob.set_fill(interpolate_color(GREEN, RED, fraction))
+        
+        fill.add_updater(update_fill)
+        return VGroup(fill, outline), level
+    
+    def create_pointer(self, label, color, above):
+        """Create a ring buffer pointer that points at a slot from above or below"""
+        arrow = Triangle(color=color, fill_color=color, fill_opacity=1, stroke_width=0).scale(0.08)
+        text = cached_text(label, font_size=14, color=color, weight=BOLD)
+        # The arrow's offset depends on the label's height, so the whole pointer is text layer
+        if above:
+            arrow.rotate(PI)
+            return text_layer(VGroup(text, arrow).arrange(DOWN, buff=0.05))
+        return text_layer(VGroup(arrow, text).arrange(DOWN, buff=0.05))
+    
+    def pointer_position(self, pointer, slot_center, above):
+        """Centre for a pointer so its tip sits just outside the slot at slot_center"""
+        offset = 0.3 + pointer.height / 2
+        return slot_center + (UP if above else DOWN) * offset
+    
+    def scripted_steps(self):
+        """The built-in story: produce every cycle, consume on every second cycle"""
+        return [
+            CycleStep(self.produce_rate, self.consume_rate if cycle % 2 == 1 else 0, False, None)
+            for cycle in range(8)
+        ]
+    
+    def replay_steps(self):
+        """Cycles replayed from an event trace or trace file, one time bucket per cycle"""
+        start, end = self.trace_window or (None, None)
+        if self.trace_path is not None:
+            initial_depth, buckets = load_trace_buckets(self.trace_path, self.trace_steps, start, end)
+        else:
+            initial_depth, buckets = bucket_events(self.trace, self.trace_steps, start, end)
+        steps = [
+            CycleStep(bucket.enqueued, bucket.dequeued, bucket.blocked_puts > 0, bucket.depth)
+            for bucket in buckets
+        ]
+        return min(initial_depth, self.capacity), steps
+    
+    def prefill_buffer(self, amount):
+        """Show the buffer already holding amount items, e.g. at the start of a trace window"""
+        if amount <= 0:
+            return
+        self.count = amount
+        if self.use_lod:
+            self.play(self.occupancy.animate.set_value(amount / self.capacity), run_time=0.5)
+        else:
+            for index in range(amount):
+                data_group = self.create_data_item(self.rng.randint(1, 99), self.item_scale)
+                data_group.move_to(self.slot_position(self.buffer_box, index))
+                self.buffer_items.append(data_group)
+            animations = [FadeIn(item) for item in self.buffer_items]
+            if self.ring_buffer:
+                self.tail = amount % self.capacity
+                next_tail = self.slot_position(self.buffer_box, self.tail)
+                animations.append(self.tail_pointer.animate.move_to(
+                    self.pointer_position(self.tail_pointer, next_tail, above=True)))
+            self.play(*animations, run_time=0.5)
+        self.update_count_text()
+    
+    def setup_buffer_view(self):
+        """Add per-item slots (and ring pointers) or the aggregated occupancy bar to the buffer"""
+        self.buffer_items = deque()
+        self.count = 0
+        self.head = 0
+        self.tail = 0
+        self.use_lod = self.capacity > self.lod_threshold
+        self.item_scale = self.buffer_layout()[2] / 0.7
+        
+        if self.use_lod:
+            occupancy_bar, self.occupancy = self.create_occupancy_bar(self.buffer_box)
+            self.play(FadeIn(occupancy_bar), run_time=0.5)
+        elif self.ring_buffer:
+            slot_outlines = VGroup(*[
+                Circle(radius=0.27 * self.item_scale, color=GRAY, stroke_width=1.5, stroke_opacity=0.6)
+                .move_to(self.slot_position(self.buffer_box, i))
+                for i in range(self.capacity)
+            ])
+            self.head_pointer = self.create_pointer(self.texts["head"], RED, above=False)
+            self.head_pointer.move_to(self.pointer_position(
+                self.head_pointer, self.slot_position(self.buffer_box, self.head), above=False))
+            self.tail_pointer = self.create_pointer(self.texts["tail"], BLUE, above=True)
+            self.tail_pointer.move_to(self.pointer_position(
+                self.tail_pointer, self.slot_position(self.buffer_box, self.tail), above=True))
+            self.play(Create(slot_outlines), FadeIn(self.head_pointer), FadeIn(self.tail_pointer), run_time=0.5)
+    
+    def update_count_text(self):
+        """Swap the "Current: N" label for the current buffer count"""
+        new_count_text = cached_text(
+            self.texts["current_size"].format(self.count), 
+            font_size=24, 
+            color=YELLOW,
+            weight=BOLD
+        )
+        new_count_text.move_to(self.buffer_current_text.get_center())
+        self.play(Transform(self.buffer_current_text, new_count_text), run_time=0.3)
+    
+    def produce_step(self, amount, blocked=False):
+        """Animate up to amount items entering the buffer, or the producer waiting if it is full"""
+        free = self.capacity - self.count
+        if free == 0 or (amount == 0 and blocked):
+            wait_text = cached_text(self.texts["waiting"], color=ORANGE, font_size=28, weight=BOLD)
+            wait_text.next_to(self.producer_group, UP, buff=0.3)
+            self.play(Write(wait_text), run_time=0.5)
+            self.wait(0.5)
+            self.play(FadeOut(wait_text), run_time=0.3)
+            return 0
+        
+        produced = min(amount, free)
+        if produced == 0:
+            return 0
+        
+        self.play(Write(self.producer_status), run_time=0.5)
+        
+        if self.use_lod:
+            batch = self.create_data_item(f"+{produced}")
+            batch.move_to(self.producer_box.get_center())
+            self.play(Create(batch), run_time=0.4)
+            self.count += produced
+            self.play(
+                batch.animate.scale(0.5).move_to(self.buffer_box.get_center()),
+                self.occupancy.animate.set_value(self.count / self.capacity),
+                run_time=0.6
+            )
+            self.remove(batch)
+        else:
+            new_items = []
+            for _ in range(produced):
+                data_group = self.create_data_item(self.rng.randint(1, 99), self.item_scale)
+                data_group.move_to(self.producer_box.get_center())
+                new_items.append(data_group)
+            
+            self.play(*[Create(item) for item in new_items], run_time=0.4)
+            
+            moves = []
+            for data_group in new_items:
+                if self.ring_buffer:
+                    moves.append(data_group.animate.move_to(self.slot_position(self.buffer_box, self.tail)))
+                    self.tail = (self.tail + 1) % self.capacity
+                else:
+                    moves.append(data_group.animate.move_to(
+                        self.slot_position(self.buffer_box, len(self.buffer_items))))
+                self.buffer_items.append(data_group)
+            if self.ring_buffer:
+                next_tail = self.slot_position(self.buffer_box, self.tail)
+                moves.append(self.tail_pointer.animate.move_to(
+                    self.pointer_position(self.tail_pointer, next_tail, above=True)))
+            self.play(*moves, run_time=0.6)
+            self.count += produced
+        
+        self.update_count_text()
+        self.play(FadeOut(self.producer_status), run_time=0.3)
+        return produced
+    
+    def consume_step(self, amount):
+        """Animate up to amount items leaving the buffer for the consumer"""
+        consumed = min(amount, self.count)
+        if consumed <= 0:
+            return 0
+        
+        consumer_status_active = cached_text(self.texts["consuming"], color=RED, font_size=28, weight=BOLD)
+        consumer_status_active.next_to(self.consumer_group, UP, buff=0.3)
+        self.play(Write(consumer_status_active), run_time=0.5)
+        
+        self.count -= consumed
+        
+        if self.use_lod:
+            batch = self.create_data_item(f"-{consumed}")
+            batch.scale(0.5).move_to(self.buffer_box.get_center())
+            self.add(batch)
+            self.play(
+                batch.animate.scale(2).move_to(self.consumer_box.get_center()),
+                self.occupancy.animate.set_value(self.count / self.capacity),
+                run_time=0.6
+            )
+            self.play(FadeOut(batch), run_time=0.4)
+        else:
+            to_consume = [self.buffer_items.popleft() for _ in range(consumed)]
+            moves = [item.animate.move_to(self.consumer_box.get_center()) for item in to_consume]
+            if self.ring_buffer:
+                self.head = (self.head + consumed) % self.capacity
+                next_head = self.slot_position(self.buffer_box, self.head)
+                moves.append(self.head_pointer.animate.move_to(
+                    self.pointer_position(self.head_pointer, next_head, above=False)))
+            self.play(*moves, run_time=0.6)
+            self.play(*[FadeOut(item) for item in to_consume], run_time=0.4)
+            
+            if not self.ring_buffer:
+                shifts = [
+                    item.animate.move_to(self.slot_position(self.buffer_box, i))
+                    for i, item in enumerate(self.buffer_items)
+                ]
+                if shifts:
+                    self.play(*shifts, run_time=0.3)
+        
+        self.update_count_text()
+        self.play(FadeOut(consumer_status_active), run_time=0.3)
+        return consumed
+    
     def construct(self):
         self.camera.background_color = "#1a1a1a"
-        
+        if self.trace is not None or self.trace_path is not None:
+            initial_depth, steps = self.replay_steps()
+        else:
+            initial_depth, steps = 0, self.scripted_steps()
+        self.prewarm_texts(len(steps))
+        self.next_section("intro")
 
-        title = Text(self.texts["title"], font_size=48, weight=BOLD, color=WHITE).to_edge(UP, buff=0.3)
+        title = cached_text(self.texts["title"], font_size=48, weight=BOLD, color=WHITE).to_edge(UP, buff=0.3)
         
         lang_text = "TR | Türkçe" if self.language == "tr" else "EN | English"
         lang_indicator = Text(
@@ -63,7 +374,7 @@ class ProducerConsumerBase(Scene):
             fill_opacity=0.2,
             stroke_width=2
         )
-        lang_group = VGroup(lang_box, lang_indicator).arrange(ORIGIN)
+        lang_group = text_layer(VGroup(lang_box, lang_indicator).arrange(ORIGIN))
         lang_group.to_corner(UR, buff=0.2)
         
         self.play(
@@ -83,9 +394,8 @@ class ProducerConsumerBase(Scene):
             fill_opacity=0.1,
             stroke_width=3
         )
-        producer_text = Text(self.texts["producer"], color=BLUE, font_size=32, weight=BOLD)
-        producer_group = VGroup(producer_text, producer_box).arrange(DOWN, buff=0.2)
-        producer_group.move_to(LEFT * 4.5 + UP * main_y)
+        producer_text = cached_text(self.texts["producer"], color=BLUE, font_size=32, weight=BOLD)
+        producer_group = self.label_box(producer_text, producer_box, LEFT * 4.5 + UP * main_y)
         
         buffer_box = RoundedRectangle(
             corner_radius=0.15,
@@ -96,13 +406,12 @@ class ProducerConsumerBase(Scene):
             fill_opacity=0.1,
             stroke_width=3
         )
-        buffer_text = Text(self.texts["buffer"], color=GREEN, font_size=32, weight=BOLD)
-        buffer_size_text = Text(self.texts["buffer_size"].format(5), font_size=20, color=GRAY_B)
-        buffer_current_text = Text(self.texts["current_size"].format(0), font_size=24, color=YELLOW, weight=BOLD)
+        buffer_text = cached_text(self.texts["buffer"], color=GREEN, font_size=32, weight=BOLD)
+        buffer_size_text = cached_text(self.texts["buffer_size"].format(self.capacity), font_size=20, color=GRAY_B)
+        buffer_current_text = cached_text(self.texts["current_size"].format(0), font_size=24, color=YELLOW, weight=BOLD)
         
         buffer_info = VGroup(buffer_size_text, buffer_current_text).arrange(DOWN, buff=0.1)
-        buffer_group = VGroup(buffer_text, buffer_box).arrange(DOWN, buff=0.2)
-        buffer_group.move_to(UP * main_y)
+        buffer_group = self.label_box(buffer_text, buffer_box, UP * main_y)
         buffer_info.next_to(buffer_box, DOWN, buff=0.2)
         
         consumer_box = RoundedRectangle(
@@ -114,9 +423,8 @@ class ProducerConsumerBase(Scene):
             fill_opacity=0.1,
             stroke_width=3
         )
-        consumer_text = Text(self.texts["consumer"], color=RED, font_size=32, weight=BOLD)
-        consumer_group = VGroup(consumer_text, consumer_box).arrange(DOWN, buff=0.2)
-        consumer_group.move_to(RIGHT * 4.5 + UP * main_y)
+        consumer_text = cached_text(self.texts["consumer"], color=RED, font_size=32, weight=BOLD)
+        consumer_group = self.label_box(consumer_text, consumer_box, RIGHT * 4.5 + UP * main_y)
         
         self.play(
             Create(producer_group),
@@ -160,18 +468,22 @@ class ProducerConsumerBase(Scene):
         self.play(Create(arrow_p_to_b), Create(arrow_b_to_c))
         self.wait(1)
         
-        buffer_items = []
-        max_buffer_size = 5
+        self.producer_box = producer_box
+        self.buffer_box = buffer_box
+        self.consumer_box = consumer_box
+        self.producer_group = producer_group
+        self.consumer_group = consumer_group
+        self.buffer_current_text = buffer_current_text
+        self.setup_buffer_view()
+        self.prefill_buffer(initial_depth)
         
-        producer_status = Text(self.texts["producing"], color=BLUE, font_size=28, weight=BOLD)
-        producer_status.next_to(producer_group, UP, buff=0.3)
+        self.producer_status = cached_text(self.texts["producing"], color=BLUE, font_size=28, weight=BOLD)
+        self.producer_status.next_to(producer_group, UP, buff=0.3)
         
-        consumer_status = Text(self.texts["waiting"], color=RED, font_size=28, weight=BOLD)
-        consumer_status.next_to(consumer_group, UP, buff=0.3)
-        
-        for cycle in range(8):
-            cycle_text = Text(
-                self.texts["cycle"].format(cycle + 1), 
+        for cycle, step in enumerate(steps):
+            self.next_section(f"cycle_{cycle + 1}")
+            cycle_text = cached_text(
+                self.texts["cycle"].format(cycle + 1, len(steps)), 
                 font_size=28, 
                 weight=BOLD, 
                 color=GOLD
@@ -179,80 +491,20 @@ class ProducerConsumerBase(Scene):
             cycle_text.to_edge(DOWN, buff=0.5)
             self.play(Write(cycle_text), run_time=0.5)
             
-            if len(buffer_items) < max_buffer_size:
-                self.play(Write(producer_status), run_time=0.5)
-                
-                data_value = random.randint(1, 99)
-                data_item = Circle(radius=0.25, color=BLUE_C, fill_opacity=0.8, stroke_width=2)
-                data_text = Text(str(data_value), font_size=20, color=WHITE, weight=BOLD)
-                data_text.move_to(data_item.get_center())
-                data_group = VGroup(data_item, data_text)
-                data_group.move_to(producer_box.get_center())
-                
-                self.play(Create(data_group), run_time=0.4)
-                
-                rows = 2
-                cols = 3
-                index = len(buffer_items)
-                row = index // cols
-                col = index % cols
-                
-                x_offset = (col - 1) * 0.7
-                y_offset = (0.5 - row) * 0.7
-                
-                target_pos = buffer_box.get_center() + RIGHT * x_offset + UP * y_offset
-                self.play(data_group.animate.move_to(target_pos), run_time=0.6)
-                buffer_items.append(data_group)
-                
-                new_count_text = Text(
-                    self.texts["current_size"].format(len(buffer_items)), 
-                    font_size=24, 
-                    color=YELLOW,
-                    weight=BOLD
-                )
-                new_count_text.move_to(buffer_current_text.get_center())
-                self.play(Transform(buffer_current_text, new_count_text), run_time=0.3)
-                
-                self.play(FadeOut(producer_status), run_time=0.3)
-            else:
-                wait_text = Text(self.texts["waiting"], color=ORANGE, font_size=28, weight=BOLD)
-                wait_text.next_to(producer_group, UP, buff=0.3)
-                self.play(Write(wait_text), run_time=0.5)
-                self.wait(0.5)
-                self.play(FadeOut(wait_text), run_time=0.3)
+            self.produce_step(step.produce, step.blocked)
             
-            if len(buffer_items) > 0 and cycle % 2 == 1:
-                consumer_status_active = Text(self.texts["consuming"], color=RED, font_size=28, weight=BOLD)
-                consumer_status_active.next_to(consumer_group, UP, buff=0.3)
-                self.play(Write(consumer_status_active), run_time=0.5)
-                
-                data_to_consume = buffer_items.pop(0)
-                self.play(data_to_consume.animate.move_to(consumer_box.get_center()), run_time=0.6)
-                self.play(FadeOut(data_to_consume), run_time=0.4)
-                
-                for i, item in enumerate(buffer_items):
-                    row = i // cols
-                    col = i % cols
-                    x_offset = (col - 1) * 0.7
-                    y_offset = (0.5 - row) * 0.7
-                    new_pos = buffer_box.get_center() + RIGHT * x_offset + UP * y_offset
-                    self.play(item.animate.move_to(new_pos), run_time=0.3)
-                
-                new_count_text = Text(
-                    self.texts["current_size"].format(len(buffer_items)), 
-                    font_size=24, 
-                    color=YELLOW,
-                    weight=BOLD
-                )
-                new_count_text.move_to(buffer_current_text.get_center())
-                self.play(Transform(buffer_current_text, new_count_text), run_time=0.3)
-                
-                self.play(FadeOut(consumer_status_active), run_time=0.3)
+            if step.depth is None:
+                self.consume_step(step.consume)
+            else:
+                # Trace buckets are clipped to the scene's capacity, so consume whatever
+                # brings the buffer back to the depth the trace recorded
+                self.consume_step(self.count - step.depth)
             
             self.play(FadeOut(cycle_text), run_time=0.3)
             self.wait(0.3)
         
-        end_text = Text(
+        self.next_section("outro")
+        end_text = cached_text(
             self.texts["end_text"], 
             font_size=40, 
             color=GOLD, 
@@ -267,4 +519,36 @@ class ProducerConsumer(ProducerConsumerBase):
     """Producer-Consumer animation for video rendering"""
     
     def __init__(self, language="tr", **kwargs):
-        super().__init__(language=language, **kwargs)
\ No newline at end of file
+        super().__init__(language=language, **kwargs)
+
+
+class ProducerConsumerRing(ProducerConsumerBase):
+    """Producer-Consumer animation with a ring buffer and head/tail pointers"""
+    
+    def __init__(self, language="tr", **kwargs):
+        kwargs.setdefault("ring_buffer", True)
+        super().__init__(language=language, **kwargs)
+
+
+class ProducerConsumerLarge(ProducerConsumerBase):
+    """Producer-Consumer animation with a deep queue shown as an occupancy bar"""
+    
+    def __init__(self, language="tr", **kwargs):
+        kwargs.setdefault("capacity", 1000)
+        kwargs.setdefault("produce_rate", 180)
+        kwargs.setdefault("consume_rate", 240)
+        super().__init__(language=language, **kwargs)
+
+
+class ProducerConsumerSimulated(ProducerConsumerBase):
+    """Producer-Consumer animation replaying a window of a simulated two-producer trace"""
+    
+    def __init__(self, language="tr", seed=0, **kwargs):
+        kwargs.setdefault("capacity", 8)
+        kwargs.setdefault("trace", simulate(
+            producers=2, consumers=1, capacity=kwargs["capacity"],
+            produce_rate=1.0, consume_rate=1.6, max_items=5000, seed=seed
+        ))
+        kwargs.setdefault("trace_window", (100.0, 120.0))
+        kwargs.setdefault("trace_steps", 10)
+        super().__init__(language=language, seed=seed, **kwargs)
\ No newline at end of file
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Headless producer-consumer simulation that emits a compact event trace
+"""
+
+import argparse
+import heapq
+import random
+import threading
+import time
+from collections import deque, namedtuple
+
+
+ENQUEUE = "enqueue"
+DEQUEUE = "dequeue"
+BLOCK_PUT = "block_put"
+BLOCK_GET = "block_get"
+
+QueueEvent = namedtuple("QueueEvent", "time kind worker item depth")
+
+TraceBucket = namedtuple("TraceBucket", "start end enqueued dequeued blocked_puts blocked_gets depth")
+
+TraceStats = namedtuple(
+    "TraceStats",
+    "duration enqueued dequeued throughput blocked_puts blocked_gets max_depth latency_p50 latency_p95 latency_p99"
+)
+
+
+def simulate(producers=1, consumers=1, capacity=5, produce_rate=1.0, consume_rate=1.0,
+             max_items=1000, seed=None):
+    """Discrete-event simulation of a bounded queue.
+
+    Producers create an item every Exp(produce_rate) seconds and block while the queue is full;
+    consumers take Exp(consume_rate) seconds per item and block while it is empty. Returns the
+    event list, ordered by time. Runs in pure Python at several hundred thousand events per second.
+    """
+    rng = random.Random(seed)
+    events = []
+    buffer = deque()
+    waiting_producers = deque()
+    waiting_consumers = deque()
+    produced = 0
+
+    # Pending wake-ups: (time, sequence, kind, worker)
+    timeline = []
+    sequence = 0
+    for p in range(producers):
+        heapq.heappush(timeline, (rng.expovariate(produce_rate), sequence, "produce", p))
+        sequence += 1
+    for c in range(consumers):
+        heapq.heappush(timeline, (0.0, sequence, "consume", c))
+        sequence += 1
+
+    def schedule(at, kind, worker):
+        nonlocal sequence
+        heapq.heappush(timeline, (at, sequence, kind, worker))
+        sequence += 1
+
+    def enqueue(now, worker, item):
+        buffer.append(item)
+        events.append(QueueEvent(now, ENQUEUE, worker, item, len(buffer)))
+        if waiting_consumers:
+            dequeue(now, waiting_consumers.popleft())
+
+    def dequeue(now, worker):
+        item = buffer.popleft()
+        events.append(QueueEvent(now, DEQUEUE, worker, item, len(buffer)))
+        schedule(now + rng.expovariate(consume_rate), "consume", worker)
+        if waiting_producers:
+            producer, blocked_item = waiting_producers.popleft()
+            enqueue(now, producer, blocked_item)
+            schedule(now + rng.expovariate(produce_rate), "produce", producer)
+
+    while timeline:
+        now, _, kind, worker = heapq.heappop(timeline)
+
+        if kind == "produce":
+            if produced >= max_items:
+                continue
+            item = produced
+            produced += 1
+            if len(buffer) < capacity:
+                enqueue(now, worker, item)
+                schedule(now + rng.expovariate(produce_rate), "produce", worker)
+            else:
+                events.append(QueueEvent(now, BLOCK_PUT, worker, item, len(buffer)))
+                waiting_producers.append((worker, item))
+        else:
+            if buffer:
+                dequeue(now, worker)
+            elif produced < max_items or waiting_producers:
+                events.append(QueueEvent(now, BLOCK_GET, worker, None, 0))
+                waiting_consumers.append(worker)
+
+    return events
+
+
+def run_threaded(producers=1, consumers=1, capacity=5, produce_rate=100.0, consume_rate=100.0,
+                 max_items=200, seed=None):
+    """Run real producer and consumer threads over a bounded deque and record the same trace.
+
+    Rates are in items per wall-clock second, so keep them high and max_items low; this exists to
+    check the discrete-event model against actual thread scheduling, not to generate big traces.
+    """
+    rng = random.Random(seed)
+    delays = {
+        ("produce", p): [rng.expovariate(produce_rate) for _ in range(max_items)]
+        for p in range(producers)
+    }
+    delays.update({
+        ("consume", c): [rng.expovariate(consume_rate) for _ in range(max_items)]
+        for c in range(consumers)
+    })
+
+    buffer = deque()
+    events = []
+    # Guards buffer and events together, so each put or take is recorded in the order it happened
+    changed = threading.Condition()
+    start = time.perf_counter()
+    counter = iter(range(max_items))
+    counter_lock = threading.Lock()
+    done = object()
+
+    def record(kind, worker, item):
+        events.append(QueueEvent(time.perf_counter() - start, kind, worker, item, len(buffer)))
+
+    def put(worker, item):
+        with changed:
+            if len(buffer) >= capacity:
+                record(BLOCK_PUT, worker, item)
+                changed.wait_for(lambda: len(buffer) < capacity)
+            buffer.append(item)
+            if item is not done:
+                record(ENQUEUE, worker, item)
+            changed.notify_all()
+
+    def producer(worker):
+        for delay in delays[("produce", worker)]:
+            time.sleep(delay)
+            with counter_lock:
+                item = next(counter, None)
+            if item is None:
+                return
+            put(worker, item)
+
+    def consumer(worker):
+        service = iter(delays[("consume", worker)])
+        while True:
+            with changed:
+                if not buffer:
+                    record(BLOCK_GET, worker, None)
+                    changed.wait_for(lambda: buffer)
+                item = buffer.popleft()
+                if item is not done:
+                    record(DEQUEUE, worker, item)
+                changed.notify_all()
+            if item is done:
+                return
+            time.sleep(next(service, 0))
+
+    producer_threads = [threading.Thread(target=producer, args=(p,)) for p in range(producers)]
+    consumer_threads = [threading.Thread(target=consumer, args=(c,)) for c in range(consumers)]
+    for thread in producer_threads + consumer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    for _ in consumer_threads:
+        put(None, done)
+    for thread in consumer_threads:
+        thread.join()
+
+    return events
+
+
+def bucket_events(events, steps, start=None, end=None):
+    """Aggregate a time-ordered event stream into equal time buckets over [start, end) in one pass.
+
+    Works on any iterable, using O(steps) memory, and stops reading at the first event past end.
+    Returns the queue depth at start and a TraceBucket per step with its counts and closing depth.
+    """
+    if start is None or end is None:
+        events = list(events)
+        first = events[0].time if events else 0.0
+        last = events[-1].time if events else first
+        start = first if start is None else start
+        # Nudge the end past the final event so it lands in the last bucket
+        end = last + max((last - start) * 1e-9, 1e-9) if end is None else end
+    width = (end - start) / steps
+
+    counts = [[0, 0, 0, 0, None] for _ in range(steps)]
+    initial_depth = 0
+    for event in events:
+        if event.time < start:
+            if event.kind in (ENQUEUE, DEQUEUE):
+                initial_depth = event.depth
+            continue
+        if event.time >= end:
+            break
+        bucket = counts[min(int((event.time - start) / width), steps - 1)]
+        if event.kind == ENQUEUE:
+            bucket[0] += 1
+        elif event.kind == DEQUEUE:
+            bucket[1] += 1
+        elif event.kind == BLOCK_PUT:
+            bucket[2] += 1
+        elif event.kind == BLOCK_GET:
+            bucket[3] += 1
+        if event.kind in (ENQUEUE, DEQUEUE):
+            bucket[4] = event.depth
+
+    buckets = []
+    depth = initial_depth
+    for index, (enqueued, dequeued, blocked_puts, blocked_gets, last_depth) in enumerate(counts):
+        depth = depth if last_depth is None else last_depth
+        buckets.append(TraceBucket(
+            start + index * width, start + (index + 1) * width,
+            enqueued, dequeued, blocked_puts, blocked_gets, depth
+        ))
+    return initial_depth, buckets
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def trace_statistics(events):
+    """Throughput, blocking counts, peak depth and queueing-latency percentiles of a trace"""
+    enqueued_at = {}
+    latencies = []
+    counts = {ENQUEUE: 0, DEQUEUE: 0, BLOCK_PUT: 0, BLOCK_GET: 0}
+    max_depth = 0
+
+    for event in events:
+        counts[event.kind] += 1
+        max_depth = max(max_depth, event.depth)
+        if event.kind == ENQUEUE:
+            enqueued_at[event.item] = event.time
+        elif event.kind == DEQUEUE and event.item in enqueued_at:
+            latencies.append(event.time - enqueued_at.pop(event.item))
+
+    duration = events[-1].time - events[0].time if events else 0.0
+    latencies.sort()
+    return TraceStats(
+        duration=duration,
+        enqueued=counts[ENQUEUE],
+        dequeued=counts[DEQUEUE],
+        throughput=counts[DEQUEUE] / duration if duration > 0 else 0.0,
+        blocked_puts=counts[BLOCK_PUT],
+        blocked_gets=counts[BLOCK_GET],
+        max_depth=max_depth,
+        latency_p50=percentile(latencies, 0.50),
+        latency_p95=percentile(latencies, 0.95),
+        latency_p99=percentile(latencies, 0.99),
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--producers", type=int, default=1)
+    parser.add_argument("--consumers", type=int, default=1)
+    parser.add_argument("--capacity", type=int, default=5)
+    parser.add_argument("--produce-rate", type=float, default=1.0, help="Items per second per producer")
+    parser.add_argument("--consume-rate", type=float, default=1.0, help="Items per second per consumer")
+    parser.add_argument("--items", type=int, default=None,
+                        help="Items to produce (default: 1000000, or 200 with --threaded)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--threaded", action="store_true",
+                        help="Use real threads and wall-clock time instead of the event simulation")
+    args = parser.parse_args(argv)
+
+    run = run_threaded if args.threaded else simulate
+    if args.items is None:
+        args.items = 200 if args.threaded else 1000000
+    started = time.perf_counter()
+    events = run(args.producers, args.consumers, args.capacity, args.produce_rate,
+                 args.consume_rate, args.items, args.seed)
+    elapsed = time.perf_counter() - started
+    stats = trace_statistics(events)
+
+    print(f"Simulated {len(events)} events in {elapsed:.2f}s")
+    print(f"Trace duration: {stats.duration:.2f}s")
+    print(f"Enqueued: {stats.enqueued}, dequeued: {stats.dequeued}, throughput: {stats.throughput:.2f} items/s")
+    print(f"Blocked puts: {stats.blocked_puts}, blocked gets: {stats.blocked_gets}, max depth: {stats.max_depth}")
+    print(f"Queueing latency p50/p95/p99: "
+          f"{stats.latency_p50:.4f}s / {stats.latency_p95:.4f}s / {stats.latency_p99:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
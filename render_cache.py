@@ -0,0 +1,204 @@
+"""
+Content-addressed cache of rendered scene outputs
+"""
+
+import ast
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+
+
+DEFAULT_CACHE_DIR = os.path.join("media", "render_cache")
+
+CONFIG_KEYS = ("pixel_width", "pixel_height", "frame_rate", "format", "transparent")
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def scene_texts(scene):
+    """Return the resolved translation table a scene renders with"""
+    if hasattr(scene, "texts"):
+        return scene.texts
+    if hasattr(scene, "translations"):
+        return scene.translations[scene.lang]
+    return {}
+
+
+def project_modules(exclude=()):
+    """Loaded modules that live in this repository, by name, except those in exclude"""
+    modules = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if name in exclude or not path:
+            continue
+        if os.path.dirname(os.path.abspath(path)) == PROJECT_DIR:
+            modules[name] = path
+    return modules
+
+
+def project_imports(source):
+    """Paths of the repository modules that source imports, at module level or inside functions"""
+    paths = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            path = os.path.join(PROJECT_DIR, f"{name.split('.')[0]}.py")
+            if os.path.exists(path):
+                paths.add(path)
+    return paths
+
+
+def scene_sources(scene_class):
+    """Source of every module in the scene's class hierarchy outside manim and of every repository
+    module those import, transitively (text_cache, numeric_readout, buffer_pool, ...).
+
+    Imports are read from the source rather than from sys.modules, so the key does not depend on
+    which other scenes the process happened to load.
+    """
+    pending = []
+    for klass in inspect.getmro(scene_class):
+        module = inspect.getmodule(klass)
+        if module is None or module.__name__.split(".")[0] in ("manim", "builtins"):
+            continue
+        path = inspect.getsourcefile(module)
+        if path:
+            pending.append(os.path.abspath(path))
+
+    sources = {}
+    while pending:
+        path = pending.pop()
+        name = os.path.basename(path)
+        if name in sources:
+            continue
+        with open(path, "rb") as f:
+            source = f.read()
+        sources[name] = hashlib.sha256(source).hexdigest()
+        pending.extend(project_imports(source))
+    return sources
+
+
+def render_key(scene, config):
+    """Hash of scene source, translations, output config and RNG seed"""
+    import manim
+
+    payload = {
+        "sources": scene_sources(type(scene)),
+        "scene": type(scene).__name__,
+        "texts": scene_texts(scene),
+        "config": {key: str(config[key]) for key in CONFIG_KEYS},
+        "seed": getattr(scene, "seed", None),
+        "manim": manim.__version__,
+    }
+    layer = getattr(scene.renderer.camera, "layer", None)
+    if layer:
+        payload["layer"] = layer
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def section_key(scene, config, digest):
+    """Cache key of one scene section from its code-and-state digest, see scene_sections.Section"""
+    import manim
+
+    payload = {
+        "scene": type(scene).__name__,
+        "section": digest,
+        "texts": scene_texts(scene),
+        "config": {key: str(config[key]) for key in CONFIG_KEYS},
+        "manim": manim.__version__,
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class RenderCache:
+    """Index of rendered outputs keyed by render_key, with size/age eviction"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, "index.json")
+
+    def load(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self, index):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def lookup(self, key):
+        """Return the cached output path for key, or None if missing or stale"""
+        entry = self.load().get(key)
+        if entry is None:
+            return None
+        try:
+            if os.path.getsize(entry["path"]) != entry["size"]:
+                return None
+        except OSError:
+            return None
+        return entry["path"]
+
+    def store(self, key, path, label=None):
+        """Record a freshly rendered output under key"""
+        index = self.load()
+        now = time.time()
+        index[key] = {
+            "path": os.path.abspath(path),
+            "size": os.path.getsize(path),
+            "label": label,
+            "created": now,
+            "last_used": now,
+        }
+        self.save(index)
+
+    def touch(self, keys):
+        """Mark entries as recently used so eviction keeps them"""
+        index = self.load()
+        now = time.time()
+        for key in keys:
+            if key in index:
+                index[key]["last_used"] = now
+        self.save(index)
+
+    def evict(self, max_bytes=None, max_age_days=None):
+        """Drop entries older than max_age_days, then least recently used ones until under max_bytes"""
+        index = self.load()
+        now = time.time()
+        evicted = []
+
+        for key, entry in list(index.items()):
+            missing = not os.path.exists(entry["path"])
+            expired = max_age_days is not None and now - entry["last_used"] > max_age_days * 86400
+            if missing or expired:
+                evicted.append((key, index.pop(key)))
+
+        if max_bytes is not None:
+            total = sum(entry["size"] for entry in index.values())
+            for key, entry in sorted(index.items(), key=lambda item: item[1]["last_used"]):
+                if total <= max_bytes:
+                    break
+                total -= entry["size"]
+                evicted.append((key, index.pop(key)))
+
+        for key, entry in evicted:
+            try:
+                os.remove(entry["path"])
+            except FileNotFoundError:
+                pass
+
+        self.save(index)
+        return [key for key, entry in evicted]
@@ -0,0 +1,137 @@
+"""
+Job manifest and completion markers that let an interrupted batch render resume where it stopped
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict
+
+
+MANIFEST_NAME = "manifest.json"
+
+
+def files_intact(files):
+    """Whether every recorded (path, size) pair is still on disk with that size"""
+    try:
+        return all(os.path.getsize(path) == size for path, size in files)
+    except OSError:
+        return False
+
+
+def job_fields(job):
+    """job's fields as they read back from the manifest, where tuples become lists"""
+    return json.loads(json.dumps(asdict(job)))
+
+
+def file_sizes(paths):
+    return [[os.path.abspath(path), os.path.getsize(path)] for path in paths]
+
+
+class Checkpoint:
+    """Manifest of a batch's jobs in its media root, with a marker per finished job and scene section.
+
+    Only the main process writes it, after each job or section finishes, so a batch killed at any
+    point keeps every marker of the work it completed. A batch that ends without failures removes the
+    manifest, so the next batch starts from scratch rather than resuming.
+
+    key maps a job to a hash of what its output depends on besides the job's fields, such as the
+    scene's source. A finished job is resumed only while that hash is unchanged, so a scene edited
+    since the interrupted run is rendered again.
+    """
+
+    def __init__(self, media_root, key=None):
+        self.path = os.path.join(media_root, MANIFEST_NAME)
+        self.key = key
+
+    def job_key(self, job):
+        return self.key(job) if self.key else None
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"jobs": {}}
+
+    def save(self, manifest):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def entry(self, manifest, job):
+        """job's entry, started afresh if the manifest holds another job under the same id"""
+        fields = job_fields(job)
+        entry = manifest["jobs"].get(job.job_id)
+        if entry is None or entry["job"] != fields:
+            # A job_id does not cover the seed, fps or output specs, so those are compared here
+            entry = manifest["jobs"][job.job_id] = {"job": fields, "status": "pending", "sections": {}}
+        return entry
+
+    def begin(self, jobs):
+        """Record jobs as pending, keeping the markers of any earlier run of the same batch"""
+        manifest = self.load()
+        for job in jobs:
+            self.entry(manifest, job)
+        manifest["started"] = time.time()
+        self.save(manifest)
+        done = sum(1 for job in jobs if self.finished(manifest["jobs"][job.job_id], job))
+        if done:
+            print(f"Resuming: {done} of {len(jobs)} jobs finished in an earlier run")
+
+    def finished(self, entry, job):
+        """Whether entry records job as done under job's current key"""
+        return entry["status"] == "done" and entry.get("key") == self.job_key(job)
+
+    def completed(self, job):
+        """The manifest entry of job if it finished under its current key and its outputs are intact, else None"""
+        entry = self.load()["jobs"].get(job.job_id)
+        if entry is None or entry["job"] != job_fields(job):
+            return None
+        if not self.finished(entry, job) or not files_intact(entry["files"]):
+            return None
+        return entry
+
+    def mark(self, result):
+        """Record a job's outcome; failed jobs stay pending for the next run"""
+        manifest = self.load()
+        entry = self.entry(manifest, result.job)
+        if result.error:
+            entry["status"] = "failed"
+            entry["error"] = result.error
+        else:
+            entry.update(
+                status="done",
+                key=self.job_key(result.job),
+                output=os.path.abspath(result.output),
+                encoded=[os.path.abspath(path) for path in result.encoded or []],
+                layout=result.layout,
+                files=file_sizes([result.output, *(result.encoded or [])]),
+            )
+        self.save(manifest)
+
+    def completed_section(self, job, digest):
+        """The movie of job's section or segment with digest if a run finished it, else None.
+
+        Markers are keyed by the section digest rather than the play range, so a section edited
+        since the interrupted run is rendered again instead of resumed from its old movie.
+        """
+        entry = self.load()["jobs"].get(job.job_id)
+        if entry is None or entry["job"] != job_fields(job):
+            return None
+        marker = entry["sections"].get(digest)
+        if marker is None or not files_intact([marker]):
+            return None
+        return marker[0]
+
+    def mark_section(self, job, digest, path):
+        manifest = self.load()
+        self.entry(manifest, job)["sections"][digest] = file_sizes([path])[0]
+        self.save(manifest)
+
+    def finish(self, results):
+        """Remove the manifest once every job succeeded; otherwise keep it for a resumed run"""
+        if all(not result.error for result in results) and os.path.exists(self.path):
+            os.remove(self.path)
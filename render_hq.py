@@ -3,6 +3,7 @@
 High quality rendering script for Producer-Consumer animation
 """
 
+import argparse
 import os
 import sys
 
@@ -10,9 +11,18 @@ os.environ['DISABLE_MANIM_PLUGINS'] = '1'
 
 from manim import *
 
+from render_cache import RenderCache, render_key
+
 if __name__ == "__main__":
     from producer_consumer_animation import ProducerConsumer
     
+    parser = argparse.ArgumentParser(description="High quality Producer-Consumer render")
+    parser.add_argument("--language", choices=["en", "tr"], default="tr")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="RNG seed for the buffer data, so reruns reuse cached partial movies")
+    parser.add_argument("--force", action="store_true", help="Re-render even if the output is cached")
+    args = parser.parse_args()
+    
     config.quality = "high_quality"
     config.frame_rate = 60
     config.pixel_height = 1080
@@ -20,10 +30,18 @@ if __name__ == "__main__":
     config.preview = True
     config.write_to_movie = True
     
-    language = "tr"
+    scene = ProducerConsumer(language=args.language, seed=args.seed)
+    
+    cache = RenderCache()
+    key = render_key(scene, config)
+    cached_output = cache.lookup(key)
+    if cached_output and not args.force:
+        cache.touch([key])
+        print(f"\nScene unchanged, reusing cached render: {cached_output}")
+        sys.exit(0)
     
-    scene = ProducerConsumer(language=language)
     scene.render()
+    cache.store(key, str(scene.renderer.file_writer.movie_file_path), "render_hq")
     
     print(f"\nRendering complete!")
     print(f"Video saved to: {config.output_file}")
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Persistent render server that keeps manim, the scene modules and the font cache warm between jobs
+"""
+
+import argparse
+import http.client
+import itertools
+import json
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import time
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from batch_render import (
+    FORMATS, LANGUAGES, QUALITIES, SCENES, RenderJob, RenderResult, load_scene_class, render_job
+)
+from render_cache import DEFAULT_CACHE_DIR, RenderCache, project_modules
+
+os.environ['DISABLE_MANIM_PLUGINS'] = '1'
+
+DEFAULT_PORT = 8765
+
+# Modules the server itself runs on, and those batch_render imports names from at load time: the
+# server keeps references into them, so edits to these need a server restart. Every other project
+# module (the scenes and their helpers) is reloaded when edited.
+SERVER_MODULES = {
+    "__main__", "batch_render", "multi_output", "render_cache", "render_checkpoint", "render_server",
+}
+
+
+def server_module_mtimes():
+    return {
+        name: os.path.getmtime(path)
+        for name, path in project_modules().items() if name in SERVER_MODULES and os.path.exists(path)
+    }
+
+
+class RenderService:
+    """Queue of render jobs executed one at a time on a single warm render thread.
+
+    Manim's config and renderer are process-global, so jobs never render concurrently; the gain is
+    that imports, Cairo/Pango start-up and the text cache are paid once per server, not per job.
+    """
+
+    def __init__(self, media_root="media/server", cache_dir=DEFAULT_CACHE_DIR):
+        self.media_root = media_root
+        self.cache_dir = cache_dir
+        self.jobs = {}
+        self.pending = queue.Queue()
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.module_mtimes = {}
+        self.server_mtimes = {}
+        self.worker = threading.Thread(target=self.run, name="render-worker", daemon=True)
+
+    def warm_up(self):
+        """Import manim and every scene module, and lay out one text so Pango loads its fonts"""
+        started = time.perf_counter()
+        for name in SCENES:
+            load_scene_class(name)
+        from text_cache import cached_text
+        cached_text("Producer Consumer 0123456789")
+        self.server_mtimes = server_module_mtimes()
+        self.module_mtimes = {
+            name: os.path.getmtime(path) for name, path in project_modules(SERVER_MODULES).items()
+        }
+        print(f"Warmed up {len(SCENES)} scenes in {time.perf_counter() - started:.1f}s")
+
+    def reload_changed_modules(self):
+        """Drop every project module if any of them was edited, so the next import picks up the change.
+
+        Edits to SERVER_MODULES cannot be picked up this way; they are reported once instead.
+        """
+        server_mtimes = server_module_mtimes()
+        stale = [name for name, mtime in server_mtimes.items() if mtime != self.server_mtimes.get(name)]
+        if stale:
+            print(f"Restart the server to pick up edits to {', '.join(sorted(stale))}")
+            self.server_mtimes = server_mtimes
+
+        modules = project_modules(SERVER_MODULES)
+        changed = [
+            name for name, path in modules.items()
+            if os.path.exists(path) and os.path.getmtime(path) != self.module_mtimes.get(name)
+        ]
+        if not changed:
+            return
+        print(f"Reloading scene modules after edits to {', '.join(sorted(changed))}")
+        for name in modules:
+            del sys.modules[name]
+        for name in SCENES:
+            load_scene_class(name)
+        self.module_mtimes = {
+            name: os.path.getmtime(path) for name, path in project_modules(SERVER_MODULES).items()
+        }
+
+    def start(self):
+        self.worker.start()
+
+    def submit(self, job):
+        """Queue a job and return its record"""
+        with self.lock:
+            record = {
+                "id": str(next(self.ids)),
+                "job": asdict(job),
+                "status": "queued",
+                "queued_at": time.time(),
+                "output": None,
+                "seconds": None,
+                "error": None,
+                "cached": False,
+                "done": threading.Event(),
+            }
+            self.jobs[record["id"]] = record
+        self.pending.put((record["id"], job))
+        return record
+
+    def status(self, job_id):
+        with self.lock:
+            record = self.jobs.get(job_id)
+            if record is None:
+                return None
+            status = {key: value for key, value in record.items() if key != "done"}
+        status["position"] = self.position(job_id)
+        return status
+
+    def position(self, job_id):
+        """Jobs ahead of job_id in the queue, or None once it has started"""
+        with self.pending.mutex:
+            queued = [queued_id for queued_id, _ in self.pending.queue]
+        return queued.index(job_id) if job_id in queued else None
+
+    def wait(self, job_id, timeout=None):
+        record = self.jobs.get(job_id)
+        if record is not None:
+            record["done"].wait(timeout)
+        return self.status(job_id)
+
+    def run(self):
+        cache = RenderCache(self.cache_dir) if self.cache_dir else None
+        while True:
+            job_id, job = self.pending.get()
+            with self.lock:
+                self.jobs[job_id]["status"] = "running"
+            try:
+                self.reload_changed_modules()
+            except Exception as e:
+                print(f"Module reload failed: {type(e).__name__}: {e}")
+
+            try:
+                result = render_job(job, self.media_root, self.cache_dir)
+            except Exception as e:
+                # Keep the worker alive whatever a job does, or every later job would hang
+                result = RenderResult(job, error=f"{type(e).__name__}: {e}")
+            if cache and result.cache_key and not result.error:
+                if result.cached:
+                    cache.touch([result.cache_key])
+                else:
+                    cache.store(result.cache_key, result.output, job.job_id)
+
+            with self.lock:
+                record = self.jobs[job_id]
+                record.update(
+                    status="failed" if result.error else "done",
+                    output=result.output,
+                    seconds=result.seconds,
+                    error=result.error,
+                    cached=result.cached,
+                )
+                record["done"].set()
+            outcome = result.error or result.output
+            print(f"[job {job_id}] {job.job_id} {record['status']} in {result.seconds:.1f}s: {outcome}")
+
+
+def parse_job(payload):
+    """RenderJob from a JSON request body, validated against the batch renderer's choices"""
+    scene = payload.get("scene")
+    if scene not in SCENES:
+        raise ValueError(f"Unknown scene {scene!r}; choose from {', '.join(SCENES)}")
+    language = payload.get("language", "en")
+    if language not in LANGUAGES:
+        raise ValueError(f"Unknown language {language!r}")
+    fmt = payload.get("format", "mp4")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}")
+    quality = payload.get("quality", "low")
+    if quality not in QUALITIES:
+        raise ValueError(f"Unknown quality {quality!r}")
+    fps = payload.get("fps")
+    seed = payload.get("seed", 0)
+    return RenderJob(scene, language, fmt, quality,
+                     int(fps) if fps is not None else None,
+                     int(seed) if seed is not None else None)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """JSON API: POST /render, GET /jobs, GET /jobs/<id>, GET /health"""
+
+    service = None
+
+    def address_string(self):
+        # Unix socket peers have no host/port
+        return self.client_address[0] if self.client_address else "unix"
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload, indent=2).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self.send_json(200, {"status": "ok", "queued": self.service.pending.qsize()})
+        elif self.path == "/jobs":
+            self.send_json(200, [self.service.status(job_id) for job_id in list(self.service.jobs)])
+        elif self.path.startswith("/jobs/"):
+            status = self.service.status(self.path[len("/jobs/"):])
+            if status is None:
+                self.send_json(404, {"error": "unknown job"})
+            else:
+                self.send_json(200, status)
+        else:
+            self.send_json(404, {"error": "unknown path"})
+
+    def do_POST(self):
+        if self.path != "/render":
+            self.send_json(404, {"error": "unknown path"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            job = parse_job(payload)
+        except (ValueError, TypeError) as e:
+            self.send_json(400, {"error": str(e)})
+            return
+
+        record = self.service.submit(job)
+        if payload.get("wait"):
+            status = self.service.wait(record["id"])
+            self.send_json(200 if status["status"] == "done" else 500, status)
+        else:
+            self.send_json(202, self.service.status(record["id"]))
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)
+
+
+def serve(service, host="127.0.0.1", port=DEFAULT_PORT, socket_path=None):
+    handler = type("Handler", (RenderRequestHandler,), {"service": service})
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = UnixHTTPServer(socket_path, handler)
+        where = socket_path
+    else:
+        server = ThreadingHTTPServer((host, port), handler)
+        where = f"http://{host}:{port}"
+    print(f"Render server listening on {where}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def request(method, path, payload=None, host="127.0.0.1", port=DEFAULT_PORT, socket_path=None):
+    """Send one JSON request to a running server and return (status, decoded body)"""
+    if socket_path:
+        connection = UnixHTTPConnection(socket_path)
+    else:
+        connection = http.client.HTTPConnection(host, port)
+    try:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body else {}
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read() or b"null")
+    finally:
+        connection.close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--socket", dest="socket_path", default=None,
+                        help="Listen on / connect to this Unix socket instead of localhost TCP")
+    commands = parser.add_subparsers(dest="command")
+
+    serve_parser = commands.add_parser("serve", help="Run the server (default)")
+    serve_parser.add_argument("--media-dir", default="media/server")
+    serve_parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    serve_parser.add_argument("--no-cache", action="store_true")
+
+    submit_parser = commands.add_parser("submit", help="Queue a render on a running server")
+    submit_parser.add_argument("scene", choices=list(SCENES))
+    submit_parser.add_argument("--language", choices=LANGUAGES, default="en")
+    submit_parser.add_argument("--format", choices=list(FORMATS), default="mp4")
+    submit_parser.add_argument("--quality", choices=list(QUALITIES), default="low")
+    submit_parser.add_argument("--fps", type=int, default=None)
+    submit_parser.add_argument("--seed", type=int, default=0)
+    submit_parser.add_argument("--no-wait", action="store_true", help="Return as soon as the job is queued")
+
+    status_parser = commands.add_parser("status", help="Show queued and finished jobs")
+    status_parser.add_argument("job_id", nargs="?")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    address = dict(host=args.host, port=args.port, socket_path=args.socket_path)
+
+    if args.command == "submit":
+        payload = {
+            "scene": args.scene, "language": args.language, "format": args.format,
+            "quality": args.quality, "fps": args.fps, "seed": args.seed, "wait": not args.no_wait,
+        }
+        status, body = request("POST", "/render", payload, **address)
+        print(json.dumps(body, indent=2))
+        return 0 if status < 300 else 1
+
+    if args.command == "status":
+        path = f"/jobs/{args.job_id}" if args.job_id else "/jobs"
+        status, body = request("GET", path, **address)
+        print(json.dumps(body, indent=2))
+        return 0 if status < 300 else 1
+
+    media_dir = getattr(args, "media_dir", "media/server")
+    cache_dir = None if getattr(args, "no_cache", False) else getattr(args, "cache_dir", DEFAULT_CACHE_DIR)
+    service = RenderService(media_dir, cache_dir)
+    service.warm_up()
+    service.start()
+    serve(service, **address)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
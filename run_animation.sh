@@ -72,72 +72,23 @@ echo ""
 echo "Format:"
 echo "1. MP4 (1080p60)"
 echo "2. GIF"
+echo "3. MP4 + GIF (tek render / single render)"
 
-read -p "Seçim / Choice (1-2): " choice
+read -p "Seçim / Choice (1-3): " choice
 
 if [ "$ANIM_FILE" = "all" ]; then
     case $choice in
         1)
             echo "Rendering all animations as MP4..."
-            
-            # Array of animations: file_name class_name
-            animations=(
-                "producer_consumer_animation.py ProducerConsumer"
-                "neural_producer_consumer.py NeuralProducerConsumer"
-                "cpu_clock_animation.py CPUClock"
-            )
-            
-            for anim in "${animations[@]}"; do
-                read -r file class <<< "$anim"
-                
-                for lang in "en" "tr"; do
-                    echo "Rendering ${class}_${lang}.mp4..."
-                    cat > temp_render.py << EOF
-from ${file%.*} import ${class}
-
-class TempScene(${class}):
-    def __init__(self):
-        super().__init__(language="${lang}")
-
-if __name__ == "__main__":
-    scene = TempScene()
-    scene.render()
-EOF
-                    /Library/Frameworks/Python.framework/Versions/3.13/bin/python3 -m manim -pqh --fps 60 temp_render.py TempScene -o "${class}_${lang}"
-                    rm temp_render.py
-                done
-            done
+            /Library/Frameworks/Python.framework/Versions/3.13/bin/python3 batch_render.py --formats mp4 --quality high --incremental
             ;;
         2)
             echo "Rendering all animations as GIF..."
-            
-            # Array of animations: file_name class_name
-            animations=(
-                "producer_consumer_animation.py ProducerConsumer"
-                "neural_producer_consumer.py NeuralProducerConsumer"
-                "cpu_clock_animation.py CPUClock"
-            )
-            
-            for anim in "${animations[@]}"; do
-                read -r file class <<< "$anim"
-                
-                for lang in "en" "tr"; do
-                    echo "Rendering ${class}_${lang}.gif..."
-                    cat > temp_render.py << EOF
-from ${file%.*} import ${class}
-
-class TempScene(${class}):
-    def __init__(self):
-        super().__init__(language="${lang}")
-
-if __name__ == "__main__":
-    scene = TempScene()
-    scene.render()
-EOF
-                    /Library/Frameworks/Python.framework/Versions/3.13/bin/python3 -m manim -pqh --format=gif --fps 30 temp_render.py TempScene -o "${class}_${lang}"
-                    rm temp_render.py
-                done
-            done
+            /Library/Frameworks/Python.framework/Versions/3.13/bin/python3 batch_render.py --formats gif --quality high --incremental
+            ;;
+        3)
+            echo "Rendering all animations once, encoding MP4 and GIF..."
+            /Library/Frameworks/Python.framework/Versions/3.13/bin/python3 batch_render.py --outputs mp4:1080p60 gif:720p30 --quality high --incremental
             ;;
         *)
             echo "Geçersiz seçim!"
@@ -145,6 +96,8 @@ EOF
             ;;
     esac
 else
+    # Single renders go straight through manim so they open in the previewer (-p) when done
+    trap 'rm -f temp_render.py' EXIT
     case $choice in
         1)
             echo "Rendering MP4..."
@@ -160,7 +113,6 @@ if __name__ == "__main__":
     scene.render()
 EOF
             /Library/Frameworks/Python.framework/Versions/3.13/bin/python3 -m manim -pqh --fps 60 temp_render.py TempScene -o "${ANIM_CLASS}_${LANG}"
-            rm temp_render.py
             ;;
         2)
             echo "Rendering GIF..."
@@ -176,7 +128,10 @@ if __name__ == "__main__":
     scene.render()
 EOF
             /Library/Frameworks/Python.framework/Versions/3.13/bin/python3 -m manim -pqh --format=gif --fps 30 temp_render.py TempScene -o "${ANIM_CLASS}_${LANG}"
-            rm temp_render.py
+            ;;
+        3)
+            echo "Rendering once, encoding MP4 and GIF..."
+            /Library/Frameworks/Python.framework/Versions/3.13/bin/python3 batch_render.py --scenes "${ANIM_CLASS}" --languages "${LANG}" --outputs mp4:1080p60 gif:720p30 --quality high
             ;;
         *)
             echo "Geçersiz seçim!"
@@ -0,0 +1,230 @@
+"""
+Named scene sections: the deterministic boundaries a long scene can be split and re-rendered at
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import random
+import sys
+from collections import deque, namedtuple
+
+import numpy as np
+from manim import Mobject
+
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# A run of consecutive play() calls: first_play is manim's animation number of its first play,
+# seconds is the movie time the plays take, and digest hashes the section's code and the scene state
+# it starts from
+Section = namedtuple("Section", "name first_play plays seconds digest")
+
+# Scene attributes that belong to the recorders or the renderer rather than to the animation; the
+# renderer is listed because static_background swaps its class for one defined in this project
+RECORDER_ATTRIBUTES = ("section_marks", "section_function", "caption_clock", "caption_cues", "open_captions",
+                       "renderer")
+
+# How deep state_digest follows plain objects such as a BufferPool's queues
+STATE_DEPTH = 4
+
+
+def section(method):
+    """Start a new scene section named after the decorated method each time it is called"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Lets a SectionRecorder hash the method's code rather than this wrapper's
+        self.section_function = method
+        self.next_section(method.__name__)
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+def is_project_object(obj):
+    """Whether obj is a function or class defined in this repository"""
+    try:
+        path = inspect.getsourcefile(obj)
+    except TypeError:
+        return False
+    return bool(path) and os.path.dirname(os.path.abspath(path)) == PROJECT_DIR
+
+
+def referenced_names(code):
+    """Global and attribute names used by code and by the lambdas and comprehensions inside it"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= referenced_names(const)
+    return names
+
+
+_code_digests = {}
+
+
+def code_digest(code, scene_class, namespace):
+    """Hash of code's source and of every project method, function and class it reaches by name.
+
+    Names are resolved as scene methods first and module globals second, transitively, so editing a
+    helper such as produce_step changes the digest of every section that calls it and no other.
+    Plain values a name resolves to, such as LABEL_HEIGHT or a lookup table, are hashed by value.
+    """
+    cache_key = (code, scene_class)
+    if cache_key in _code_digests:
+        return _code_digests[cache_key]
+
+    sources = {}
+    pending = [(code, namespace)]
+    seen = set()
+    while pending:
+        current, current_namespace = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        sources[f"{current.co_filename}:{current.co_firstlineno}"] = inspect.getsource(current)
+        for name in referenced_names(current):
+            target = inspect.getattr_static(scene_class, name, None)
+            if isinstance(target, (staticmethod, classmethod)):
+                target = target.__func__
+            if target is None:
+                target = current_namespace.get(name)
+            if target is None or inspect.ismodule(target):
+                continue
+            if not callable(target):
+                value = hashlib.sha256()
+                feed_state(value, target)
+                sources[f"{current_namespace.get('__name__')}.{name}"] = value.hexdigest()
+                continue
+            if not is_project_object(target):
+                continue
+            if inspect.isclass(target):
+                sources[f"{target.__module__}.{target.__qualname__}"] = inspect.getsource(target)
+                functions = [value for value in vars(target).values() if inspect.isfunction(value)]
+            else:
+                functions = [target] if inspect.isfunction(target) else []
+            for function in functions:
+                function = inspect.unwrap(function)
+                pending.append((function.__code__, function.__globals__))
+
+    digest = hashlib.sha256()
+    for key in sorted(sources):
+        digest.update(sources[key].encode("utf-8"))
+    _code_digests[cache_key] = digest.hexdigest()
+    return _code_digests[cache_key]
+
+
+def feed_state(digest, value, depth=0):
+    """Add a deterministic encoding of value to digest; memory addresses never enter it.
+
+    Mobjects are skipped here because state_digest walks the scene's mobject families itself.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        digest.update(repr(value).encode("utf-8"))
+    elif isinstance(value, np.ndarray):
+        digest.update(value.dtype.str.encode("ascii"))
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, random.Random):
+        feed_state(digest, value.getstate(), depth)
+    elif isinstance(value, Mobject):
+        digest.update(b"mobject")
+    elif isinstance(value, (list, tuple, deque)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode("ascii"))
+        for item in value:
+            feed_state(digest, item, depth)
+    elif isinstance(value, (set, frozenset)):
+        for item in sorted(value, key=repr):
+            feed_state(digest, item, depth)
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            feed_state(digest, key, depth)
+            feed_state(digest, value[key], depth)
+    elif hasattr(value, "__code__"):
+        digest.update(value.__code__.co_code)
+    elif depth < STATE_DEPTH and is_project_object(type(value)):
+        digest.update(type(value).__name__.encode("ascii"))
+        feed_state(digest, vars(value), depth + 1)
+    else:
+        digest.update(type(value).__name__.encode("ascii"))
+
+
+def state_digest(scene):
+    """Hash of everything a section starts from: the mobjects on screen, the camera and the scene's own data"""
+    digest = hashlib.sha256()
+    for mobject in scene.mobjects:
+        for member in mobject.get_family():
+            digest.update(type(member).__name__.encode("ascii"))
+            feed_state(digest, {key: value for key, value in vars(member).items() if key != "submobjects"})
+    camera = scene.renderer.camera
+    feed_state(digest, [camera.frame_center, camera.frame_width, camera.frame_height])
+
+    # The scene's own attributes: settings, translations, RNG and project objects such as a
+    # BufferPool, but not manim's renderer, camera or animation bookkeeping
+    own = {
+        key: value for key, value in vars(scene).items()
+        if not key.startswith("_") and key not in RECORDER_ATTRIBUTES
+        and (value is None or isinstance(value, (bool, int, float, str, list, tuple, dict, deque, set,
+                                                  random.Random, np.ndarray))
+             or is_project_object(type(value)))
+    }
+    feed_state(digest, own)
+    return digest.hexdigest()
+
+
+class SectionRecorder:
+    """Scene mixin that notes where each section starts in the play() sequence and how long it runs"""
+
+    def reset_sections(self):
+        # Manim opens an unnamed section before construct(); plays before the first next_section land there
+        construct = type(self).construct
+        digest = self.section_digest(construct.__code__, construct.__globals__)
+        self.section_marks = [["autocreated", 0, 0.0, digest]]
+
+    def section_digest(self, code, namespace):
+        digest = hashlib.sha256(code_digest(code, type(self), namespace).encode("ascii"))
+        digest.update(state_digest(self).encode("ascii"))
+        return digest.hexdigest()
+
+    def next_section(self, name="unnamed", *args, **kwargs):
+        function = self.__dict__.pop("section_function", None)
+        if function is not None:
+            code, namespace = function.__code__, function.__globals__
+        else:
+            # Called inline, e.g. once per cycle: the section's code is the calling function
+            caller = sys._getframe(1)
+            code, namespace = caller.f_code, caller.f_globals
+        self.section_marks.append([name, self.renderer.num_plays, 0.0, self.section_digest(code, namespace)])
+        super().next_section(name, *args, **kwargs)
+
+    def play(self, *args, **kwargs):
+        super().play(*args, **kwargs)
+        self.section_marks[-1][2] += self.duration
+
+    def sections(self):
+        """Non-empty sections in play order"""
+        total = self.renderer.num_plays
+        sections = []
+        ends = [mark[1] for mark in self.section_marks[1:]] + [total]
+        for (name, first, seconds, digest), end in zip(self.section_marks, ends):
+            plays = end - first
+            if plays > 0:
+                sections.append(Section(name, first, plays, seconds, digest))
+        return sections
+
+
+_recorders = {}
+
+
+def record_sections(scene, skip_frames=True):
+    """Record scene's sections while it runs; by default nothing is drawn, the plays are only timed.
+
+    The class is swapped on the constructed scene, as in layer_compositing.use_layer.
+    """
+    base = type(scene)
+    if base not in _recorders:
+        _recorders[base] = type(f"{base.__name__}Sections", (SectionRecorder, base), {})
+    scene.__class__ = _recorders[base]
+    scene.reset_sections()
+    if skip_frames:
+        scene.renderer.skip_animations = True
+        scene.renderer._original_skipping_status = True
+    return scene
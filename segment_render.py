@@ -0,0 +1,275 @@
+"""
+Render one long scene as several segments in parallel and stitch them without re-encoding
+"""
+
+import hashlib
+import multiprocessing
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+
+from batch_render import (
+    QUALITIES, RenderJob, RenderResult, create_scene, job_config, load_scene_class, resumed_result,
+    scene_output_path,
+)
+from multi_output import encode_outputs
+from render_cache import RenderCache
+
+
+def movie_job(job):
+    """job as an mp4 master; gif and other outputs are encoded from the stitched movie"""
+    return RenderJob(job.scene, job.language, "mp4", job.quality, job.frame_rate, job.seed, job.outputs)
+
+
+def plan_sections(job, media_root):
+    """Run job's scene once without drawing a frame and return its sections.
+
+    Each section's digest is extended with the job's translations and output config into a render
+    cache key, so a section movie can be reused by any later render that would draw the same frames.
+    """
+    from manim import config, tempconfig
+    from render_cache import section_key
+    from scene_sections import record_sections
+
+    job = movie_job(job)
+    overrides = job_config(job, media_root)
+    overrides["dry_run"] = True
+    with tempconfig(overrides):
+        scene = record_sections(create_scene(load_scene_class(job.scene), job))
+        scene.render()
+        return [
+            section._replace(digest=section_key(scene, config, section.digest))
+            for section in scene.sections()
+        ]
+
+
+def split_sections(sections, count):
+    """Cut sections into at most count contiguous runs of roughly equal movie time.
+
+    Returns inclusive (first play, last play) ranges; cuts fall only on section boundaries.
+    """
+    total = sum(section.seconds for section in sections)
+    segments = []
+    start = sections[0].first_play
+    elapsed = 0.0
+    for index, section in enumerate(sections[:-1]):
+        elapsed += section.seconds
+        if len(segments) < count - 1 and elapsed >= total * (len(segments) + 1) / count:
+            end = sections[index + 1].first_play
+            segments.append((start, end - 1))
+            start = end
+    last = sections[-1]
+    segments.append((start, last.first_play + last.plays - 1))
+    return segments
+
+
+def render_segment(job, first, last, final, media_root):
+    """Render plays first..last of job, fast-forwarding through the earlier ones without drawing them"""
+    from manim import tempconfig
+
+    job = movie_job(job)
+    overrides = job_config(job, media_root)
+    overrides["media_dir"] = os.path.join(media_root, job.job_id, f"segment_{first:04d}")
+    # Manim skips plays before from_animation_number but still runs them, so the scene state (RNG,
+    # buffer contents, mobject positions) matches a full render when the first drawn play starts
+    overrides["from_animation_number"] = first
+    if not final:
+        overrides["upto_animation_number"] = last
+    with tempconfig(overrides):
+        scene = create_scene(load_scene_class(job.scene), job)
+        scene.render()
+        return scene_output_path(scene)
+
+
+def concat_command(list_path, output_path, ffmpeg="ffmpeg"):
+    return [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", list_path,
+            "-c", "copy", "-movflags", "+faststart", output_path]
+
+
+def concat_segments(paths, output_path, ffmpeg="ffmpeg"):
+    """Join segment movies rendered with identical settings by stream copy"""
+    list_path = f"{output_path}.segments.txt"
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+    subprocess.run(concat_command(list_path, output_path, ffmpeg), check=True)
+    os.remove(list_path)
+    return output_path
+
+
+def section_path(cache_dir, key):
+    """Where the movie of a cached section is kept, by content key"""
+    return os.path.join(cache_dir, "sections", f"{key}.mp4")
+
+
+def finish_movie(job, paths, output_dir):
+    """Stitch a job's segment movies and encode its outputs; returns (output, encoded)"""
+    from manim.constants import QUALITIES as MANIM_QUALITIES
+
+    os.makedirs(output_dir, exist_ok=True)
+    output = concat_segments(paths, os.path.join(output_dir, f"{job.output_name}.mp4"))
+    encoded = None
+    if job.outputs:
+        encoded = encode_outputs(output, job.outputs, output_dir, job.output_name)
+    elif job.format == "gif":
+        height = MANIM_QUALITIES[QUALITIES[job.quality]]["pixel_height"]
+        output = encode_outputs(output, [f"gif:{height}p{job.frame_rate}"], output_dir, job.output_name)[0]
+    return output, encoded
+
+
+def segment_digest(sections, first, last):
+    """Digest of plays first..last from the keys of the sections they span"""
+    digest = hashlib.sha256()
+    for section in sections:
+        if first <= section.first_play <= last:
+            digest.update(section.digest.encode("ascii"))
+    return digest.hexdigest()
+
+
+def render_sections(pool, job, segments, end, media_root, checkpoint=None):
+    """Submit each (first play, last play, digest) segment of job that checkpoint has no movie of.
+
+    Returns {segment: path or future}; a segment ending at end, the scene's last play, is rendered
+    to the end of the scene.
+    """
+    movies = {}
+    for first, last, digest in segments:
+        path = checkpoint.completed_section(job, digest) if checkpoint else None
+        movies[first, last, digest] = path or pool.submit(render_segment, job, first, last, last == end,
+                                                          media_root)
+    return movies
+
+
+def mark_sections(movies, checkpoint):
+    """Mark each segment of {(job, segment): future} as its render finishes, so an interrupted run keeps it"""
+    futures = {movie: key for key, movie in movies.items() if isinstance(movie, Future)}
+    for future in as_completed(futures):
+        job, (_, _, digest) = futures[future]
+        if checkpoint and not future.exception():
+            checkpoint.mark_section(job, digest, future.result())
+
+
+def section_movie(movie):
+    return movie.result() if isinstance(movie, Future) else movie
+
+
+def render_incremental(jobs, workers=None, media_root="media/batch", cache_dir=None, checkpoint=None):
+    """Re-render only the sections whose code or starting state changed since they were last rendered.
+
+    Every section movie is kept in the render cache under its section key. A dry run of each scene
+    computes the keys; sections missing from the cache are rendered in parallel, each fast-forwarded
+    to its first play, and the job's movie is stitched from cached and fresh sections by stream copy.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    cache = RenderCache(cache_dir) if cache_dir else None
+    start = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    results = {job: resumed_result(job, checkpoint) for job in jobs}
+    pending = [job for job in jobs if not results[job]]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        plans = {job: pool.submit(plan_sections, job, media_root) for job in pending}
+        sections = {}
+        for job, plan in plans.items():
+            try:
+                sections[job] = plan.result()
+            except Exception as e:
+                results[job] = RenderResult(job, seconds=time.perf_counter() - start,
+                                            error=f"{type(e).__name__}: {e}")
+
+        movies = {}
+        for job, job_sections in sections.items():
+            segments = [
+                (section.first_play, section.first_play + section.plays - 1, section.digest)
+                for section in job_sections
+            ]
+            cached = [cache.lookup(section.digest) if cache else None for section in job_sections]
+            missing = [section.name for section, path in zip(job_sections, cached) if not path]
+            print(f"{job.job_id}: {len(job_sections) - len(missing)} of {len(job_sections)} sections unchanged, "
+                  f"rendering {', '.join(missing) or 'nothing'}")
+            fresh = render_sections(pool, job, [segment for segment, path in zip(segments, cached) if not path],
+                                    segments[-1][1], media_root, checkpoint)
+            for segment, path in zip(segments, cached):
+                movies[job, segment] = path or fresh[segment]
+        mark_sections(movies, checkpoint)
+
+        for job, job_sections in sections.items():
+            try:
+                paths = []
+                for section in job_sections:
+                    movie = movies[job, (section.first_play, section.first_play + section.plays - 1, section.digest)]
+                    path = section_movie(movie)
+                    if cache and path == cache.lookup(section.digest):
+                        cache.touch([section.digest])
+                    elif cache:
+                        # Copied under its key so a later render of this slot cannot overwrite it
+                        kept = section_path(cache_dir, section.digest)
+                        os.makedirs(os.path.dirname(kept), exist_ok=True)
+                        path = shutil.copyfile(path, kept)
+                        cache.store(section.digest, path, f"{job.job_id}:{section.name}")
+                    paths.append(path)
+                output, encoded = finish_movie(job, paths, os.path.join(media_root, job.job_id))
+                rendered = any(isinstance(movie, Future) for (owner, _), movie in movies.items() if owner == job)
+                results[job] = RenderResult(job, output, time.perf_counter() - start, encoded=encoded,
+                                            cached=not rendered)
+            except Exception as e:
+                results[job] = RenderResult(job, seconds=time.perf_counter() - start,
+                                            error=f"{type(e).__name__}: {e}")
+            if checkpoint:
+                checkpoint.mark(results[job])
+            status = "FAILED" if results[job].error else "done"
+            print(f"{job.job_id} {status} in {results[job].seconds:.1f}s")
+    return [results[job] for job in jobs]
+
+
+def render_segmented(jobs, segments, workers=None, media_root="media/batch", checkpoint=None):
+    """Render every job as up to segments parallel segments and return results in job order.
+
+    Segments of all jobs share one process pool. The render cache is not consulted: manim's own
+    partial movie cache already skips unchanged plays when a segment is rendered again. With a
+    checkpoint, segments an interrupted run finished are not rendered again.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    start = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    results = {job: resumed_result(job, checkpoint) for job in jobs}
+    pending = [job for job in jobs if not results[job]]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        plans = {job: pool.submit(plan_sections, job, media_root) for job in pending}
+        ranges = {}
+        for job, plan in plans.items():
+            try:
+                sections = plan.result()
+                ranges[job] = [
+                    (first, last, segment_digest(sections, first, last))
+                    for first, last in split_sections(sections, segments)
+                ]
+            except Exception as e:
+                results[job] = RenderResult(job, seconds=time.perf_counter() - start,
+                                            error=f"{type(e).__name__}: {e}")
+                continue
+            print(f"{job.job_id}: {len(ranges[job])} segments at plays "
+                  f"{', '.join(str(first) for first, _, _ in ranges[job])}")
+
+        movies = {}
+        for job, job_ranges in ranges.items():
+            end = job_ranges[-1][1]
+            for segment, movie in render_sections(pool, job, job_ranges, end, media_root, checkpoint).items():
+                movies[job, segment] = movie
+        mark_sections(movies, checkpoint)
+
+        for job, job_ranges in ranges.items():
+            try:
+                paths = [section_movie(movies[job, segment]) for segment in job_ranges]
+                output, encoded = finish_movie(job, paths, os.path.join(media_root, job.job_id))
+                results[job] = RenderResult(job, output, time.perf_counter() - start, encoded=encoded)
+            except Exception as e:
+                results[job] = RenderResult(job, seconds=time.perf_counter() - start,
+                                            error=f"{type(e).__name__}: {e}")
+            if checkpoint:
+                checkpoint.mark(results[job])
+            status = "FAILED" if results[job].error else "done"
+            print(f"{job.job_id} {status} in {results[job].seconds:.1f}s")
+    return [results[job] for job in jobs]
@@ -0,0 +1,83 @@
+"""
+Rasterize a scene's static mobjects once and reuse the image for every play that leaves them unchanged
+"""
+
+from manim.renderer.cairo_renderer import CairoRenderer
+
+
+def camera_view(camera):
+    """Everything about the camera that the static frame depends on"""
+    return (camera.pixel_array.shape, tuple(camera.frame_center), camera.frame_width, camera.frame_height,
+            str(camera.background_color), camera.background_opacity)
+
+
+class BackgroundCache:
+    """CairoRenderer mixin that keeps the static frame of one play for the following plays.
+
+    Manim already draws the static mobjects of a play (those before the first moving one) once and
+    blends only the moving ones over that image on every frame, but it rasterizes the static image
+    again at the start of every play. A scene such as CPUClock keeps its grid and axes unchanged
+    across dozens of plays, so the image is reused while the static mobjects and camera are unchanged.
+
+    Static mobjects are compared by identity and by a version that goes up whenever they move in a
+    play, rather than by their state, so a mobject on screen is assumed to change only inside play().
+    A scene that edits one between plays without animating it must not use this cache.
+    """
+
+    background_key = None
+    background_image = None
+    mobject_versions = None
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        # Whatever moves in this play may come out of it changed, even if the play is skipped
+        for mobject in scene.moving_mobjects:
+            for member in mobject.get_family():
+                self.mobject_versions[id(member)] = self.mobject_versions.get(id(member), 0) + 1
+
+        if self.skip_animations or getattr(self.camera, "layer", None):
+            # Skipped plays draw nothing, and a layer camera digests the shapes of every capture
+            self.background_key = None
+            return super().save_static_frame_data(scene, static_mobjects)
+        key = None
+        if static_mobjects:
+            # The members are kept in the key, so their ids cannot be reused while it is compared
+            members = [member for mobject in static_mobjects for member in mobject.get_family()]
+            key = (camera_view(self.camera), members, [self.mobject_versions.get(id(member), 0) for member in members])
+        if key is not None and self.same_background(key):
+            # Scene.play_internal clears static_image after every play, so it is kept separately
+            self.static_image = self.background_image
+            return self.static_image
+        self.background_key = key
+        self.background_image = super().save_static_frame_data(scene, static_mobjects)
+        return self.background_image
+
+    def same_background(self, key):
+        if self.background_key is None:
+            return False
+        view, members, versions = key
+        cached_view, cached_members, cached_versions = self.background_key
+        return (
+            view == cached_view and versions == cached_versions and len(members) == len(cached_members)
+            and all(member is cached for member, cached in zip(members, cached_members))
+        )
+
+
+_renderers = {}
+
+
+def cache_background(scene):
+    """Reuse scene's static frame across plays; other renderers than Cairo are left alone.
+
+    The renderer's class is swapped on the constructed scene, as in layer_compositing.use_layer.
+    """
+    renderer = scene.renderer
+    if not isinstance(renderer, CairoRenderer):
+        return renderer
+    base = type(renderer)
+    if base not in _renderers:
+        _renderers[base] = type(f"{base.__name__}Background", (BackgroundCache, base), {})
+    renderer.__class__ = _renderers[base]
+    renderer.background_key = None
+    renderer.background_image = None
+    renderer.mobject_versions = {}
+    return renderer
@@ -0,0 +1,195 @@
+"""
+Timed subtitle tracks from the translated text a scene shows, for one video that serves every language
+"""
+
+import os
+import subprocess
+from collections import namedtuple
+
+import numpy as np
+from manim import Transform, config
+
+from layer_compositing import caption_text
+
+
+# Render job layer that runs a scene without drawing frames, only to record its captions
+CAPTIONS = "captions"
+
+# ISO 639-2 codes for the subtitle stream language tags
+LANGUAGE_CODES = {
+    "en": "eng",
+    "tr": "tur",
+}
+
+# One caption: seconds on screen, its string and where it was drawn, as percentages of the frame
+Cue = namedtuple("Cue", "start end text x y")
+
+
+class CaptionRecorder:
+    """Scene mixin that turns every translated Text the scene shows into a timed, positioned cue.
+
+    The clock advances by the frames manim writes for each play() and wait(), so cues line up with
+    the rendered movie even when the recording run skips drawing frames.
+    """
+
+    def reset_captions(self):
+        self.caption_clock = 0.0
+        self.caption_cues = []
+        self.open_captions = {}
+
+    def play_frames(self):
+        """Frames manim writes for the animations just played"""
+        dt = 1 / config.frame_rate
+        if len(self.animations) == 1 and getattr(self.animations[0], "is_static_wait", False):
+            # A frozen wait repeats one frame, truncating instead of stepping through time
+            return int(self.duration / dt)
+        return len(np.arange(0, self.duration, dt))
+
+    def play(self, *args, **kwargs):
+        start = self.caption_clock
+        super().play(*args, **kwargs)
+        for animation in self.animations or []:
+            if isinstance(animation, Transform):
+                text = caption_text(animation.target_mobject)
+                if text and caption_text(animation.mobject):
+                    # The Text now shows the target's glyphs but still carries its old string
+                    animation.mobject.caption = text
+        self.caption_clock += self.play_frames() / config.frame_rate
+        self.update_captions(start)
+
+    def visible_captions(self):
+        visible = {}
+        for mobject in self.mobjects:
+            for member in mobject.get_family():
+                text = caption_text(member)
+                opacities = [sub.get_fill_opacity() for sub in member.family_members_with_points()]
+                if text and max(opacities, default=0) > 0:
+                    visible[id(member)] = (member, text)
+        return visible
+
+    def frame_position(self, mobject):
+        camera = self.renderer.camera
+        x, y = mobject.get_center()[:2] - camera.frame_center[:2]
+        return 50 + 100 * x / camera.frame_width, 50 - 100 * y / camera.frame_height
+
+    def close_caption(self, key, end):
+        text, start, x, y = self.open_captions.pop(key)
+        if end > start:
+            self.caption_cues.append(Cue(start, end, text, x, y))
+
+    def update_captions(self, start):
+        """Open cues for captions that appeared during the last play and close those that went away"""
+        visible = self.visible_captions()
+        for key in list(self.open_captions):
+            if key not in visible:
+                self.close_caption(key, self.caption_clock)
+            elif self.open_captions[key][0] != visible[key][1]:
+                self.close_caption(key, start)
+        for key, (mobject, text) in visible.items():
+            if key not in self.open_captions:
+                self.open_captions[key] = (text, start, *self.frame_position(mobject))
+
+    def tear_down(self):
+        super().tear_down()
+        for key in list(self.open_captions):
+            self.close_caption(key, self.caption_clock)
+        self.caption_cues.sort()
+
+
+_recorders = {}
+
+
+def record_captions(scene, skip_frames=False):
+    """Record scene's captions while it renders; with skip_frames nothing is drawn, only timed.
+
+    Like use_layer, the class is swapped on the constructed scene because the scenes take no hooks.
+    """
+    base = type(scene)
+    if base not in _recorders:
+        _recorders[base] = type(f"{base.__name__}Captions", (CaptionRecorder, base), {})
+    scene.__class__ = _recorders[base]
+    scene.reset_captions()
+    if skip_frames:
+        scene.renderer.skip_animations = True
+        scene.renderer._original_skipping_status = True
+    return scene
+
+
+def timestamp(seconds, separator="."):
+    milliseconds = int(round(seconds * 1000))
+    hours, milliseconds = divmod(milliseconds, 3600000)
+    minutes, milliseconds = divmod(milliseconds, 60000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{milliseconds:03d}"
+
+
+def flatten_cues(cues):
+    """Non-overlapping cues, one per span in which the same captions are on screen, top line first.
+
+    SRT and mov_text have no positions and players handle overlapping cues differently.
+    """
+    times = sorted({cue.start for cue in cues} | {cue.end for cue in cues})
+    flat = []
+    for start, end in zip(times, times[1:]):
+        active = [cue for cue in cues if cue.start <= start and cue.end >= end]
+        active.sort(key=lambda cue: (cue.y, cue.x))
+        if not active:
+            continue
+        text = "\n".join(cue.text for cue in active)
+        if flat and flat[-1].text == text and flat[-1].end == start:
+            flat[-1] = flat[-1]._replace(end=end)
+        else:
+            flat.append(Cue(start, end, text, 50.0, 100.0))
+    return flat
+
+
+def write_vtt(cues, path):
+    """WebVTT with every caption placed where the scene drew it"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("WEBVTT\n\n")
+        for cue in cues:
+            text = cue.text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            line = min(max(cue.y, 0.0), 100.0)
+            position = min(max(cue.x, 0.0), 100.0)
+            f.write(f"{timestamp(cue.start)} --> {timestamp(cue.end)} "
+                    f"line:{line:.1f}% position:{position:.1f}% align:center\n{text}\n\n")
+    return path
+
+
+def write_srt(cues, path):
+    with open(path, "w", encoding="utf-8") as f:
+        for number, cue in enumerate(flatten_cues(cues), 1):
+            f.write(f"{number}\n{timestamp(cue.start, ',')} --> {timestamp(cue.end, ',')}\n{cue.text}\n\n")
+    return path
+
+
+def track_paths(base):
+    return f"{base}.vtt", f"{base}.srt"
+
+
+def write_tracks(cues, base):
+    """Write base.vtt and base.srt and return their paths"""
+    os.makedirs(os.path.dirname(base) or ".", exist_ok=True)
+    vtt_path, srt_path = track_paths(base)
+    return write_vtt(cues, vtt_path), write_srt(cues, srt_path)
+
+
+def mux_command(video_path, tracks, output_path, ffmpeg="ffmpeg"):
+    """Copy the video and add one mov_text stream per (language, srt path), the first as default"""
+    command = [ffmpeg, "-y", "-loglevel", "error", "-i", video_path]
+    for _, path in tracks:
+        command += ["-i", path]
+    command += ["-map", "0:v", "-map", "0:a?"]
+    for i in range(len(tracks)):
+        command += ["-map", f"{i + 1}:s"]
+    command += ["-c:v", "copy", "-c:a", "copy", "-c:s", "mov_text"]
+    for i, (language, _) in enumerate(tracks):
+        command += [f"-metadata:s:s:{i}", f"language={LANGUAGE_CODES.get(language, language)}",
+                    f"-disposition:s:{i}", "default" if i == 0 else "0"]
+    command += ["-movflags", "+faststart", output_path]
+    return command
+
+
+def mux_subtitles(video_path, tracks, output_path, ffmpeg="ffmpeg"):
+    subprocess.run(mux_command(video_path, tracks, output_path, ffmpeg), check=True)
+    return output_path
@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from batch_render import RenderJob, accepts_seed, create_scene, load_scene_class  # noqa: E402
+
+
+@pytest.mark.parametrize("scene", ["ProducerConsumer", "NeuralProducerConsumer"])
+def test_seeded_job_reaches_scene(scene):
+    scene_class = load_scene_class(scene)
+    assert accepts_seed(scene_class)
+    assert create_scene(scene_class, RenderJob(scene, "en", seed=7)).seed == 7
+
+
+def test_scene_without_seed_is_created_without_one():
+    scene_class = load_scene_class("CPUClock")
+    assert not accepts_seed(scene_class)
+    create_scene(scene_class, RenderJob("CPUClock", "en", seed=7))
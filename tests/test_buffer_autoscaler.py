@@ -0,0 +1,47 @@
+from buffer_autoscaler import BufferAutoscaler
+
+
+def observe(autoscaler, cycles, buffers, arrived, dropped, occupancy):
+    for _ in range(cycles):
+        autoscaler.observe(buffers, arrived, dropped, occupancy, buffers)
+
+
+def test_grows_while_dropping():
+    autoscaler = BufferAutoscaler(max_buffers=3, window=2, cooldown=0)
+    observe(autoscaler, 2, 2, arrived=4, dropped=1, occupancy=2)
+    assert autoscaler.drop_rate() == 0.25
+    assert autoscaler.target(2) == 3
+
+
+def test_stops_at_max_buffers():
+    autoscaler = BufferAutoscaler(max_buffers=2, window=1, cooldown=0)
+    observe(autoscaler, 1, 2, arrived=4, dropped=4, occupancy=2)
+    assert autoscaler.target(2) == 2
+
+
+def test_shrinks_while_idle_down_to_min():
+    autoscaler = BufferAutoscaler(min_buffers=2, window=2, cooldown=0)
+    observe(autoscaler, 2, 4, arrived=2, dropped=0, occupancy=0)
+    assert autoscaler.target(4) == 3
+    observe(autoscaler, 2, 2, arrived=2, dropped=0, occupancy=0)
+    assert autoscaler.target(2) == 2
+
+
+def test_holds_between_thresholds():
+    autoscaler = BufferAutoscaler(window=2, cooldown=0)
+    observe(autoscaler, 2, 4, arrived=4, dropped=0, occupancy=2)
+    assert autoscaler.target(4) == 4
+
+
+def test_waits_for_a_full_window_and_cooldown():
+    autoscaler = BufferAutoscaler(window=2, cooldown=3)
+    observe(autoscaler, 1, 1, arrived=4, dropped=4, occupancy=1)
+    assert autoscaler.target(1) == 1
+    observe(autoscaler, 1, 1, arrived=4, dropped=4, occupancy=1)
+    assert autoscaler.target(1) == 2
+
+    observe(autoscaler, 2, 2, arrived=4, dropped=4, occupancy=2)
+    assert autoscaler.target(2) == 2
+    observe(autoscaler, 1, 2, arrived=4, dropped=4, occupancy=2)
+    assert autoscaler.target(2) == 3
+    assert len(autoscaler.history) == 5
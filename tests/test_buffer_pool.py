@@ -0,0 +1,68 @@
+import random
+
+from buffer_pool import BufferPool, IndexedSet
+
+
+def test_indexed_set_discard_keeps_positions():
+    items = IndexedSet(range(5))
+    items.discard(1)
+    items.discard(7)
+    assert sorted(items) == [0, 2, 3, 4]
+    assert all(items.items[items.positions[item]] == item for item in items)
+    assert 1 not in items and len(items) == 4
+
+
+def test_put_fills_every_slot_then_refuses():
+    rng = random.Random(0)
+    pool = BufferPool(3, 2)
+    assert all(pool.put(rng, packet) is not None for packet in range(6))
+    assert pool.put(rng, 6) is None
+    assert pool.total == 6 and not pool.free
+
+
+def test_taken_slot_stays_reserved_until_release():
+    rng = random.Random(0)
+    pool = BufferPool(1, 1)
+    pool.put(rng, "a")
+    index, packet = pool.take(rng)
+    assert packet == "a" and pool.total == 0
+    assert pool.put(rng, "b") is None
+    pool.release(index)
+    assert pool.put(rng, "b") == index
+
+
+def test_buffers_are_fifo():
+    rng = random.Random(0)
+    pool = BufferPool(1, 3)
+    for packet in "abc":
+        pool.put(rng, packet)
+    assert [pool.take(rng)[1] for _ in range(3)] == ["a", "b", "c"]
+    assert pool.take(rng) is None
+
+
+def test_replace_oldest_evicts_in_place():
+    rng = random.Random(0)
+    pool = BufferPool(1, 2)
+    assert pool.replace_oldest(rng, "x") is None
+    pool.put(rng, "a")
+    pool.put(rng, "b")
+    assert pool.replace_oldest(rng, "c") == (0, "a")
+    assert pool.packets() == ["b", "c"] and pool.total == 2
+
+
+def test_remove_buffer_skips_occupied_and_reindexes():
+    rng = random.Random(0)
+    pool = BufferPool(1, 1)
+    pool.add_buffer()
+    pool.put(rng, "a")
+    occupied = pool.occupied.items[0]
+
+    assert pool.remove_buffer() == 1 - occupied
+    assert len(pool) == 1
+    assert list(pool.occupied) == [0] and not pool.free
+    index, packet = pool.take(rng)
+    assert (index, packet) == (0, "a")
+    assert pool.remove_buffer() is None
+    pool.release(index)
+    assert pool.remove_buffer() == 0
+    assert pool.remove_buffer() is None
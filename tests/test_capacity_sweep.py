@@ -0,0 +1,41 @@
+import numpy as np
+
+from capacity_sweep import smallest_layer, sweep
+
+
+def test_result_arrays_are_shaped_by_the_grid():
+    result = sweep(produce_rates=(0.5, 1.0), consume_rates=(1.0,), buffer_counts=(1, 2, 4), capacities=(1, 2),
+                   cycles=50, seeds=4)
+    for metric in (result.drop_rate, result.utilization, result.throughput):
+        assert metric.shape == (2, 1, 3, 2)
+    assert ((result.drop_rate >= 0) & (result.drop_rate <= 1)).all()
+    assert ((result.utilization >= 0) & (result.utilization <= 1)).all()
+
+
+def test_more_slots_drop_fewer_packets():
+    result = sweep(produce_rates=(1.0,), consume_rates=(1.0,), buffer_counts=(1, 8), capacities=(1, 4),
+                   cycles=200, seeds=16)
+    drop_rate = result.drop_rate[0, 0]
+    assert drop_rate[1, 1] < drop_rate[0, 0]
+    assert drop_rate[1, 0] < drop_rate[0, 0] and drop_rate[0, 1] < drop_rate[0, 0]
+
+
+def test_sweep_is_seeded():
+    first = sweep(buffer_counts=(1, 2), cycles=20, seeds=2, seed=5)
+    second = sweep(buffer_counts=(1, 2), cycles=20, seeds=2, seed=5)
+    np.testing.assert_array_equal(first.drop_rate, second.drop_rate)
+
+
+def test_smallest_layer_picks_fewest_slots():
+    result = sweep(produce_rates=(0.5,), consume_rates=(1.0,), buffer_counts=(1, 2, 8), capacities=(1, 4),
+                   cycles=200, seeds=16)
+    ((rates, plan),) = smallest_layer(result, max_drop_rate=0.05).items()
+    assert rates == (0.5, 1.0)
+    b, c = plan
+    slots = result.buffer_counts[b] * result.capacities[c]
+    assert result.drop_rate[0, 0, b, c] <= 0.05
+    assert all(
+        result.drop_rate[0, 0, i, j] > 0.05
+        for i, j in np.ndindex(3, 2) if result.buffer_counts[i] * result.capacities[j] < slots
+    )
+    assert smallest_layer(result, max_drop_rate=-1.0) == {(0.5, 1.0): None}
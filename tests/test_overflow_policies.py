@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from buffer_autoscaler import BufferAutoscaler
+from buffer_pool import BufferPool
+from overflow_policies import (
+    BLOCK_PRODUCER, DROP_NEWEST, DROP_OLDEST, SPILL, DropOldest, OverflowPolicy, SpillToOverflow,
+    compare_policies, make_policy, simulate_policy,
+)
+
+
+def full_pool(packets="ab"):
+    rng = random.Random(0)
+    pool = BufferPool(1, len(packets))
+    for packet in packets:
+        pool.put(rng, packet)
+    return rng, pool
+
+
+def test_drop_newest_drops_the_offered_packet():
+    rng, pool = full_pool()
+    admission = OverflowPolicy().admit(pool, rng, "c")
+    assert admission.buffer is None and admission.dropped == "c"
+    assert pool.packets() == ["a", "b"]
+
+
+def test_drop_oldest_evicts_the_buffered_packet():
+    rng, pool = full_pool()
+    admission = DropOldest().admit(pool, rng, "c")
+    assert admission.buffer == 0 and admission.dropped == "a"
+    assert pool.packets() == ["b", "c"]
+
+
+def test_spill_parks_packets_then_drops_past_its_capacity():
+    rng, pool = full_pool()
+    policy = SpillToOverflow(spill_capacity=1)
+    assert policy.admit(pool, rng, "c").spilled
+    assert policy.admit(pool, rng, "d").dropped == "d"
+    assert policy.waiting() == ["c"]
+
+    index, packet = policy.take(pool, rng)
+    pool.release(index)
+    assert packet == "a"
+    assert policy.promote(pool, rng) == [("c", 0)]
+    assert pool.packets() == ["b", "c"] and not policy.waiting()
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        make_policy("drop_random")
+
+
+@pytest.mark.parametrize("policy", [DROP_NEWEST, DROP_OLDEST, BLOCK_PRODUCER, SPILL])
+def test_every_produced_packet_is_accounted_for(policy):
+    stats = simulate_policy(policy, cycles=500, seed=1)
+    assert stats.delivered + stats.dropped <= stats.produced
+    assert stats.produced - stats.delivered - stats.dropped <= 4 + 16
+    assert stats.loss == stats.dropped / stats.produced
+
+
+def test_backpressure_loses_nothing():
+    stats = simulate_policy(BLOCK_PRODUCER, cycles=500, seed=1)
+    assert stats.dropped == 0 and stats.loss == 0.0
+
+
+def test_autoscaled_layer_drops_less_without_touching_the_given_autoscaler():
+    autoscaler = BufferAutoscaler(min_buffers=1, max_buffers=8)
+    fixed = simulate_policy(DROP_NEWEST, buffers=1, cycles=500, seed=1)
+    scaled = simulate_policy(DROP_NEWEST, buffers=1, cycles=500, seed=1, autoscaler=autoscaler)
+    assert scaled.loss < fixed.loss
+    assert autoscaler.history == []
+
+
+def test_policies_are_compared_on_the_same_layer():
+    results = compare_policies(cycles=200, seed=2, capacity=2)
+    assert [stats.policy for stats in results] == [DROP_NEWEST, DROP_OLDEST, BLOCK_PRODUCER, SPILL]
+    assert results[0] == simulate_policy(DROP_NEWEST, cycles=200, seed=2, capacity=2)
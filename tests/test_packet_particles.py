@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from packet_particles import PacketParticles  # noqa: E402
+
+
+def test_spawn_returns_ids_that_send_accepts():
+    packets = PacketParticles(capacity=2, labels=False)
+    positions = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+    ids = packets.spawn(positions)
+
+    assert isinstance(ids, np.ndarray) and ids.dtype == np.int64
+    assert len(set(ids.tolist())) == len(positions)
+    assert packets.alive[ids].all()
+
+    targets = positions + [0.0, 1.0, 0.0]
+    packets.send(ids, targets)
+    np.testing.assert_array_equal(packets.target_positions[ids], targets)
+
+
+def test_emptied_style_group_stays_attached_without_points():
+    packets = PacketParticles(capacity=2, labels=False)
+    ids = packets.spawn([[0.0, 0.0, 0.0]])
+    packets.begin_flow()
+    packets.set_progress(1.0)
+    packets.finish_flow()
+    (group,) = packets.style_groups.values()
+    assert group in packets.submobjects and group.has_points()
+
+    packets.fade_out(ids)
+    packets.begin_flow()
+    packets.set_progress(1.0)
+    packets.finish_flow()
+    packets.render()
+    assert group in packets.submobjects
+    assert not group.has_points()
@@ -0,0 +1,44 @@
+from queue_simulation import (
+    BLOCK_PUT, DEQUEUE, ENQUEUE, QueueEvent, run_threaded, simulate, trace_statistics,
+)
+
+
+def test_simulation_moves_every_item_through_the_queue():
+    events = simulate(producers=2, consumers=1, capacity=3, produce_rate=2.0, max_items=500, seed=1)
+    stats = trace_statistics(events)
+    assert stats.enqueued == stats.dequeued == 500
+    assert stats.max_depth <= 3
+    assert stats.blocked_puts > 0
+    assert all(a.time <= b.time for a, b in zip(events, events[1:]))
+
+
+def test_simulation_is_seeded():
+    assert simulate(max_items=100, seed=3) == simulate(max_items=100, seed=3)
+
+
+def test_statistics_of_a_hand_written_trace():
+    events = [
+        QueueEvent(0.0, ENQUEUE, 0, 0, 1),
+        QueueEvent(1.0, ENQUEUE, 0, 1, 2),
+        QueueEvent(1.0, BLOCK_PUT, 0, 2, 2),
+        QueueEvent(2.0, DEQUEUE, 0, 0, 1),
+        QueueEvent(4.0, DEQUEUE, 0, 1, 0),
+    ]
+    stats = trace_statistics(events)
+    assert stats.duration == 4.0
+    assert stats.throughput == 0.5
+    assert stats.blocked_puts == 1
+    assert stats.max_depth == 2
+    assert stats.latency_p50 == 3.0
+
+
+def test_threaded_trace_records_each_enqueue_before_its_dequeue():
+    events = run_threaded(producers=2, consumers=2, capacity=1, produce_rate=2000.0, consume_rate=2000.0,
+                          max_items=100, seed=0)
+    enqueued = set()
+    for event in events:
+        if event.kind == ENQUEUE:
+            enqueued.add(event.item)
+        elif event.kind == DEQUEUE:
+            assert event.item in enqueued
+    assert len(enqueued) == 100
@@ -0,0 +1,59 @@
+import importlib
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from overflow_policies import OverflowPolicy
+from render_cache import RenderCache, render_key, scene_sources
+
+
+def test_sources_follow_imports():
+    assert set(scene_sources(OverflowPolicy)) == {"overflow_policies.py", "buffer_pool.py", "queue_simulation.py"}
+
+
+def test_sources_do_not_depend_on_loaded_modules():
+    sys.modules.pop("capacity_sweep", None)
+    before = scene_sources(OverflowPolicy)
+    importlib.import_module("capacity_sweep")
+    assert scene_sources(OverflowPolicy) == before
+
+
+def fake_scene(seed=None, layer=None):
+    return SimpleNamespace(
+        texts={"title": "Buffer"}, seed=seed, renderer=SimpleNamespace(camera=SimpleNamespace(layer=layer))
+    )
+
+
+CONFIG = {"pixel_width": 1920, "pixel_height": 1080, "frame_rate": 60, "format": None, "transparent": False}
+
+
+def test_key_covers_seed_config_and_layer():
+    pytest.importorskip("manim")
+    key = render_key(fake_scene(seed=1), CONFIG)
+    assert render_key(fake_scene(seed=1), CONFIG) == key
+    assert render_key(fake_scene(seed=2), CONFIG) != key
+    assert render_key(fake_scene(seed=1), {**CONFIG, "frame_rate": 30}) != key
+    assert render_key(fake_scene(seed=1, layer="text"), CONFIG) != key
+
+
+def test_lookup_returns_stored_path(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"))
+    output = tmp_path / "scene.mp4"
+    output.write_bytes(b"movie")
+    assert cache.lookup("key") is None
+
+    cache.store("key", str(output), label="Scene")
+    assert cache.lookup("key") == str(output)
+
+
+def test_lookup_misses_changed_or_missing_output(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"))
+    output = tmp_path / "scene.mp4"
+    output.write_bytes(b"movie")
+    cache.store("key", str(output))
+
+    output.write_bytes(b"another movie")
+    assert cache.lookup("key") is None
+    output.unlink()
+    assert cache.lookup("key") is None
@@ -0,0 +1,65 @@
+from batch_render import RenderJob, RenderResult
+from render_checkpoint import Checkpoint
+
+
+def finished(tmp_path, job, name="out.mp4"):
+    output = tmp_path / name
+    output.write_bytes(b"movie")
+    return RenderResult(job, str(output))
+
+
+def test_finished_job_is_resumed(tmp_path):
+    job = RenderJob("CPUClock", "en")
+    checkpoint = Checkpoint(str(tmp_path))
+    checkpoint.begin([job])
+    assert checkpoint.completed(job) is None
+
+    checkpoint.mark(finished(tmp_path, job))
+    assert checkpoint.completed(job)["output"] == str(tmp_path / "out.mp4")
+
+
+def test_failed_or_changed_jobs_are_not_resumed(tmp_path):
+    job = RenderJob("CPUClock", "en")
+    checkpoint = Checkpoint(str(tmp_path))
+    checkpoint.mark(RenderResult(job, error="RuntimeError: boom"))
+    assert checkpoint.completed(job) is None
+
+    checkpoint.mark(finished(tmp_path, job))
+    assert checkpoint.completed(RenderJob("CPUClock", "en", seed=3)) is None
+    (tmp_path / "out.mp4").write_bytes(b"truncated")
+    assert checkpoint.completed(job) is None
+
+
+def test_job_with_another_key_is_rendered_again(tmp_path):
+    job = RenderJob("CPUClock", "en")
+    keys = {job: "before edit"}
+    checkpoint = Checkpoint(str(tmp_path), key=keys.get)
+    checkpoint.mark(finished(tmp_path, job))
+    assert checkpoint.completed(job)
+
+    keys[job] = "after edit"
+    assert checkpoint.completed(job) is None
+
+
+def test_section_markers_follow_their_digest(tmp_path):
+    job = RenderJob("CPUClock", "en")
+    checkpoint = Checkpoint(str(tmp_path))
+    section = tmp_path / "section.mp4"
+    section.write_bytes(b"section")
+    checkpoint.mark_section(job, "digest", str(section))
+    assert checkpoint.completed_section(job, "digest") == str(section)
+    assert checkpoint.completed_section(job, "edited") is None
+
+
+def test_manifest_is_removed_once_every_job_succeeded(tmp_path):
+    job = RenderJob("CPUClock", "en")
+    checkpoint = Checkpoint(str(tmp_path))
+    failed = RenderResult(job, error="RuntimeError: boom")
+    checkpoint.mark(failed)
+    checkpoint.finish([failed])
+    assert (tmp_path / "manifest.json").exists()
+
+    result = finished(tmp_path, job)
+    checkpoint.mark(result)
+    checkpoint.finish([result])
+    assert not (tmp_path / "manifest.json").exists()
@@ -0,0 +1,74 @@
+import pytest
+
+from queue_simulation import BLOCK_PUT, DEQUEUE, ENQUEUE
+from trace_ingest import iter_trace, load_trace_buckets, trace_format, trace_time_range
+
+
+JSONL = """\
+{"ts": 10.0, "op": "put", "thread": "p0", "id": 1}
+{"ts": 10.5, "op": "push", "thread": "p0", "id": 2}
+{"ts": 11.0, "op": "full", "thread": "p0", "id": 3}
+{"ts": 11.5, "op": "poll", "thread": "c0", "id": 1}
+{"ts": 12.0, "op": "heartbeat"}
+{"ts": 13.0, "op": "take", "thread": "c0", "id": 2}
+"""
+
+CSV = """\
+timestamp,event,worker_id,message_id,qsize
+2024-01-01T00:00:00Z,enqueue,p0,1,1
+2024-01-01T00:00:01Z,enqueue,p0,2,2
+2024-01-01T00:00:03Z,dequeue,c0,1,1
+"""
+
+
+@pytest.fixture
+def jsonl_trace(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    path.write_text(JSONL)
+    return str(path)
+
+
+@pytest.fixture
+def csv_trace(tmp_path):
+    path = tmp_path / "trace.csv"
+    path.write_text(CSV)
+    return str(path)
+
+
+def test_format_from_extension():
+    assert trace_format("a.ndjson") == "jsonl"
+    assert trace_format("a.CSV") == "csv"
+    with pytest.raises(ValueError):
+        trace_format("a.parquet")
+
+
+def test_jsonl_aliases_and_tracked_depth(jsonl_trace):
+    events = list(iter_trace(jsonl_trace))
+    assert [event.kind for event in events] == [ENQUEUE, ENQUEUE, BLOCK_PUT, DEQUEUE, DEQUEUE]
+    assert [event.depth for event in events] == [1, 2, 2, 1, 0]
+    assert events[0].worker == "p0" and events[0].item == 1
+
+
+def test_csv_timestamps_and_recorded_depth(csv_trace):
+    events = list(iter_trace(csv_trace))
+    assert [event.time - events[0].time for event in events] == [0.0, 1.0, 3.0]
+    assert [event.depth for event in events] == [1, 2, 1]
+
+
+@pytest.mark.parametrize("trace", ["jsonl_trace", "csv_trace"])
+def test_memory_mapped_read_matches_buffered(trace, request):
+    path = request.getfixturevalue(trace)
+    assert list(iter_trace(path, use_mmap=True)) == list(iter_trace(path, use_mmap=False))
+
+
+def test_time_range_reads_the_ends(jsonl_trace, csv_trace):
+    assert trace_time_range(jsonl_trace) == (10.0, 13.0)
+    first, last = trace_time_range(csv_trace)
+    assert last - first == 3.0
+
+
+def test_buckets_over_a_window(jsonl_trace):
+    initial_depth, buckets = load_trace_buckets(jsonl_trace, 2, start=10.5, end=12.5)
+    assert initial_depth == 1
+    assert [(bucket.enqueued, bucket.dequeued, bucket.blocked_puts) for bucket in buckets] == [(1, 0, 1), (0, 1, 0)]
+    assert [bucket.depth for bucket in buckets] == [2, 1]
@@ -0,0 +1,32 @@
+"""
+Shared cache of Text mobjects for labels that are rendered many times
+"""
+
+from manim import NORMAL, WHITE, Text
+
+
+_text_cache = {}
+
+
+def _master_text(text, font_size=48, weight=NORMAL, color=WHITE, font=""):
+    key = (text, float(font_size), str(weight), str(color).upper(), font)
+    master = _text_cache.get(key)
+    if master is None:
+        master = Text(text, font_size=font_size, weight=weight, color=color, font=font)
+        _text_cache[key] = master
+    return master
+
+
+def cached_text(text, font_size=48, weight=NORMAL, color=WHITE, font=""):
+    """Return a fresh copy of a Text, running Pango only the first time a style is seen"""
+    return _master_text(text, font_size, weight, color, font).copy()
+
+
+def prewarm(specs):
+    """Build (text, style) pairs up front so the first frame that needs them does not pay for Pango"""
+    for text, style in specs:
+        _master_text(text, **style)
+
+
+def clear_text_cache():
+    _text_cache.clear()
@@ -0,0 +1,157 @@
+"""
+Streaming ingestion of production queue traces (JSON lines or CSV)
+"""
+
+import csv
+import json
+import mmap
+import os
+from datetime import datetime
+
+from queue_simulation import BLOCK_GET, BLOCK_PUT, DEQUEUE, ENQUEUE, QueueEvent, bucket_events
+
+
+# Files larger than this are read through a memory map instead of buffered reads
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+FIELD_ALIASES = {
+    "time": ("time", "timestamp", "ts", "t"),
+    "kind": ("kind", "event", "type", "op"),
+    "worker": ("worker", "thread", "producer", "consumer", "worker_id"),
+    "item": ("item", "id", "item_id", "message_id"),
+    "depth": ("depth", "size", "queue_depth", "qsize"),
+}
+
+KIND_ALIASES = {
+    ENQUEUE: ("enqueue", "put", "push", "produce", "offer", "enq"),
+    DEQUEUE: ("dequeue", "get", "pop", "consume", "poll", "take", "deq"),
+    BLOCK_PUT: ("block_put", "put_blocked", "full"),
+    BLOCK_GET: ("block_get", "get_blocked", "empty"),
+}
+
+_KINDS = {alias: kind for kind, aliases in KIND_ALIASES.items() for alias in aliases}
+
+
+def trace_format(path):
+    """Guess "jsonl" or "csv" from the file extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson", ".json", ".log"):
+        return "jsonl"
+    raise ValueError(f"Unknown trace format for {path!r}; use .jsonl or .csv")
+
+
+def iter_lines(path, use_mmap=None):
+    """Yield decoded lines without loading the file, memory-mapping large files"""
+    if use_mmap is None:
+        use_mmap = os.path.getsize(path) >= MMAP_THRESHOLD
+
+    with open(path, "rb") as f:
+        if not use_mmap or os.fstat(f.fileno()).st_size == 0:
+            for line in f:
+                yield line.decode("utf-8")
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for line in iter(mapped.readline, b""):
+                yield line.decode("utf-8")
+
+
+def parse_time(value):
+    """Seconds as a float, from a number or an ISO 8601 timestamp"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+
+
+def _field(record, name):
+    for alias in FIELD_ALIASES[name]:
+        if alias in record and record[alias] not in (None, ""):
+            return record[alias]
+    return None
+
+
+def _records(path, fmt, use_mmap):
+    lines = iter_lines(path, use_mmap)
+    if fmt == "csv":
+        yield from csv.DictReader(lines)
+        return
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def iter_trace(path, fmt=None, use_mmap=None):
+    """Stream QueueEvents from a trace file, one record at a time.
+
+    Records need a time and a kind; worker, item and depth are optional. When depth is missing it is
+    tracked from the enqueue/dequeue stream, which assumes the file starts with an empty queue.
+    """
+    depth = 0
+    for record in _records(path, fmt or trace_format(path), use_mmap):
+        kind = _KINDS.get(str(_field(record, "kind")).lower())
+        if kind is None:
+            continue
+
+        if kind == ENQUEUE:
+            depth += 1
+        elif kind == DEQUEUE:
+            depth = max(depth - 1, 0)
+        recorded_depth = _field(record, "depth")
+        if recorded_depth is not None:
+            depth = int(recorded_depth)
+
+        yield QueueEvent(parse_time(_field(record, "time")), kind,
+                         _field(record, "worker"), _field(record, "item"), depth)
+
+
+def trace_time_range(path, fmt=None):
+    """Time of the first and last record, reading only the two ends of the file"""
+    fmt = fmt or trace_format(path)
+    first = next(iter_trace(path, fmt, use_mmap=False))
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        end = len(mapped)
+        while end > 0 and mapped[end - 1:end] in (b"\n", b"\r"):
+            end -= 1
+        last_line = mapped[mapped.rfind(b"\n", 0, end) + 1:end].decode("utf-8")
+
+    if fmt == "csv":
+        header = next(iter_lines(path, use_mmap=False))
+        record = next(csv.DictReader([header, last_line]))
+    else:
+        record = json.loads(last_line)
+    return first.time, parse_time(_field(record, "time"))
+
+
+def load_trace_buckets(path, steps, start=None, end=None, fmt=None, use_mmap=None):
+    """Window and downsample a trace file into steps buckets without holding it in memory"""
+    if start is None or end is None:
+        first, last = trace_time_range(path, fmt)
+        start = first if start is None else start
+        end = last + max((last - start) * 1e-9, 1e-9) if end is None else end
+    return bucket_events(iter_trace(path, fmt, use_mmap), steps, start, end)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Summarise a queue trace file as per-cycle buckets")
+    parser.add_argument("path")
+    parser.add_argument("--steps", type=int, default=8)
+    parser.add_argument("--start", type=float, default=None)
+    parser.add_argument("--end", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    initial_depth, buckets = load_trace_buckets(args.path, args.steps, args.start, args.end)
+    print(f"Depth at window start: {initial_depth}")
+    for bucket in buckets:
+        print(f"{bucket.start:14.3f} - {bucket.end:14.3f}  +{bucket.enqueued:<8} -{bucket.dequeued:<8} "
+              f"blocked {bucket.blocked_puts}/{bucket.blocked_gets}  depth {bucket.depth}")
+
+
+if __name__ == "__main__":
+    main()